@@ -0,0 +1,150 @@
+"""
+Parse a corpus of bash commands across a pool of worker processes.
+
+parse_commands returns one ParseResult per input command, in input order.
+Only the requested products are computed by the workers (and sent back to the
+calling process):
+    'ast': the AST returned by data_tools.bash_parser,
+    'tokens': data_tools.bash_tokenizer tokens,
+    'template': data_tools.cmd2template template,
+    'utilities': data_tools.get_utilities utilities.
+The error message of bashlint is reported for every command it fails to
+normalize, whatever the products requested. A product which cannot be
+computed is set to an empty value (see EMPTY_PRODUCTS) and its error is
+reported as well.
+
+Usage:
+    python -m bashlint.batch_parser input_file [num_workers]
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import contextlib
+import functools
+import io
+import multiprocessing
+import os
+import sys
+
+from bashlint import data_tools, lint
+
+PRODUCTS = ('ast', 'tokens', 'template', 'utilities')
+# values of the products which could not be computed
+EMPTY_PRODUCTS = {'ast': None, 'tokens': [], 'template': '', 'utilities': set()}
+
+
+class ParseResult(object):
+    def __init__(self, cmd):
+        self.cmd = cmd
+        self.ast = None
+        self.tokens = None
+        self.template = None
+        self.utilities = None
+        self.error = None
+
+
+def parse_command(cmd, products=('ast',), recover_quotation=True,
+                  tokenizer_args=None, template_args=None):
+    """
+    Parse a single command and compute the requested products.
+    """
+    result = ParseResult(cmd)
+    errors = []
+    try:
+        # the error messages of lint.normalize_ast are only printed in
+        # verbose mode
+        log = io.StringIO()
+        with contextlib.redirect_stdout(log):
+            tree = lint.normalize_ast(cmd, recover_quotation, verbose=True)
+        if tree is None:
+            errors.append(log.getvalue().strip() or 'Empty command')
+    except Exception as e:
+        tree = None
+        errors.append('{}: {}'.format(type(e).__name__, e))
+
+    template_args = template_args or {}
+    product_funs = {
+        'ast': lambda: tree if tree is not None \
+            else data_tools.paren_parser(cmd),
+        'tokens': lambda: data_tools.bash_tokenizer(
+            tree, **(tokenizer_args or {})),
+        'template': lambda: data_tools.ast2template(
+            tree,
+            loose_constraints=template_args.get('loose_constraints', False),
+            arg_type_only=template_args.get('arg_type_only', True)),
+        'utilities': lambda: data_tools.get_utilities(tree)
+    }
+    for product in products:
+        # a product which fails does not affect the others
+        try:
+            value = product_funs[product]()
+        except Exception as e:
+            value = EMPTY_PRODUCTS[product]
+            errors.append('{} ({}): {}'.format(type(e).__name__, product, e))
+        setattr(result, product, value)
+    if errors:
+        result.error = '; '.join(errors)
+    return result
+
+
+def parse_commands(cmds, products=('ast',), num_workers=None, chunk_size=64,
+                   recover_quotation=True, tokenizer_args=None,
+                   template_args=None):
+    """
+    Parse a list of commands in parallel.
+
+    :param cmds: Iterable of bash commands.
+    :param products: Products to compute for each command (see PRODUCTS).
+    :param num_workers: Number of worker processes (defaults to the number of
+        CPUs). If set to 1, the commands are parsed in the calling process.
+    :param chunk_size: Number of commands sent to a worker at a time.
+    :param recover_quotation: If set, retain quotation marks in the command.
+    :param tokenizer_args: Keyword arguments of data_tools.bash_tokenizer used
+        to compute the 'tokens' product.
+    :param template_args: Keyword arguments of data_tools.cmd2template
+        (loose_constraints, arg_type_only) used to compute the 'template'
+        product.
+    :return: List of ParseResult in input order.
+    """
+    for product in products:
+        if not product in PRODUCTS:
+            raise ValueError('Unrecognized parse product: {}'.format(product))
+    parse_fun = functools.partial(
+        parse_command, products=tuple(products),
+        recover_quotation=recover_quotation, tokenizer_args=tokenizer_args,
+        template_args=template_args)
+
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    if num_workers <= 1:
+        return [parse_fun(cmd) for cmd in cmds]
+    pool = multiprocessing.Pool(num_workers)
+    try:
+        return list(pool.imap(parse_fun, cmds, chunksize=chunk_size))
+    finally:
+        pool.close()
+        pool.join()
+
+
+def parse_file(input_file, products=('ast',), num_workers=None, **kwargs):
+    """
+    Parse a file each line of which is a bash command.
+    """
+    with open(input_file, encoding='utf-8') as f:
+        cmds = [cmd.strip() for cmd in f]
+    return parse_commands(cmds, products, num_workers, **kwargs)
+
+
+if __name__ == '__main__':
+    input_file = sys.argv[1]
+    num_workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    results = parse_file(input_file, products=('template',),
+                         num_workers=num_workers)
+    num_errors = 0
+    for i, result in enumerate(results):
+        if result.error:
+            num_errors += 1
+            print('{}. {}\n    {}'.format(i, result.cmd, result.error))
+    print('{} commands parsed, {} errors'.format(len(results), num_errors))
@@ -578,7 +578,8 @@ def parsesingle(s, strictmode=True, expansionlimit=None, convertpos=False):
         bast.posconverter(s).visit(tree)
     return tree
 
-def parse(s, strictmode=True, expansionlimit=None, convertpos=False):
+def parse(s, strictmode=True, expansionlimit=None, convertpos=False,
+          offsets=True):
     '''parse the input string, returning a list of nodes
     top level node kinds are:
     - command - a simple command
@@ -591,6 +592,10 @@ def parse(s, strictmode=True, expansionlimit=None, convertpos=False):
     - skip reading a heredoc if we're at the end of the input
     expansionlimit is used to limit the amount of recursive parsing done due to
     command substitutions found during word expansion.
+    when offsets is set, the top level nodes after the first one are parsed by
+    resuming the tokenizer of the whole input at their offsets. otherwise
+    each of them is parsed from a copy of the rest of the input, which is
+    quadratic in the length of the input.
     '''
     p = _parser(s, strictmode=strictmode, expansionlimit=expansionlimit)
     parts = [p.parse()]
@@ -606,12 +611,19 @@ def parse(s, strictmode=True, expansionlimit=None, convertpos=False):
     ef.visit(parts[-1])
     index = max(parts[-1].pos[1], ef.end) + 1
     while index < len(s):
-        part = _parser(s[index:], strictmode=strictmode).parse()
+        if offsets:
+            # the following parts are parsed without expansion limit, as
+            # if by a new parser
+            p.resume(index)
+            part = p.parse()
+        else:
+            part = _parser(s[index:], strictmode=strictmode).parse()
 
         if not isinstance(part, bast.node):
             break
 
-        bast.posshifter(index).visit(part)
+        if not offsets:
+            bast.posshifter(index).visit(part)
         parts.append(part)
         ef = _endfinder()
         ef.visit(parts[-1])
@@ -668,15 +680,36 @@ class _parser(object):
 
         self.redirstack = self.tok.redirstack
 
+    def resume(self, index):
+        '''parse the input from index on with the state of a new parser'''
+        self._expansionlimit = None
+        self.parserstate = state.parserstate()
+        self.tok.resume(index, self.parserstate)
+        self.redirstack = self.tok.redirstack
+
     def parse(self):
         # yacc.yacc returns a parser object that is not reentrant, it has
-        # some mutable state. we make a shallow copy of it so no
-        # state spills over to the next call to parse on it
-        theparser = copy.copy(yaccparser)
-        tree = theparser.parse(lexer=self.tok, context=self)
+        # some mutable state. we take a shallow copy of it that is not used
+        # by any other parse so no state spills over between parses
+        theparser = _acquireyaccparser()
+        try:
+            tree = theparser.parse(lexer=self.tok, context=self)
+        finally:
+            _yaccparserpool.append(theparser)
 
         return tree
 
+# shallow copies of yaccparser that are not in use by a parse. nested parses
+# (e.g. of command substitutions) and parses in other threads take different
+# copies
+_yaccparserpool = []
+
+def _acquireyaccparser():
+    try:
+        return _yaccparserpool.pop()
+    except IndexError:
+        return copy.copy(yaccparser)
+
 class _endfinder(bast.nodevisitor):
     '''helper class to find the "real" end pos of a node that contains
     a heredoc. this is a hack because heredoc aren't really part of any node
@@ -686,3 +719,51 @@ class _endfinder(bast.nodevisitor):
         self.end = -1
     def visitheredoc(self, node, value):
         self.end = node.pos[1]
+
+
+def test_multi_statement_parsing(input_file, script_sizes=(250, 500, 1000, 2000),
+                                 seed=0):
+    """
+    Parse scripts made of random lines of input_file with and without offset
+    based parsing, check that the results are identical and report the time
+    per line for each script size.
+    """
+    import random
+    import time
+
+    with open(input_file) as f:
+        cmds = [cmd.strip() for cmd in f]
+
+    def parse_script(s, offsets):
+        try:
+            return parse(s, offsets=offsets)
+        except Exception:
+            return None
+
+    # commands that are a single top level part, even when followed by
+    # other lines
+    lines = []
+    for cmd in cmds:
+        parts = parse_script(cmd + '\n' + cmd, True)
+        if parts is not None and len(parts) == 2:
+            lines.append(cmd)
+
+    rand = random.Random(seed)
+    for script_size in script_sizes:
+        script = '\n'.join(rand.choice(lines) for _ in range(script_size))
+        results = []
+        for offsets in [False, True]:
+            start_time = time.time()
+            parts = parse_script(script, offsets)
+            parse_time = time.time() - start_time
+            results.append([part.dump() for part in parts])
+            print('{} lines, offsets {}: {:.3f}s, {:.3f}ms per line'.format(
+                script_size, 'on' if offsets else 'off', parse_time,
+                parse_time * 1000 / script_size))
+        assert(len(results[0]) == script_size)
+        assert(results[0] == results[1])
+
+
+if __name__ == '__main__':
+    import sys
+    test_multi_statement_parsing(sys.argv[1])
@@ -7,15 +7,21 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import collections
+import os
 import sys
 
 if sys.version_info > (3, 0):
     from six.moves import xrange
 
 from bashlint import bash, lint, nast
+from bashlint.parse_cache import ParseCache
 
 flag_suffix = '<FLAG_SUFFIX>'
 
+# normalized ASTs of recently parsed commands (see set_parse_cache)
+parse_cache = ParseCache(capacity=20000)
+
 
 def correct_errors_and_normalize_surface(cm):
     return lint.correct_errors_and_normalize_surface(cm)
@@ -50,7 +56,7 @@ def bash_tokenizer(cmd, recover_quotation=True, loose_constraints=False,
     Tokenize a bash command.
     """
     if isinstance(cmd, str):
-        tree = lint.normalize_ast(cmd, recover_quotation, verbose=verbose)
+        tree = normalize_ast(cmd, recover_quotation, verbose=verbose)
     else:
         tree = cmd
     return ast2tokens(tree, loose_constraints, ignore_flag_order,
@@ -58,11 +64,44 @@ def bash_tokenizer(cmd, recover_quotation=True, loose_constraints=False,
                       with_prefix=with_prefix, with_flag_argtype=with_flag_argtype)
 
 
+def set_parse_cache(capacity, path=None):
+    """
+    Replace the parse cache used by bash_parser, bash_tokenizer and
+    cmd2template.
+
+    :param capacity: Maximum number of cached ASTs (0 disables the cache).
+    :param path: If set and exists, the cache is loaded from this file.
+    """
+    global parse_cache
+    if capacity <= 0:
+        parse_cache = None
+        return None
+    parse_cache = ParseCache(capacity, path)
+    if path and os.path.exists(path):
+        parse_cache.load()
+    return parse_cache
+
+
+def get_parse_cache():
+    return parse_cache
+
+
+def normalize_ast(cmd, recover_quotation=True, verbose=False):
+    """
+    lint.normalize_ast with results looked up in the parse cache. The
+    returned tree is never shared with other callers.
+    """
+    if parse_cache is None:
+        return lint.normalize_ast(cmd, recover_quotation, verbose=verbose)
+    return parse_cache.parse(lint.normalize_ast, cmd, recover_quotation,
+                             verbose=verbose)
+
+
 def bash_parser(cmd, recover_quotation=True, verbose=False):
     """
     Parse bash command into AST.
     """
-    ast = lint.normalize_ast(cmd, recover_quotation, verbose=verbose)
+    ast = normalize_ast(cmd, recover_quotation, verbose=verbose)
     if ast is None:
         return paren_parser(cmd)
     else:
@@ -95,35 +134,35 @@ def ast2tokens(node, loose_constraints=False, ignore_flag_order=False,
         return []
 
     lc = loose_constraints
+    tokens = []
 
     def to_tokens_fun(node):
-        tokens = []
         if node.is_root():
             assert(loose_constraints or node.get_num_of_children() == 1)
             if lc:
                 for child in node.children:
-                    tokens += to_tokens_fun(child)
+                    to_tokens_fun(child)
             else:
-                tokens = to_tokens_fun(node.children[0])
+                to_tokens_fun(node.children[0])
         elif node.kind == "pipeline":
             assert(loose_constraints or node.get_num_of_children() > 1)
             if lc and node.get_num_of_children() < 1:
                 tokens.append("|")
             elif lc and node.get_num_of_children() == 1:
                 # treat "singleton-pipe" as atomic command
-                tokens += to_tokens_fun(node.children[0])
+                to_tokens_fun(node.children[0])
             else:
                 for child in node.children[:-1]:
-                    tokens += to_tokens_fun(child)
+                    to_tokens_fun(child)
                     tokens.append("|")
-                tokens += to_tokens_fun(node.children[-1])
+                to_tokens_fun(node.children[-1])
         elif node.kind == "commandsubstitution":
             assert(loose_constraints or node.get_num_of_children() == 1)
             if lc and node.get_num_of_children() < 1:
-                tokens += ["$(", ")"]
+                tokens.extend(["$(", ")"])
             else:
                 tokens.append("$(")
-                tokens += to_tokens_fun(node.children[0])
+                to_tokens_fun(node.children[0])
                 tokens.append(")")
         elif node.kind == "processsubstitution":
             assert(loose_constraints or node.get_num_of_children() == 1)
@@ -132,7 +171,7 @@ def ast2tokens(node, loose_constraints=False, ignore_flag_order=False,
                 tokens.append(")")
             else:
                 tokens.append(node.value + "(")
-                tokens += to_tokens_fun(node.children[0])
+                to_tokens_fun(node.children[0])
                 tokens.append(")")
         elif node.is_utility():
             token = node.value
@@ -142,7 +181,7 @@ def ast2tokens(node, loose_constraints=False, ignore_flag_order=False,
             children = sorted(node.children, key=lambda x:x.value) \
                 if ignore_flag_order else node.children
             for child in children:
-                tokens += to_tokens_fun(child)
+                to_tokens_fun(child)
         elif node.is_option():
             assert(loose_constraints or node.parent)
             if '::' in node.value and (node.value.startswith('-exec') or 
@@ -169,7 +208,7 @@ def ast2tokens(node, loose_constraints=False, ignore_flag_order=False,
                 token = token + flag_suffix + suffix
             tokens.append(token)
             for child in node.children:
-                tokens += to_tokens_fun(child)
+                to_tokens_fun(child)
             if '::' in node.value and (node.value.startswith('-exec') or
                                        node.value.startswith('-ok')):
                 if op == ';':
@@ -181,9 +220,9 @@ def ast2tokens(node, loose_constraints=False, ignore_flag_order=False,
             assert(loose_constraints or node.get_num_of_children() == 0)
             if lc and node.get_num_of_children() > 0:
                 for child in node.children[:-1]:
-                    tokens += to_tokens_fun(child)
+                    to_tokens_fun(child)
                     tokens.append(node.value)
-                tokens += to_tokens_fun(node.children[-1])
+                to_tokens_fun(node.children[-1])
             else:
                 tokens.append(node.value)
         elif node.kind == "unarylogicop":
@@ -191,9 +230,9 @@ def ast2tokens(node, loose_constraints=False, ignore_flag_order=False,
             if lc and node.get_num_of_children() > 0:
                 if node.associate == nast.UnaryLogicOpNode.RIGHT:
                     tokens.append(node.value)
-                    tokens += to_tokens_fun(node.children[0])
+                    to_tokens_fun(node.children[0])
                 else:
-                    tokens += to_tokens_fun(node.children[0])
+                    to_tokens_fun(node.children[0])
                     tokens.append(node.value)
             else:
                 tokens.append(node.value)
@@ -201,18 +240,18 @@ def ast2tokens(node, loose_constraints=False, ignore_flag_order=False,
             assert(loose_constraints or node.get_num_of_children() >= 1)
             if lc and node.get_num_of_children() < 2:
                 for child in node.children:
-                    tokens += to_tokens_fun(child)
+                    to_tokens_fun(child)
             else:
                 tokens.append("\\(")
                 for i in xrange(len(node.children)-1):
-                    tokens += to_tokens_fun(node.children[i])
-                tokens += to_tokens_fun(node.children[-1])
+                    to_tokens_fun(node.children[i])
+                to_tokens_fun(node.children[-1])
                 tokens.append("\\)")
         elif node.kind == "nt":
             assert(loose_constraints or node.get_num_of_children() > 0)
             tokens.append("(")
             for child in node.children:
-                tokens += to_tokens_fun(child)
+                to_tokens_fun(child)
             tokens.append(")")
         elif node.is_argument() or node.kind in ["t"]:
             assert(loose_constraints or node.get_num_of_children() == 0)
@@ -244,10 +283,10 @@ def ast2tokens(node, loose_constraints=False, ignore_flag_order=False,
             tokens.append(token)
             if lc:
                 for child in node.children:
-                    tokens += to_tokens_fun(child)
-        return tokens
+                    to_tokens_fun(child)
 
-    return to_tokens_fun(node)
+    to_tokens_fun(node)
+    return tokens
 
 
 def ast2command(node, loose_constraints=False, ignore_flag_order=False):
@@ -274,11 +313,258 @@ def cmd2template(cmd, recover_quotation=True, arg_type_only=True,
     Convert a bash command to a template that contains only reserved words
     and argument types flags are alphabetically ordered.
     """
-    tree = lint.normalize_ast(cmd, recover_quotation, verbose=verbose)
+    tree = normalize_ast(cmd, recover_quotation, verbose=verbose)
     return ast2template(tree, loose_constraints=loose_constraints, 
                         arg_type_only=arg_type_only)
 
 
+class Linearization(object):
+    """
+    Linearizations of a bash AST used by the evaluation metrics, all obtained
+    with loose constraints and in the original flag order.
+
+    :member tokens: ast2tokens tokens.
+    :member template_tokens: ast2tokens tokens with argument types.
+    :member string: ast2template string with argument values.
+    :member template: ast2template template.
+    :member command: ast2command command.
+    :member content_tokens: Counts of the reserved words of the
+        command (see eval.token_based.get_content_tokens).
+    :member utilities: Set of utilities (see get_utilities).
+    :member sorted_templates: Templates with alphabetically ordered flags,
+        computed on demand by canonical_template.
+    """
+    __slots__ = ('tokens', 'template_tokens', 'string', 'template',
+                 'command', 'content_tokens', 'utilities', 'sorted_templates')
+
+    def __init__(self, tokens, template_tokens, command, content_tokens,
+                 utilities):
+        self.tokens = tokens
+        self.template_tokens = template_tokens
+        self.string = ' '.join(tokens)
+        self.template = ' '.join(template_tokens)
+        self.command = command
+        self.content_tokens = content_tokens
+        self.utilities = utilities
+        self.sorted_templates = {}
+
+
+def linearize(ast):
+    """
+    Compute all linearizations of a bash AST in a single traversal.
+
+    The result is memoized on the AST node, hence the AST must not be modified
+    after it is linearized.
+    """
+    if not ast:
+        return Linearization([], [], '', collections.defaultdict(int), set())
+    try:
+        return ast.linearization
+    except AttributeError:
+        ast.linearization = _linearize(ast)
+        return ast.linearization
+
+
+def canonical_template(ast, ignore_arg_value=False, ignore_flag_order=False):
+    """
+    Canonical form of a bash AST compared by the template and command match
+    metrics, memoized with the linearizations of the AST.
+
+    :param ignore_arg_value: If set, replace argument values with their types.
+    :param ignore_flag_order: If set, output flags in alphabetical order.
+    """
+    linearization = linearize(ast)
+    if not ignore_flag_order:
+        return linearization.template if ignore_arg_value \
+            else linearization.string
+    if not ignore_arg_value in linearization.sorted_templates:
+        linearization.sorted_templates[ignore_arg_value] = ast2template(
+            ast, loose_constraints=True, ignore_flag_order=True,
+            arg_type_only=ignore_arg_value)
+    return linearization.sorted_templates[ignore_arg_value]
+
+
+def _linearize(ast):
+    tokens = []
+    template_tokens = []
+    content_tokens = collections.defaultdict(int)
+    utilities = set()
+
+    def add_content_token(compound_token):
+        kind_token = compound_token.split(nast.KIND_PREFIX)
+        if len(kind_token) == 2:
+            kind, token = kind_token
+        else:
+            kind = ''
+            token = kind_token[0]
+        if kind.lower() != 'argument':
+            content_tokens[token] += 1
+
+    def add_token(token):
+        tokens.append(token)
+        template_tokens.append(token)
+        add_content_token(token)
+
+    def skip(node):
+        # subtrees ignored by the tokenizer may still contain utilities
+        utilities.update(get_utilities(node))
+
+    def to_command_fun(node, in_argument=False):
+        # tokens are appended as a side effect, in the order of ast2tokens
+        if node.is_root():
+            return ''.join([to_command_fun(child, in_argument)
+                            for child in node.children])
+        elif node.kind == 'pipeline':
+            if node.get_num_of_children() < 1:
+                add_token('|')
+                return ''
+            elif node.get_num_of_children() == 1:
+                return to_command_fun(node.children[0], in_argument)
+            else:
+                commands = []
+                for child in node.children[:-1]:
+                    commands.append(to_command_fun(child, in_argument))
+                    add_token('|')
+                commands.append(to_command_fun(node.children[-1],
+                                               in_argument))
+                return ' | '.join(commands)
+        elif node.kind in ['commandsubstitution', 'processsubstitution']:
+            head = '$(' if node.kind == 'commandsubstitution' \
+                else node.value + '('
+            add_token(head)
+            if node.get_num_of_children() < 1:
+                add_token(')')
+                return ''
+            command = to_command_fun(node.children[0], in_argument)
+            add_token(')')
+            for child in node.children[1:]:
+                skip(child)
+            return head + command + ')'
+        elif node.is_utility():
+            if not in_argument:
+                utilities.add(node.value)
+            tokens.append(node.value)
+            template_tokens.append(node.value)
+            add_content_token(node.prefix + node.value)
+            commands = [node.value]
+            for child in node.children:
+                commands.append(to_command_fun(child, in_argument))
+            return ' '.join(commands).strip()
+        elif node.is_option():
+            if '::' in node.value:
+                value, op = node.value.split('::')
+                commands = [value, ' ']
+            else:
+                value = node.value
+                arg_connector = '=' if (node.is_long_option() and
+                                        node.children) else ' '
+                commands = [value, arg_connector]
+            exec_op = '::' in node.value and (node.value.startswith('-exec') or
+                                              node.value.startswith('-ok'))
+            token = value if exec_op else node.value
+            suffix = []
+            for child in node.children:
+                if child.is_argument():
+                    suffix.append(child.arg_type)
+                elif child.is_utility():
+                    suffix.append('UTILITY')
+            tokens.append(token)
+            template_tokens.append(token)
+            add_content_token(
+                node.prefix + token + flag_suffix + ''.join(suffix))
+            for child in node.children:
+                commands.append(to_command_fun(child, in_argument))
+                commands.append(' ')
+            if '::' in node.value:
+                if op == ';':
+                    op = "\\;"
+                commands.append(op)
+                if exec_op:
+                    add_token(op)
+            return ''.join(commands).strip()
+        elif node.kind == 'operator':
+            add_token(node.value)
+            return '--'
+        elif node.kind == 'binarylogicop':
+            if node.get_num_of_children() > 0:
+                commands = []
+                for child in node.children[:-1]:
+                    commands.append(to_command_fun(child, in_argument))
+                    add_token(node.value)
+                commands.append(to_command_fun(node.children[-1],
+                                               in_argument))
+                return ' {} '.format(node.value).join(commands).strip()
+            else:
+                add_token(node.value)
+                return node.value
+        elif node.kind == 'unarylogicop':
+            if node.get_num_of_children() > 0:
+                if node.associate == nast.UnaryLogicOpNode.RIGHT:
+                    add_token(node.value)
+                    command = '{} {}'.format(
+                        node.value, to_command_fun(node.children[0],
+                                                   in_argument))
+                else:
+                    command = '{} {}'.format(
+                        to_command_fun(node.children[0], in_argument),
+                        node.value)
+                    add_token(node.value)
+                for child in node.children[1:]:
+                    skip(child)
+                return command
+            else:
+                add_token(node.value)
+                return node.value
+        elif node.kind == 'bracket':
+            if node.get_num_of_children() < 2:
+                return ''.join([to_command_fun(child, in_argument)
+                                for child in node.children])
+            else:
+                add_token('\\(')
+                commands = ['\\( ']
+                for child in node.children:
+                    commands.append(to_command_fun(child, in_argument))
+                    commands.append(' ')
+                add_token('\\)')
+                commands.append('\\)')
+                return ''.join(commands)
+        elif node.kind == 'nt':
+            add_token('(')
+            for child in node.children:
+                to_command_fun(child, in_argument)
+            add_token(')')
+            return ''
+        elif node.is_argument() or node.kind == 't':
+            if node.is_open_vocab():
+                if node.arg_type in bash.quantity_argument_types:
+                    if node.value.startswith('+'):
+                        template_token = '+{}'.format(node.arg_type)
+                    elif node.value.startswith('-'):
+                        template_token = '-{}'.format(node.arg_type)
+                    else:
+                        template_token = node.arg_type
+                else:
+                    template_token = node.arg_type
+            else:
+                template_token = node.value
+            tokens.append(node.value)
+            template_tokens.append(template_token)
+            add_content_token(node.prefix + template_token)
+            commands = [node.value] if node.is_argument() else []
+            for child in node.children:
+                commands.append(to_command_fun(
+                    child, in_argument or node.is_argument()))
+            return ''.join(commands) if node.is_argument() else ''
+        else:
+            for child in node.children:
+                skip(child)
+            return ''
+
+    command = to_command_fun(ast)
+    return Linearization(tokens, template_tokens, command, content_tokens,
+                         utilities)
+
+
 def pretty_print(node, depth=0):
     """
     Pretty print the AST.
@@ -377,17 +663,15 @@ def paren_parser(line):
 
 # --- Test functions --- #
 
-def batch_parse(input_file):
+def batch_parse(input_file, num_workers=None):
     """
     Parse the input_file each line of which is a bash command.
     """
-    with open(input_file) as f:
-        i = 0
-        for cmd in f:
-            print("{}. {}".format(i, cmd))
-            ast = bash_parser(cmd)
-            pretty_print(ast)
-            i += 1
+    from bashlint import batch_parser
+    results = batch_parser.parse_file(input_file, num_workers=num_workers)
+    for i, result in enumerate(results):
+        print("{}. {}".format(i, result.cmd))
+        pretty_print(result.ast)
 
 def test_bash_parser():
     while True:
@@ -415,6 +699,80 @@ def test_bash_parser():
             break
 
 
+def test_concurrent_parsing(input_file, num_threads=16, num_rounds=2):
+    """
+    Parse the commands in input_file from multiple threads and check that the
+    results are identical to those of serial parsing.
+    """
+    import random
+    import threading
+
+    def dump_ast(node):
+        if node is None:
+            return None
+        out = []
+        def dump_ast_fun(node, depth):
+            out.append((depth, node.kind, node.value,
+                        getattr(node, 'arg_type', None),
+                        getattr(node, 'index', None)))
+            for child in node.children:
+                dump_ast_fun(child, depth + 1)
+        dump_ast_fun(node, 0)
+        return out
+
+    with open(input_file) as f:
+        cmds = [cmd.strip() for cmd in f]
+    serial_results = [dump_ast(lint.normalize_ast(cmd)) for cmd in cmds]
+
+    order = list(xrange(len(cmds))) * num_rounds
+    random.Random(0).shuffle(order)
+    mismatches = []
+    def parse_fun(thread_id):
+        for i in order[thread_id::num_threads]:
+            if dump_ast(lint.normalize_ast(cmds[i])) != serial_results[i]:
+                mismatches.append(i)
+
+    threads = [threading.Thread(target=parse_fun, args=(thread_id,))
+               for thread_id in xrange(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for i in sorted(set(mismatches)):
+        print('Mismatch: {}'.format(cmds[i]))
+    print('{} commands parsed by {} threads, {} mismatches'.format(
+        len(cmds) * num_rounds, num_threads, len(mismatches)))
+    assert(not mismatches)
+
+
+def test_linearize(input_file):
+    """
+    Check that the linearizations of the ASTs of the commands in input_file
+    are identical to those computed by the separate conversion functions.
+    """
+    with open(input_file) as f:
+        cmds = [cmd.strip() for cmd in f]
+
+    num_mismatches = 0
+    for cmd in cmds:
+        ast = bash_parser(cmd)
+        linearization = linearize(ast)
+        if linearization.tokens != ast2tokens(ast, loose_constraints=True) \
+            or linearization.template != ast2template(
+                ast, loose_constraints=True) \
+            or linearization.string != ast2template(
+                ast, loose_constraints=True, arg_type_only=False) \
+            or linearization.command != ast2command(
+                ast, loose_constraints=True) \
+            or linearization.utilities != get_utilities(ast):
+            num_mismatches += 1
+            print('Mismatch: {}'.format(cmd))
+    print('{} commands linearized, {} mismatches'.format(
+        len(cmds), num_mismatches))
+    assert(num_mismatches == 0)
+
+
 def test_bash_tokenizer():
 
     def test(cmd):
@@ -434,4 +792,6 @@ if __name__ == "__main__":
     # input_file = sys.argv[1]
     # batch_parse(input_file)
     # test_bash_parser()
+    # test_concurrent_parsing(input_file)
+    # test_linearize(input_file)
     test_bash_tokenizer()
@@ -4,16 +4,31 @@
 """
 Consume tokens in a bash command and update the set of possible next states for
 the parser.
+
+The grammar built from the man-page synopses is compiled to a file which
+stores the state graph of each utility separately (see compile_grammar); the
+state graph of a utility is only loaded when it is first looked up.
+
+Usage (compile the grammar):
+    python -m bashlint.grammar [grammar_file]
 """
 
 from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import hashlib
 import os, sys
+import pickle
+import threading
 if sys.version_info > (3, 0):
     from six.moves import xrange
 
+GRAMMAR_FILE = os.path.join(os.path.dirname(__file__), 'grammar', 'grammar100.txt')
+# Increase if the format of the compiled grammar changes (changes of this
+# module are detected by grammar_signature).
+COMPILED_GRAMMAR_VERSION = 1
+
 UTIL_S = 0
 COMPOUND_FLAG_S = 1
 FLAG_S = 2
@@ -64,7 +79,6 @@ class UtilityState(BashGrammarState):
         self.compound_flag = CompoundFlagState(self)
         self.positional_arguments = []
         self.eof = EOFState()
-        self.argument_only = False
 
     def add_flag(self, flag):
         self.compound_flag.add_flag(flag)
@@ -73,13 +87,17 @@ class UtilityState(BashGrammarState):
         self.positional_arguments.append(arg)
         arg.parent = self
 
-    def next_states(self):
-        if self.argument_only:
+    def next_states(self, filled_states=(), argument_only=False):
+        """
+        :param filled_states: Argument states that have been filled.
+        :param argument_only: If set, no more flags are accepted (after '--').
+        """
+        if argument_only:
             next_states = []
         else:
             next_states = [self.compound_flag]
         for arg_state in self.positional_arguments:
-            if not arg_state.filled or (arg_state.is_list
+            if not arg_state in filled_states or (arg_state.is_list
                     and arg_state.list_separator == ' '):
                 next_states.append(arg_state)
         next_states.append(self.eof)
@@ -150,7 +168,6 @@ class ArgumentState(BashGrammarState):
             the argument.
         :member no_space: No space between the argument and the flag it is
             attached to.
-        :member filled: If set, at least
         :member parent: Parent state.
         :member rsb: Right sibling state.
         """
@@ -162,7 +179,6 @@ class ArgumentState(BashGrammarState):
         self.list_separator = list_separator
         self.regex_format = regex_format
         self.no_space = no_space
-        self.filled = False
         self.parent = None
         self.rsb = None
 
@@ -184,7 +200,6 @@ class ArgCommandState(BashGrammarState):
     def __init__(self):
         super(ArgCommandState, self).__init__(ARG_COMMAND_S)
         self.no_space = False
-        self.filled = False
         self.parent = None
         self.rsb = None
 
@@ -197,7 +212,6 @@ class ExecCommandState(BashGrammarState):
         super(ExecCommandState, self).__init__(EXEC_COMMAND_S)
         self.stop_tokens = stop_tokens
         self.no_space = False
-        self.filled = False
         self.parent = None
         self.rsb = None
 
@@ -208,7 +222,6 @@ class ExecCommandState(BashGrammarState):
 class CommandState(BashGrammarState):
     def __init__(self):
         super(CommandState, self).__init__(COMMAND_S)
-        self.filled = False
         self.parent = None
         self.rsb = None
 
@@ -222,10 +235,34 @@ class EOFState(BashGrammarState):
 
 
 class BashGrammar(object):
+    """
+    The utility grammar and a cursor over it.
+
+    The states in self.grammar are never modified by parsing: all state of
+    the cursor (the next states and the states filled so far) lives in the
+    BashGrammar object, so cursors created by new_cursor can walk the same
+    grammar concurrently.
+    """
     def __init__(self):
         self.name2type = {}
         self.grammar = {}
         self.next_states = None     # pointer on the current position in the grammar tree
+        self.filled_states = set()  # argument states filled by the command
+        self.argument_only = set()  # utility states after '--'
+
+    def new_cursor(self):
+        """
+        Create a BashGrammar positioned at the start of a command which
+        shares the grammar of this one.
+        """
+        cursor = BashGrammar()
+        cursor.name2type = self.name2type
+        cursor.grammar = self.grammar
+        return cursor
+
+    def utility_next_states(self, utility_state):
+        return utility_state.next_states(
+            self.filled_states, utility_state in self.argument_only)
 
     def allow_eof(self):
         for state in self.next_states:
@@ -241,7 +278,9 @@ class BashGrammar(object):
     def consume(self, token):
         if token in self.grammar:
             utility_state = self.grammar[token]
-            self.next_states = utility_state.next_states()
+            self.filled_states = set()
+            self.argument_only = set()
+            self.next_states = self.utility_next_states(utility_state)
             return True
         else:
             return False
@@ -271,7 +310,7 @@ class BashGrammar(object):
                             raise ValueError('Unexpected flag argument "{}"'.format(token))
                 else:
                     if flag_token == '--':
-                        state.parent.argument_only = True
+                        self.argument_only.add(state.parent)
                     else:
                         raise ValueError('Unrecognized long flag "{}"'.format(flag_token))
             elif token in state.flag_index:
@@ -330,23 +369,23 @@ class BashGrammar(object):
                         # Case 5: the token does not match any flag state
                         return None
         elif state_type == COMMAND_S:
-            self.next_states = state.get_utility().next_states()
+            self.next_states = self.utility_next_states(state.get_utility())
         elif state_type == ARG_COMMAND_S:
-            self.next_states = state.get_utility().next_states()
+            self.next_states = self.utility_next_states(state.get_utility())
         elif state_type == EXEC_COMMAND_S:
-            self.next_states = state.get_utility().next_states()
+            self.next_states = self.utility_next_states(state.get_utility())
         elif state_type == OPERATOR_S:
             for i, next_state in enumerate(self.next_states):
                 if next_state.is_compound_flag():
                     del(self.next_states[i])
         elif state.type == ARG_S:
-            state.filled = True
+            self.filled_states.add(state)
             if state.rsb:
                 # continue interpreting the next argument of the same parent state
                 self.next_states = [state.rsb]
                 return '__SAME_PARENT__'
             else:
-                self.next_states = state.get_utility().next_states()
+                self.next_states = self.utility_next_states(state.get_utility())
                 return '__PARENT_CHANGE__'
 
     def make_grammar(self, input_file):
@@ -389,6 +428,28 @@ class BashGrammar(object):
             elif reading_synopsis:
                 self.make_utility(line)
 
+    def load_grammar(self, input_file):
+        """
+        Load the compiled grammar of input_file. The grammar is compiled if
+        the compiled file is missing or out of date.
+        """
+        path = compiled_grammar_path(input_file)
+        signature = grammar_signature(input_file)
+        compiled = None
+        if os.path.exists(path):
+            try:
+                with open(path, 'rb') as f:
+                    compiled = pickle.load(f)
+            except Exception:
+                # corrupted file, compile again
+                compiled = None
+            if not isinstance(compiled, tuple) or compiled[0] != signature:
+                compiled = None
+        if compiled is None:
+            compiled = compile_grammar(input_file, path)
+        _, self.name2type, pickled_states = compiled
+        self.grammar = LazyUtilityGrammar(pickled_states)
+
         print('Bashlint grammar set up ({} utilities)'.format(len(self.grammar)))
         print()
 
@@ -681,5 +742,104 @@ class BashGrammar(object):
         return flag
 
 
+class LazyUtilityGrammar(object):
+    """
+    Read-only mapping from utility names to UtilityStates. The state graph of
+    a utility is unpickled from the compiled grammar on first access.
+    """
+    def __init__(self, pickled_states):
+        self.pickled_states = pickled_states
+        self.states = {}
+        self.lock = threading.Lock()
+
+    def __contains__(self, utility):
+        return utility in self.pickled_states
+
+    def __len__(self):
+        return len(self.pickled_states)
+
+    def __iter__(self):
+        return iter(self.pickled_states)
+
+    def __getitem__(self, utility):
+        u_state = self.states.get(utility)
+        if u_state is None:
+            # cursors compare states by identity, so every utility must be
+            # unpickled only once
+            with self.lock:
+                u_state = self.states.get(utility)
+                if u_state is None:
+                    u_state = pickle.loads(self.pickled_states[utility])
+                    self.states[utility] = u_state
+        return u_state
+
+    def get(self, utility, default=None):
+        if utility in self.pickled_states:
+            return self[utility]
+        return default
+
+    def keys(self):
+        return self.pickled_states.keys()
+
+    def values(self):
+        return [self[utility] for utility in self.pickled_states]
+
+    def items(self):
+        return [(utility, self[utility]) for utility in self.pickled_states]
+
+
+def grammar_signature(input_file):
+    """
+    The compiled grammar depends on the grammar file and on the state
+    classes and the grammar construction code of this module.
+    """
+    with open(input_file, 'rb') as f:
+        source_digest = hashlib.sha1(f.read()).hexdigest()
+    with open(os.path.splitext(__file__)[0] + '.py', 'rb') as f:
+        code_digest = hashlib.sha1(f.read()).hexdigest()
+    return COMPILED_GRAMMAR_VERSION, source_digest, code_digest
+
+
+def compiled_grammar_path(input_file):
+    return os.path.splitext(input_file)[0] + '.compiled'
+
+
+def compile_grammar(input_file, output_file=None):
+    """
+    Build the grammar of input_file and save the state graph of each utility
+    pickled separately.
+
+    :return: (signature, name2type, pickled utility states)
+    """
+    bash_grammar = BashGrammar()
+    bash_grammar.make_grammar(input_file)
+    pickled_states = {}
+    for utility, u_state in bash_grammar.grammar.items():
+        pickled_states[utility] = pickle.dumps(
+            u_state, pickle.HIGHEST_PROTOCOL)
+    compiled = (grammar_signature(input_file), bash_grammar.name2type,
+                pickled_states)
+
+    output_file = output_file or compiled_grammar_path(input_file)
+    tmp_path = '{}.{}.tmp'.format(output_file, os.getpid())
+    try:
+        with open(tmp_path, 'wb') as o_f:
+            pickle.dump(compiled, o_f, pickle.HIGHEST_PROTOCOL)
+        os.rename(tmp_path, output_file)
+    except (IOError, OSError):
+        # e.g. read-only installation, use the grammar without saving it
+        pass
+    return compiled
+
+
 bg = BashGrammar()
-bg.make_grammar(os.path.join(os.path.dirname(__file__), 'grammar', 'grammar100.txt'))
+bg.load_grammar(GRAMMAR_FILE)
+
+
+if __name__ == '__main__':
+    # pickle the states as instances of bashlint.grammar classes rather than
+    # __main__ classes
+    from bashlint import grammar
+    grammar_file = sys.argv[1] if len(sys.argv) > 1 else GRAMMAR_FILE
+    grammar.compile_grammar(grammar_file)
+    print('Grammar compiled to {}'.format(compiled_grammar_path(grammar_file)))
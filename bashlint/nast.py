@@ -3,6 +3,7 @@ Node Classes for the Normalized Bash AST.
 """
 
 import collections
+import sys
 
 from bashlint import bash
 
@@ -27,6 +28,11 @@ class Node(object):
                             # -1 indicates "any number of"
     children_types = []     # list of compatible types of children
 
+    # no per-instance __dict__: the parsed ASTs of a whole corpus are often
+    # kept in memory
+    __slots__ = ('parent', 'lsb', 'rsb', 'kind', 'value', 'children',
+                 'linearization', 'annotation')
+
     def __init__(self, parent=None, lsb=None, kind="", value=""):
         """
         :member parent: pointer to parent node
@@ -45,12 +51,17 @@ class Node(object):
                      ]
         :member value: string value of the node
         :member children: list of child nodes
+        :member linearization: linearizations of the subtree memoized by
+            data_tools.linearize (unset until first requested)
+        :member annotation: tree edit distance annotation of the subtree
+            memoized by eval.tree_dist.annotate (unset until first requested)
         """
         self.parent = parent
         self.lsb = lsb
         self.rsb = None
         self.kind = kind
-        self.value = value
+        # utility names, flags and common arguments repeat across ASTs
+        self.value = sys.intern(value) if type(value) is str else value
         self.children = []
 
     def add_child(self, child, index=None):
@@ -159,6 +170,8 @@ class Node(object):
         return self.parent.parent
 
 class UtilityNode(Node):
+    __slots__ = ('arg_dict',)
+
     def __init__(self, value='', parent=None, lsb=None):
         super(UtilityNode, self).__init__(parent, lsb, "utility", value)
         self.arg_dict = {'': collections.defaultdict(int)}
@@ -183,6 +196,8 @@ class UtilityNode(Node):
                 return child
 
 class FlagNode(Node):
+    __slots__ = ()
+
     def __init__(self, value='', parent=None, lsb=None):
         super(FlagNode, self).__init__(parent, lsb, "flag", value)
 
@@ -206,6 +221,7 @@ class FlagNode(Node):
 
 class ArgumentNode(Node):
     num_child = 0
+    __slots__ = ('arg_type', 'index', 'list_separator', 'list_members')
 
     def __init__(self, value='', arg_type='', parent=None, lsb=None,
                  list_members=None, list_separator=None):
@@ -251,6 +267,7 @@ class ArgumentNode(Node):
 
 class OperatorNode(Node):
     num_child = 0
+    __slots__ = ()
 
     def __init__(self, value='', parent=None, lsb=None):
         super(OperatorNode, self).__init__(
@@ -261,6 +278,7 @@ class UnaryLogicOpNode(Node):
     children_types = [set(['flag', 'bracket', 'unarylogicop', 'binarylogicop'])]
     LEFT = 0
     RIGHT = 1
+    __slots__ = ('associate',)
 
     def __init__(self, value='', parent=None, lsb=None):
         super(UnaryLogicOpNode, self).__init__(parent, lsb, 'unarylogicop', value)
@@ -274,6 +292,7 @@ class UnaryLogicOpNode(Node):
 class BinaryLogicOpNode(Node):
     num_child = -1
     children_types = [set(['flag', 'bracket', 'unarylogicop', 'binarylogicop'])]
+    __slots__ = ()
 
     def __init__(self, value='', parent=None, lsb=None):
         super(BinaryLogicOpNode, self).__init__(parent, lsb, 'binarylogicop', value)
@@ -281,18 +300,21 @@ class BinaryLogicOpNode(Node):
 class BracketNode(Node):
     num_child = -1
     children_types = [set(['flag', 'bracket', 'unarylogicop', 'binarylogicop'])]
+    __slots__ = ()
 
     def __init__(self, parent=None, lsb=None):
         super(BracketNode, self).__init__(parent, lsb, 'bracket', '')
 
 class RedirectNode(Node):
     num_child = 2
+    __slots__ = ()
 
     def __init__(self, value='', parent=None, lsb=None):
         super(RedirectNode, self).__init__(parent, lsb, 'redirect', value)
 
 class PipelineNode(Node):
     children_types = [set(['utility'])]
+    __slots__ = ()
 
     def __init__(self, parent=None, lsb=None):
         super(PipelineNode, self).__init__(parent, lsb, 'pipeline')
@@ -300,6 +322,7 @@ class PipelineNode(Node):
 class CommandSubstitutionNode(Node):
     num_child = 1
     children_types = [set(['pipe', 'utility'])]
+    __slots__ = ()
 
     def __init__(self, parent=None, lsb=None):
         super(CommandSubstitutionNode, self).__init__(parent, lsb)
@@ -308,6 +331,7 @@ class CommandSubstitutionNode(Node):
 class ProcessSubstitutionNode(Node):
     num_child = 1
     children_types = [set(['pipe', 'utility'])]
+    __slots__ = ()
 
     def __init__(self, value, parent=None, lsb=None):
         super(ProcessSubstitutionNode, self).__init__(parent, lsb)
@@ -316,3 +340,52 @@ class ProcessSubstitutionNode(Node):
             self.value = value
         else:
             raise ValueError("Value of a processsubstitution has to be '<' or '>'.")
+
+
+def test_ast_footprint(input_file, num_repeats=10):
+    """
+    Measure the memory used by the ASTs of the commands in input_file and the
+    time of a full traversal of the ASTs.
+    """
+    import gc
+    import time
+    import tracemalloc
+    from bashlint import lint
+
+    with open(input_file) as f:
+        cmds = [cmd.strip() for cmd in f]
+
+    gc.collect()
+    tracemalloc.start()
+    start_size, _ = tracemalloc.get_traced_memory()
+    asts = [lint.normalize_ast(cmd) for cmd in cmds]
+    gc.collect()
+    end_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    asts = [ast for ast in asts if ast is not None]
+
+    def traverse(node):
+        num_nodes = 1
+        node.get_label()
+        node.is_utility()
+        for child in node.get_children():
+            num_nodes += traverse(child)
+        return num_nodes
+
+    num_nodes = sum(traverse(ast) for ast in asts)
+    start_time = time.time()
+    for _ in range(num_repeats):
+        for ast in asts:
+            traverse(ast)
+    traversal_time = (time.time() - start_time) / num_repeats
+
+    print('{} ASTs, {} nodes'.format(len(asts), num_nodes))
+    print('memory: {:.0f} bytes per AST, {:.0f} bytes per node'.format(
+        float(end_size - start_size) / len(asts),
+        float(end_size - start_size) / num_nodes))
+    print('traversal: {:.2f} us per AST'.format(
+        traversal_time * 1e6 / len(asts)))
+
+
+if __name__ == '__main__':
+    test_ast_footprint(sys.argv[1])
@@ -0,0 +1,168 @@
+"""
+Content-addressed cache of normalized bash ASTs.
+
+Parsing a command with lint.normalize_ast runs the full bashlex parse and the
+grammar normalization, which dominates the time of evaluation scripts that
+repeatedly parse the same ground truths, templates and predictions.
+
+The cache maps (command, recover_quotes) to the pickled normalized tree.
+Cached trees are never handed out directly: every lookup unpickles a fresh
+copy, so callers may mutate the returned tree (e.g. slot filling) without
+affecting later lookups.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import collections
+import glob
+import hashlib
+import os
+import pickle
+import threading
+
+from bashlint.grammar import GRAMMAR_FILE, grammar_signature
+
+PARSE_CACHE_VERSION = 2
+
+# modules of the bashlint package, which holds the bashlex parser, the
+# normalizer and the node classes (parsetab.py is generated from bparser.py),
+# and the constants used by the normalizer
+NORMALIZER_SOURCES = [
+    path for path in sorted(glob.glob(
+        os.path.join(os.path.dirname(__file__), '*.py')))
+    if os.path.basename(path) != 'parsetab.py'] + [
+    os.path.join(os.path.dirname(__file__), '..', 'nlp_tools', 'constants.py')]
+
+
+def normalizer_signature():
+    digest = hashlib.sha1()
+    for path in NORMALIZER_SOURCES:
+        with open(path, 'rb') as f:
+            digest.update(hashlib.sha1(f.read()).digest())
+    return digest.hexdigest()
+
+
+def parse_cache_signature():
+    """
+    Cached trees are only valid for the grammar and the code they were parsed
+    with.
+    """
+    return PARSE_CACHE_VERSION, grammar_signature(GRAMMAR_FILE), \
+        normalizer_signature()
+
+
+def parse_cache_key(cmd, recover_quotes=True):
+    # normalize_ast ignores line breaks and surrounding whitespaces
+    return cmd.replace('\n', ' ').strip(), bool(recover_quotes)
+
+
+class ParseCache(object):
+    """
+    LRU cache of normalized bash ASTs with an optional on-disk store.
+    """
+    def __init__(self, capacity, path=None):
+        """
+        :param capacity: Maximum number of cached entries.
+        :param path: If set, the cache is loaded from and saved to this path.
+        """
+        self.capacity = capacity
+        self.path = path
+        self.entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key):
+        """
+        :return: (found, tree) where tree is a private copy of the cached AST.
+        """
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                data = self.entries[key]
+            else:
+                self.misses += 1
+                return False, None
+        return True, pickle.loads(data)
+
+    def put(self, key, tree):
+        try:
+            data = pickle.dumps(tree, pickle.HIGHEST_PROTOCOL)
+        except RecursionError:
+            # extremely deep trees are not worth caching
+            return
+        with self.lock:
+            self.entries[key] = data
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.capacity:
+                self.entries.popitem(last=False)
+
+    def parse(self, parse_fun, cmd, recover_quotes=True, verbose=False):
+        """
+        Look up the AST of cmd, calling parse_fun(cmd, recover_quotes,
+        verbose) on a cache miss. Parse errors are not reported on cache hits.
+        """
+        key = parse_cache_key(cmd, recover_quotes)
+        found, tree = self.get(key)
+        if not found:
+            tree = parse_fun(cmd, recover_quotes, verbose=verbose)
+            self.put(key, tree)
+        return tree
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def hit_rate(self):
+        num_lookups = self.hits + self.misses
+        return float(self.hits) / num_lookups if num_lookups > 0 else 0.0
+
+    def stats(self):
+        return {
+            'size': len(self.entries),
+            'capacity': self.capacity,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate()
+        }
+
+    def save(self, path=None):
+        path = path or self.path
+        with self.lock:
+            entries = list(self.entries.items())
+        tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+        with open(tmp_path, 'wb') as o_f:
+            pickle.dump((parse_cache_signature(), entries), o_f,
+                        pickle.HIGHEST_PROTOCOL)
+        os.rename(tmp_path, path)
+        print('{} parse cache entries saved to {}'.format(len(entries), path))
+
+    def load(self, path=None):
+        """
+        Load the entries of an on-disk store. A store written for a
+        different grammar or by different parsing code is ignored.
+        """
+        path = path or self.path
+        with open(path, 'rb') as f:
+            signature, entries = pickle.load(f)
+        if signature != parse_cache_signature():
+            print('Parse cache {} is out of date, ignored'.format(path))
+            return
+        with self.lock:
+            for key, data in entries:
+                self.entries[key] = data
+            while len(self.entries) > self.capacity:
+                self.entries.popitem(last=False)
+        print('{} parse cache entries loaded from {}'.format(
+            len(entries), path))
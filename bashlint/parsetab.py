@@ -0,0 +1,196 @@
+
+# /root/package/bashlint/parsetab.py
+# This file is automatically generated. Do not edit.
+_tabversion = '3.2'
+
+_lr_method = 'LALR'
+
+_lr_signature = b'L\xb3}\xcd\xaf\x08\x84\xf7[\xb9\x18\x7f\xe5\xfa\xe2\x1a'
+    
+_lr_action_items = {'NEWLINE':([0,2,4,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,33,34,36,39,40,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,80,81,85,86,87,88,89,90,92,93,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,143,144,145,146,147,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,193,194,195,196,198,199,200,201,202,204,205,206,207,208,209,210,211,212,213,216,217,218,220,222,223,224,225,226,227,228,229,230,231,234,235,236,237,238,239,240,241,242,243,244,247,250,251,252,253,254,256,257,258,259,260,261,262,263,264,265,266,267,273,276,278,279,280,281,282,283,284,285,289,291,292,293,294,295,296,297,298,299,300,301,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,323,326,327,328,329,330,331,335,336,337,341,343,344,345,346,],[3,57,59,-148,-155,-156,68,68,-163,-164,-58,-59,-61,-62,-56,-63,-64,-167,-167,-67,-68,-69,-70,-71,-72,-73,-51,-167,-52,-53,-167,-167,-110,-149,-150,-167,-167,-167,-167,-157,-160,-143,-144,-145,-158,-159,-165,-57,-51,-60,-54,143,-146,-167,-101,-51,-105,-167,68,-167,-167,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,-153,-154,143,143,143,143,-166,-55,-167,202,-147,-140,-167,-167,-100,143,-102,-103,143,-167,-167,-167,-167,-109,143,143,-167,-167,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,-151,-152,-161,-162,-167,-167,-167,-167,-167,143,-167,-97,-98,-104,-167,-167,68,143,143,-167,-167,-167,143,-65,143,143,143,143,143,-66,-95,143,-99,-5,68,-167,-167,-167,-167,-167,-84,-85,143,-167,143,68,-167,-167,-106,-167,-167,-135,-136,-137,-138,-139,-96,-74,-75,-6,-167,143,-92,143,-94,-121,-123,-125,308,-86,-87,-167,-108,-167,-167,-167,143,-167,-167,-76,-77,-82,-83,-167,-93,-122,-124,-126,-167,-167,-167,143,-88,-89,-107,-167,143,143,143,-167,-167,143,-167,143,143,143,-167,-167,-80,-81,143,-167,-78,-79,-90,-91,]),'error':([0,],[4,]),'EOF':([0,2,6,7,8,9,10,11,12,13,14,15,16,17,18,19,22,23,24,25,26,27,28,29,33,34,40,60,61,66,67,68,69,70,71,72,73,74,75,76,77,86,87,88,90,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,138,139,147,150,151,157,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,193,194,195,196,206,207,208,211,222,228,229,231,234,235,241,242,250,253,262,263,264,265,273,278,283,284,289,297,298,299,300,304,312,313,314,335,336,343,344,345,346,],[5,58,-148,-155,-156,70,70,-163,-164,-58,-59,-61,-62,-56,-63,-64,-67,-68,-69,-70,-71,-72,-73,-51,-52,-53,-110,-149,-150,-157,-160,-143,-144,-145,-158,-159,-165,-57,-51,-60,-54,-101,-51,-105,70,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,-153,-154,-166,-55,-100,-102,-103,-109,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,-151,-152,-161,-162,-97,-98,-104,70,-65,-66,-95,-99,-5,70,-84,-85,70,-106,-96,-74,-75,-6,-92,-94,-86,-87,-108,-76,-77,-82,-83,-93,-88,-89,-107,-80,-81,-78,-79,-90,-91,]),'BANG':([0,9,10,12,20,21,30,36,39,60,61,62,63,73,80,81,134,135,138,140,143,145,155,156,161,191,192,198,199,200,201,202,209,210,217,218,223,224,225,226,227,237,238,239,240,247,251,252,254,256,291,292,293,295,296,301,308,309,310,315,316,317,318,319,320,323,326,327,328,329,330,331,337,341,],[9,9,9,-164,-167,-167,-167,-167,-167,9,9,-167,-167,-165,9,-146,9,9,-166,-167,-147,-167,-167,-167,-167,9,9,-167,-167,-167,-167,-167,-167,-167,-167,-167,9,9,9,9,9,-167,-167,-167,-167,9,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,9,9,9,-167,-167,9,-167,9,9,9,-167,-167,9,-167,]),'TIME':([0,9,10,12,20,21,30,36,39,60,61,62,63,73,80,81,134,135,138,140,143,145,155,156,161,191,192,198,199,200,201,202,209,210,217,218,223,224,225,226,227,237,238,239,240,247,251,252,254,256,291,292,293,295,296,301,308,309,310,315,316,317,318,319,320,323,326,327,328,329,330,331,337,341,],[12,12,12,-164,-167,-167,-167,-167,-167,12,12,-167,-167,-165,12,-146,12,12,-166,-167,-147,-167,-167,-167,-167,12,12,-167,-167,-167,-167,-167,-167,-167,-167,-167,12,12,12,12,12,-167,-167,-167,-167,12,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,12,12,12,-167,-167,12,-167,12,12,12,-167,-167,12,-167,]),'WHILE':([0,9,10,12,20,21,30,32,36,39,60,61,62,63,64,65,73,80,81,85,87,134,135,136,137,138,140,143,145,146,149,155,156,161,191,192,198,199,200,201,202,204,205,209,210,217,218,223,224,225,226,227,230,237,238,239,240,247,251,252,254,256,291,292,293,295,296,301,308,309,310,315,316,317,318,319,320,323,326,327,328,329,330,331,337,341,],[20,20,20,-164,-167,-167,-167,20,-167,-167,20,20,-167,-167,-167,-167,-165,20,-146,-167,20,20,20,20,20,-166,-167,-147,-167,-167,20,-167,-167,-167,20,20,-167,-167,-167,-167,-167,20,-167,-167,-167,-167,-167,20,20,20,20,20,20,-167,-167,-167,-167,20,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,20,20,20,-167,-167,20,-167,20,20,20,-167,-167,20,-167,]),'UNTIL':([0,9,10,12,20,21,30,32,36,39,60,61,62,63,64,65,73,80,81,85,87,134,135,136,137,138,140,143,145,146,149,155,156,161,191,192,198,199,200,201,202,204,205,209,210,217,218,223,224,225,226,227,230,237,238,239,240,247,251,252,254,256,291,292,293,295,296,301,308,309,310,315,316,317,318,319,320,323,326,327,328,329,330,331,337,341,],[21,21,21,-164,-167,-167,-167,21,-167,-167,21,21,-167,-167,-167,-167,-165,21,-146,-167,21,21,21,21,21,-166,-167,-147,-167,-167,21,-167,-167,-167,21,21,-167,-167,-167,-167,-167,21,-167,-167,-167,-167,-167,21,21,21,21,21,21,-167,-167,-167,-167,21,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,21,21,21,-167,-167,21,-167,21,21,21,-167,-167,21,-167,]),'WORD':([0,9,10,12,13,17,20,21,29,30,31,32,33,34,35,36,37,38,39,42,45,46,47,48,49,50,51,52,53,54,55,60,61,62,63,64,65,73,74,75,80,81,87,88,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,134,135,136,137,138,140,143,145,155,156,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,198,199,200,201,202,209,210,211,216,217,218,219,223,224,225,226,227,234,235,237,238,239,240,243,244,247,250,251,252,254,256,265,275,276,279,280,281,291,292,293,295,296,301,302,305,306,307,308,309,310,315,316,317,318,319,320,323,326,327,328,329,330,331,337,341,],[29,29,29,-164,75,-56,-167,-167,-51,-167,85,87,-52,-53,89,-167,92,93,-167,96,117,118,119,120,121,122,123,125,128,130,131,29,29,-167,-167,-167,-167,-165,-57,-51,29,-146,-51,75,-7,163,164,165,166,167,168,169,170,172,175,177,178,179,180,181,182,183,184,186,189,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,29,29,29,29,-166,-167,-147,-167,-167,-167,-167,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,29,29,-167,-167,-167,-167,-167,-167,-167,234,-167,-167,-167,234,29,29,29,29,29,-5,265,-167,-167,-167,-167,272,-167,29,265,-167,-167,-167,-167,-6,272,272,-121,-123,-125,-167,-167,-167,-167,-167,-167,325,-122,-124,-126,-167,-167,-167,-167,29,29,29,-167,-167,29,-167,29,29,29,-167,-167,29,-167,]),'FUNCTION':([0,9,10,12,20,21,30,36,39,60,61,62,63,64,65,73,80,81,134,135,136,137,138,140,143,145,155,156,161,191,192,198,199,200,201,202,209,210,217,218,223,224,225,226,227,237,238,239,240,247,251,252,254,256,291,292,293,295,296,301,308,309,310,315,316,317,318,319,320,323,326,327,328,329,330,331,337,341,],[31,31,31,-164,-167,-167,-167,-167,-167,31,31,-167,-167,-167,-167,-165,31,-146,31,31,31,31,-166,-167,-147,-167,-167,-167,-167,31,31,-167,-167,-167,-167,-167,-167,-167,-167,-167,31,31,31,31,31,-167,-167,-167,-167,31,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,31,31,31,-167,-167,31,-167,31,31,31,-167,-167,31,-167,]),'COPROC':([0,9,10,12,20,21,30,36,39,60,61,62,63,64,65,73,80,81,134,135,136,137,138,140,143,145,155,156,161,191,192,198,199,200,201,202,209,210,217,218,223,224,225,226,227,237,238,239,240,247,251,252,254,256,291,292,293,295,296,301,308,309,310,315,316,317,318,319,320,323,326,327,328,329,330,331,337,341,],[32,32,32,-164,-167,-167,-167,-167,-167,32,32,-167,-167,-167,-167,-165,32,-146,32,32,32,32,-166,-167,-147,-167,-167,-167,-167,32,32,-167,-167,-167,-167,-167,-167,-167,-167,-167,32,32,32,32,32,-167,-167,-167,-167,32,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,32,32,32,-167,-167,32,-167,32,32,32,-167,-167,32,-167,]),'ASSIGNMENT_WORD':([0,9,10,12,13,17,20,21,29,30,32,33,34,36,39,60,61,62,63,64,65,73,74,75,80,81,87,88,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,134,135,136,137,138,140,143,145,155,156,161,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,198,199,200,201,202,209,210,217,218,223,224,225,226,227,237,238,239,240,247,251,252,254,256,291,292,293,295,296,301,308,309,310,315,316,317,318,319,320,323,326,327,328,329,330,331,337,341,],[33,33,33,-164,33,-56,-167,-167,-51,-167,33,-52,-53,-167,-167,33,33,-167,-167,-167,-167,-165,-57,-51,33,-146,-51,33,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,33,33,33,33,-166,-167,-147,-167,-167,-167,-167,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,33,33,-167,-167,-167,-167,-167,-167,-167,-167,-167,33,33,33,33,33,-167,-167,-167,-167,33,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,33,33,33,-167,-167,33,-167,33,33,33,-167,-167,33,-167,]),'FOR':([0,9,10,12,20,21,30,32,36,39,60,61,62,63,64,65,73,80,81,85,87,134,135,136,137,138,140,143,145,146,149,155,156,161,191,192,198,199,200,201,202,204,205,209,210,217,218,223,224,225,226,227,230,237,238,239,240,247,251,252,254,256,291,292,293,295,296,301,308,309,310,315,316,317,318,319,320,323,326,327,328,329,330,331,337,341,],[35,35,35,-164,-167,-167,-167,35,-167,-167,35,35,-167,-167,-167,-167,-165,35,-146,-167,35,35,35,35,35,-166,-167,-147,-167,-167,35,-167,-167,-167,35,35,-167,-167,-167,-167,-167,35,-167,-167,-167,-167,-167,35,35,35,35,35,35,-167,-167,-167,-167,35,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,35,35,35,-167,-167,35,-167,35,35,35,-167,-167,35,-167,]),'CASE':([0,9,10,12,20,21,30,32,36,39,60,61,62,63,64,65,73,80,81,85,87,134,135,136,137,138,140,143,145,146,149,155,156,161,191,192,198,199,200,201,202,204,205,209,210,217,218,223,224,225,226,227,230,237,238,239,240,247,251,252,254,256,291,292,293,295,296,301,308,309,310,315,316,317,318,319,320,323,326,327,328,329,330,331,337,341,],[37,37,37,-164,-167,-167,-167,37,-167,-167,37,37,-167,-167,-167,-167,-165,37,-146,-167,37,37,37,37,37,-166,-167,-147,-167,-167,37,-167,-167,-167,37,37,-167,-167,-167,-167,-167,37,-167,-167,-167,-167,-167,37,37,37,37,37,37,-167,-167,-167,-167,37,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,37,37,37,-167,-167,37,-167,37,37,37,-167,-167,37,-167,]),'SELECT':([0,9,10,12,20,21,30,32,36,39,60,61,62,63,64,65,73,80,81,85,87,134,135,136,137,138,140,143,145,146,149,155,156,161,191,192,198,199,200,201,202,204,205,209,210,217,218,223,224,225,226,227,230,237,238,239,240,247,251,252,254,256,291,292,293,295,296,301,308,309,310,315,316,317,318,319,320,323,326,327,328,329,330,331,337,341,],[38,38,38,-164,-167,-167,-167,38,-167,-167,38,38,-167,-167,-167,-167,-165,38,-146,-167,38,38,38,38,38,-166,-167,-147,-167,-167,38,-167,-167,-167,38,38,-167,-167,-167,-167,-167,38,-167,-167,-167,-167,-167,38,38,38,38,38,38,-167,-167,-167,-167,38,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,38,38,38,-167,-167,38,-167,38,38,38,-167,-167,38,-167,]),'IF':([0,9,10,12,20,21,30,32,36,39,60,61,62,63,64,65,73,80,81,85,87,134,135,136,137,138,140,143,145,146,149,155,156,161,191,192,198,199,200,201,202,204,205,209,210,217,218,223,224,225,226,227,230,237,238,239,240,247,251,252,254,256,291,292,293,295,296,301,308,309,310,315,316,317,318,319,320,323,326,327,328,329,330,331,337,341,],[39,39,39,-164,-167,-167,-167,39,-167,-167,39,39,-167,-167,-167,-167,-165,39,-146,-167,39,39,39,39,39,-166,-167,-147,-167,-167,39,-167,-167,-167,39,39,-167,-167,-167,-167,-167,39,-167,-167,-167,-167,-167,39,39,39,39,39,39,-167,-167,-167,-167,39,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,39,39,39,-167,-167,39,-167,39,39,39,-167,-167,39,-167,]),'LEFT_PAREN':([0,9,10,12,20,21,29,30,32,36,39,60,61,62,63,64,65,73,80,81,85,87,134,135,136,137,138,140,143,145,146,149,155,156,161,191,192,198,199,200,201,202,204,205,209,210,216,217,218,223,224,225,226,227,230,237,238,239,240,243,244,247,251,252,254,256,276,279,280,281,291,292,293,295,296,301,305,306,307,308,309,310,315,316,317,318,319,320,323,326,327,328,329,330,331,337,341,],[30,30,30,-164,-167,-167,83,-167,30,-167,-167,30,30,-167,-167,-167,-167,-165,30,-146,148,30,30,30,30,30,-166,-167,-147,-167,-167,30,-167,-167,-167,30,30,-167,-167,-167,-167,-167,30,-167,-167,-167,-167,-167,-167,30,30,30,30,30,30,-167,-167,-167,-167,275,-167,30,-167,-167,-167,-167,275,-121,-123,-125,-167,-167,-167,-167,-167,-167,-122,-124,-126,-167,-167,-167,-167,30,30,30,-167,-167,30,-167,30,30,30,-167,-167,30,-167,]),'LEFT_CURLY':([0,9,10,12,20,21,30,32,36,39,60,61,62,63,64,65,68,69,70,73,80,81,85,87,89,90,93,134,135,136,137,138,140,143,145,146,149,152,153,154,155,156,159,160,161,191,192,198,199,200,201,202,204,205,209,210,212,213,217,218,220,223,224,225,226,227,230,236,237,238,239,240,247,251,252,254,256,266,267,285,291,292,293,294,295,296,301,308,309,310,311,315,316,317,318,319,320,323,326,327,328,329,330,331,337,341,],[36,36,36,-164,-167,-167,-167,36,-167,-167,36,36,-167,-167,-167,-167,-143,-144,-145,-165,36,-146,-167,36,-167,156,-167,36,36,36,36,-166,-167,-147,-167,-167,36,210,-167,-167,-167,-167,218,-167,-167,36,36,-167,-167,-167,-167,-167,36,-167,-167,-167,238,240,-167,-167,252,36,36,36,36,36,36,-167,-167,-167,-167,-167,36,-167,-167,-167,-167,-167,296,-167,-167,-167,-167,320,-167,-167,-167,-167,-167,-167,331,-167,36,36,36,-167,-167,36,-167,36,36,36,-167,-167,36,-167,]),'ARITH_CMD':([0,9,10,12,20,21,30,32,36,39,60,61,62,63,64,65,73,80,81,85,87,134,135,136,137,138,140,143,145,146,149,155,156,161,191,192,198,199,200,201,202,204,205,209,210,217,218,223,224,225,226,227,230,237,238,239,240,247,251,252,254,256,291,292,293,295,296,301,308,309,310,315,316,317,318,319,320,323,326,327,328,329,330,331,337,341,],[40,40,40,-164,-167,-167,-167,40,-167,-167,40,40,-167,-167,-167,-167,-165,40,-146,-167,40,40,40,40,40,-166,-167,-147,-167,-167,40,-167,-167,-167,40,40,-167,-167,-167,-167,-167,40,-167,-167,-167,-167,-167,40,40,40,40,40,40,-167,-167,-167,-167,40,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,40,40,40,-167,-167,40,-167,40,40,40,-167,-167,40,-167,]),'COND_START':([0,9,10,12,20,21,30,32,36,39,60,61,62,63,64,65,73,80,81,85,87,134,135,136,137,138,140,143,145,146,149,155,156,161,191,192,198,199,200,201,202,204,205,209,210,217,218,223,224,225,226,227,230,237,238,239,240,247,251,252,254,256,291,292,293,295,296,301,308,309,310,315,316,317,318,319,320,323,326,327,328,329,330,331,337,341,],[41,41,41,-164,-167,-167,-167,41,-167,-167,41,41,-167,-167,-167,-167,-165,41,-146,-167,41,41,41,41,41,-166,-167,-147,-167,-167,41,-167,-167,-167,41,41,-167,-167,-167,-167,-167,41,-167,-167,-167,-167,-167,41,41,41,41,41,41,-167,-167,-167,-167,41,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,-167,41,41,41,-167,-167,41,-167,41,41,41,-167,-167,41,-167,]),'LESS_LESS':([0,9,10,12,13,14,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,33,34,36,39,40,43,44,60,61,62,63,64,65,73,74,75,76,77,80,81,86,87,88,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,134,135,136,137,138,139,140,143,145,147,150,151,155,156,157,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,198,199,200,201,202,207,208,209,210,217,218,222,223,224,225,226,227,228,231,237,238,239,240,241,242,247,251,252,253,254,256,263,264,273,278,283,284,289,291,292,293,295,296,297,298,299,300,301,304,308,309,310,312,313,314,315,316,317,318,319,320,323,326,327,328,329,330,331,335,336,337,341,343,344,345,346,],[42,42,42,-164,42,42,-56,-63,-64,-167,-167,-67,-68,-69,-70,-71,-72,-73,-51,-167,42,-52,-53,-167,-167,-110,97,107,42,42,-167,-167,-167,-167,-165,-57,-51,42,-54,42,-146,42,-51,42,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,42,42,42,42,-166,-55,-167,-147,-167,-100,42,42,-167,-167,-109,-167,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,42,42,-167,-167,-167,-167,-167,42,42,-167,-167,-167,-167,-65,42,42,42,42,42,-66,42,-167,-167,-167,-167,-84,-85,42,-167,-167,-106,-167,-167,-74,-75,-92,-94,-86,-87,-108,-167,-167,-167,-167,-167,-76,-77,-82,-83,-167,-93,-167,-167,-167,-88,-89,-107,-167,42,42,42,-167,-167,42,-167,42,42,42,-167,-167,-80,-81,42,-167,-78,-79,-90,-91,]),'NUMBER':([0,9,10,12,13,14,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,33,34,36,39,40,52,53,60,61,62,63,64,65,73,74,75,76,77,80,81,86,87,88,96,105,106,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,134,135,136,137,138,139,140,143,145,147,150,151,155,156,157,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,198,199,200,201,202,207,208,209,210,217,218,222,223,224,225,226,227,228,231,237,238,239,240,241,242,247,251,252,253,254,256,263,264,273,278,283,284,289,291,292,293,295,296,297,298,299,300,301,304,308,309,310,312,313,314,315,316,317,318,319,320,323,326,327,328,329,330,331,335,336,337,341,343,344,345,346,],[43,43,43,-164,43,43,-56,-63,-64,-167,-167,-67,-68,-69,-70,-71,-72,-73,-51,-167,43,-52,-53,-167,-167,-110,124,127,43,43,-167,-167,-167,-167,-165,-57,-51,43,-54,43,-146,43,-51,43,-7,171,174,185,188,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,43,43,43,43,-166,-55,-167,-147,-167,-100,43,43,-167,-167,-109,-167,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,43,43,-167,-167,-167,-167,-167,43,43,-167,-167,-167,-167,-65,43,43,43,43,43,-66,43,-167,-167,-167,-167,-84,-85,43,-167,-167,-106,-167,-167,-74,-75,-92,-94,-86,-87,-108,-167,-167,-167,-167,-167,-76,-77,-82,-83,-167,-93,-167,-167,-167,-88,-89,-107,-167,43,43,43,-167,-167,43,-167,43,43,43,-167,-167,-80,-81,43,-167,-78,-79,-90,-91,]),'REDIR_WORD':([0,9,10,12,13,14,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,33,34,36,39,40,60,61,62,63,64,65,73,74,75,76,77,80,81,86,87,88,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,134,135,136,137,138,139,140,143,145,147,150,151,155,156,157,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,198,199,200,201,202,207,208,209,210,217,218,222,223,224,225,226,227,228,231,237,238,239,240,241,242,247,251,252,253,254,256,263,264,273,278,283,284,289,291,292,293,295,296,297,298,299,300,301,304,308,309,310,312,313,314,315,316,317,318,319,320,323,326,327,328,329,330,331,335,336,337,341,343,344,345,346,],[44,44,44,-164,44,44,-56,-63,-64,-167,-167,-67,-68,-69,-70,-71,-72,-73,-51,-167,44,-52,-53,-167,-167,-110,44,44,-167,-167,-167,-167,-165,-57,-51,44,-54,44,-146,44,-51,44,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,44,44,44,44,-166,-55,-167,-147,-167,-100,44,44,-167,-167,-109,-167,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,44,44,-167,-167,-167,-167,-167,44,44,-167,-167,-167,-167,-65,44,44,44,44,44,-66,44,-167,-167,-167,-167,-84,-85,44,-167,-167,-106,-167,-167,-74,-75,-92,-94,-86,-87,-108,-167,-167,-167,-167,-167,-76,-77,-82,-83,-167,-93,-167,-167,-167,-88,-89,-107,-167,44,44,44,-167,-167,44,-167,44,44,44,-167,-167,-80,-81,44,-167,-78,-79,-90,-91,]),'LESS_LESS_MINUS':([0,9,10,12,13,14,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,33,34,36,39,40,43,44,60,61,62,63,64,65,73,74,75,76,77,80,81,86,87,88,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,134,135,136,137,138,139,140,143,145,147,150,151,155,156,157,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,198,199,200,201,202,207,208,209,210,217,218,222,223,224,225,226,227,228,231,237,238,239,240,241,242,247,251,252,253,254,256,263,264,273,278,283,284,289,291,292,293,295,296,297,298,299,300,301,304,308,309,310,312,313,314,315,316,317,318,319,320,323,326,327,328,329,330,331,335,336,337,341,343,344,345,346,],[45,45,45,-164,45,45,-56,-63,-64,-167,-167,-67,-68,-69,-70,-71,-72,-73,-51,-167,45,-52,-53,-167,-167,-110,98,108,45,45,-167,-167,-167,-167,-165,-57,-51,45,-54,45,-146,45,-51,45,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,45,45,45,45,-166,-55,-167,-147,-167,-100,45,45,-167,-167,-109,-167,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,45,45,-167,-167,-167,-167,-167,45,45,-167,-167,-167,-167,-65,45,45,45,45,45,-66,45,-167,-167,-167,-167,-84,-85,45,-167,-167,-106,-167,-167,-74,-75,-92,-94,-86,-87,-108,-167,-167,-167,-167,-167,-76,-77,-82,-83,-167,-93,-167,-167,-167,-88,-89,-107,-167,45,45,45,-167,-167,45,-167,45,45,45,-167,-167,-80,-81,45,-167,-78,-79,-90,-91,]),'GREATER':([0,9,10,12,13,14,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,33,34,36,39,40,43,44,60,61,62,63,64,65,73,74,75,76,77,80,81,86,87,88,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,134,135,136,137,138,139,140,143,145,147,150,151,155,156,157,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,198,199,200,201,202,207,208,209,210,217,218,222,223,224,225,226,227,228,231,237,238,239,240,241,242,247,251,252,253,254,256,263,264,273,278,283,284,289,291,292,293,295,296,297,298,299,300,301,304,308,309,310,312,313,314,315,316,317,318,319,320,323,326,327,328,329,330,331,335,336,337,341,343,344,345,346,],[46,46,46,-164,46,46,-56,-63,-64,-167,-167,-67,-68,-69,-70,-71,-72,-73,-51,-167,46,-52,-53,-167,-167,-110,99,109,46,46,-167,-167,-167,-167,-165,-57,-51,46,-54,46,-146,46,-51,46,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,46,46,46,46,-166,-55,-167,-147,-167,-100,46,46,-167,-167,-109,-167,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,46,46,-167,-167,-167,-167,-167,46,46,-167,-167,-167,-167,-65,46,46,46,46,46,-66,46,-167,-167,-167,-167,-84,-85,46,-167,-167,-106,-167,-167,-74,-75,-92,-94,-86,-87,-108,-167,-167,-167,-167,-167,-76,-77,-82,-83,-167,-93,-167,-167,-167,-88,-89,-107,-167,46,46,46,-167,-167,46,-167,46,46,46,-167,-167,-80,-81,46,-167,-78,-79,-90,-91,]),'LESS':([0,9,10,12,13,14,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,33,34,36,39,40,43,44,60,61,62,63,64,65,73,74,75,76,77,80,81,86,87,88,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,134,135,136,137,138,139,140,143,145,147,150,151,155,156,157,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,198,199,200,201,202,207,208,209,210,217,218,222,223,224,225,226,227,228,231,237,238,239,240,241,242,247,251,252,253,254,256,263,264,273,278,283,284,289,291,292,293,295,296,297,298,299,300,301,304,308,309,310,312,313,314,315,316,317,318,319,320,323,326,327,328,329,330,331,335,336,337,341,343,344,345,346,],[47,47,47,-164,47,47,-56,-63,-64,-167,-167,-67,-68,-69,-70,-71,-72,-73,-51,-167,47,-52,-53,-167,-167,-110,100,110,47,47,-167,-167,-167,-167,-165,-57,-51,47,-54,47,-146,47,-51,47,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,47,47,47,47,-166,-55,-167,-147,-167,-100,47,47,-167,-167,-109,-167,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,47,47,-167,-167,-167,-167,-167,47,47,-167,-167,-167,-167,-65,47,47,47,47,47,-66,47,-167,-167,-167,-167,-84,-85,47,-167,-167,-106,-167,-167,-74,-75,-92,-94,-86,-87,-108,-167,-167,-167,-167,-167,-76,-77,-82,-83,-167,-93,-167,-167,-167,-88,-89,-107,-167,47,47,47,-167,-167,47,-167,47,47,47,-167,-167,-80,-81,47,-167,-78,-79,-90,-91,]),'GREATER_GREATER':([0,9,10,12,13,14,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,33,34,36,39,40,43,44,60,61,62,63,64,65,73,74,75,76,77,80,81,86,87,88,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,134,135,136,137,138,139,140,143,145,147,150,151,155,156,157,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,198,199,200,201,202,207,208,209,210,217,218,222,223,224,225,226,227,228,231,237,238,239,240,241,242,247,251,252,253,254,256,263,264,273,278,283,284,289,291,292,293,295,296,297,298,299,300,301,304,308,309,310,312,313,314,315,316,317,318,319,320,323,326,327,328,329,330,331,335,336,337,341,343,344,345,346,],[48,48,48,-164,48,48,-56,-63,-64,-167,-167,-67,-68,-69,-70,-71,-72,-73,-51,-167,48,-52,-53,-167,-167,-110,101,111,48,48,-167,-167,-167,-167,-165,-57,-51,48,-54,48,-146,48,-51,48,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,48,48,48,48,-166,-55,-167,-147,-167,-100,48,48,-167,-167,-109,-167,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,48,48,-167,-167,-167,-167,-167,48,48,-167,-167,-167,-167,-65,48,48,48,48,48,-66,48,-167,-167,-167,-167,-84,-85,48,-167,-167,-106,-167,-167,-74,-75,-92,-94,-86,-87,-108,-167,-167,-167,-167,-167,-76,-77,-82,-83,-167,-93,-167,-167,-167,-88,-89,-107,-167,48,48,48,-167,-167,48,-167,48,48,48,-167,-167,-80,-81,48,-167,-78,-79,-90,-91,]),'GREATER_BAR':([0,9,10,12,13,14,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,33,34,36,39,40,43,44,60,61,62,63,64,65,73,74,75,76,77,80,81,86,87,88,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,134,135,136,137,138,139,140,143,145,147,150,151,155,156,157,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,198,199,200,201,202,207,208,209,210,217,218,222,223,224,225,226,227,228,231,237,238,239,240,241,242,247,251,252,253,254,256,263,264,273,278,283,284,289,291,292,293,295,296,297,298,299,300,301,304,308,309,310,312,313,314,315,316,317,318,319,320,323,326,327,328,329,330,331,335,336,337,341,343,344,345,346,],[49,49,49,-164,49,49,-56,-63,-64,-167,-167,-67,-68,-69,-70,-71,-72,-73,-51,-167,49,-52,-53,-167,-167,-110,102,112,49,49,-167,-167,-167,-167,-165,-57,-51,49,-54,49,-146,49,-51,49,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,49,49,49,49,-166,-55,-167,-147,-167,-100,49,49,-167,-167,-109,-167,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,49,49,-167,-167,-167,-167,-167,49,49,-167,-167,-167,-167,-65,49,49,49,49,49,-66,49,-167,-167,-167,-167,-84,-85,49,-167,-167,-106,-167,-167,-74,-75,-92,-94,-86,-87,-108,-167,-167,-167,-167,-167,-76,-77,-82,-83,-167,-93,-167,-167,-167,-88,-89,-107,-167,49,49,49,-167,-167,49,-167,49,49,49,-167,-167,-80,-81,49,-167,-78,-79,-90,-91,]),'LESS_GREATER':([0,9,10,12,13,14,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,33,34,36,39,40,43,44,60,61,62,63,64,65,73,74,75,76,77,80,81,86,87,88,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,134,135,136,137,138,139,140,143,145,147,150,151,155,156,157,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,198,199,200,201,202,207,208,209,210,217,218,222,223,224,225,226,227,228,231,237,238,239,240,241,242,247,251,252,253,254,256,263,264,273,278,283,284,289,291,292,293,295,296,297,298,299,300,301,304,308,309,310,312,313,314,315,316,317,318,319,320,323,326,327,328,329,330,331,335,336,337,341,343,344,345,346,],[50,50,50,-164,50,50,-56,-63,-64,-167,-167,-67,-68,-69,-70,-71,-72,-73,-51,-167,50,-52,-53,-167,-167,-110,103,113,50,50,-167,-167,-167,-167,-165,-57,-51,50,-54,50,-146,50,-51,50,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,50,50,50,50,-166,-55,-167,-147,-167,-100,50,50,-167,-167,-109,-167,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,50,50,-167,-167,-167,-167,-167,50,50,-167,-167,-167,-167,-65,50,50,50,50,50,-66,50,-167,-167,-167,-167,-84,-85,50,-167,-167,-106,-167,-167,-74,-75,-92,-94,-86,-87,-108,-167,-167,-167,-167,-167,-76,-77,-82,-83,-167,-93,-167,-167,-167,-88,-89,-107,-167,50,50,50,-167,-167,50,-167,50,50,50,-167,-167,-80,-81,50,-167,-78,-79,-90,-91,]),'LESS_LESS_LESS':([0,9,10,12,13,14,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,33,34,36,39,40,43,44,60,61,62,63,64,65,73,74,75,76,77,80,81,86,87,88,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,134,135,136,137,138,139,140,143,145,147,150,151,155,156,157,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,198,199,200,201,202,207,208,209,210,217,218,222,223,224,225,226,227,228,231,237,238,239,240,241,242,247,251,252,253,254,256,263,264,273,278,283,284,289,291,292,293,295,296,297,298,299,300,301,304,308,309,310,312,313,314,315,316,317,318,319,320,323,326,327,328,329,330,331,335,336,337,341,343,344,345,346,],[51,51,51,-164,51,51,-56,-63,-64,-167,-167,-67,-68,-69,-70,-71,-72,-73,-51,-167,51,-52,-53,-167,-167,-110,104,114,51,51,-167,-167,-167,-167,-165,-57,-51,51,-54,51,-146,51,-51,51,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,51,51,51,51,-166,-55,-167,-147,-167,-100,51,51,-167,-167,-109,-167,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,51,51,-167,-167,-167,-167,-167,51,51,-167,-167,-167,-167,-65,51,51,51,51,51,-66,51,-167,-167,-167,-167,-84,-85,51,-167,-167,-106,-167,-167,-74,-75,-92,-94,-86,-87,-108,-167,-167,-167,-167,-167,-76,-77,-82,-83,-167,-93,-167,-167,-167,-88,-89,-107,-167,51,51,51,-167,-167,51,-167,51,51,51,-167,-167,-80,-81,51,-167,-78,-79,-90,-91,]),'LESS_AND':([0,9,10,12,13,14,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,33,34,36,39,40,43,44,60,61,62,63,64,65,73,74,75,76,77,80,81,86,87,88,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,134,135,136,137,138,139,140,143,145,147,150,151,155,156,157,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,198,199,200,201,202,207,208,209,210,217,218,222,223,224,225,226,227,228,231,237,238,239,240,241,242,247,251,252,253,254,256,263,264,273,278,283,284,289,291,292,293,295,296,297,298,299,300,301,304,308,309,310,312,313,314,315,316,317,318,319,320,323,326,327,328,329,330,331,335,336,337,341,343,344,345,346,],[52,52,52,-164,52,52,-56,-63,-64,-167,-167,-67,-68,-69,-70,-71,-72,-73,-51,-167,52,-52,-53,-167,-167,-110,105,115,52,52,-167,-167,-167,-167,-165,-57,-51,52,-54,52,-146,52,-51,52,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,52,52,52,52,-166,-55,-167,-147,-167,-100,52,52,-167,-167,-109,-167,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,52,52,-167,-167,-167,-167,-167,52,52,-167,-167,-167,-167,-65,52,52,52,52,52,-66,52,-167,-167,-167,-167,-84,-85,52,-167,-167,-106,-167,-167,-74,-75,-92,-94,-86,-87,-108,-167,-167,-167,-167,-167,-76,-77,-82,-83,-167,-93,-167,-167,-167,-88,-89,-107,-167,52,52,52,-167,-167,52,-167,52,52,52,-167,-167,-80,-81,52,-167,-78,-79,-90,-91,]),'GREATER_AND':([0,9,10,12,13,14,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,33,34,36,39,40,43,44,60,61,62,63,64,65,73,74,75,76,77,80,81,86,87,88,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,134,135,136,137,138,139,140,143,145,147,150,151,155,156,157,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,198,199,200,201,202,207,208,209,210,217,218,222,223,224,225,226,227,228,231,237,238,239,240,241,242,247,251,252,253,254,256,263,264,273,278,283,284,289,291,292,293,295,296,297,298,299,300,301,304,308,309,310,312,313,314,315,316,317,318,319,320,323,326,327,328,329,330,331,335,336,337,341,343,344,345,346,],[53,53,53,-164,53,53,-56,-63,-64,-167,-167,-67,-68,-69,-70,-71,-72,-73,-51,-167,53,-52,-53,-167,-167,-110,106,116,53,53,-167,-167,-167,-167,-165,-57,-51,53,-54,53,-146,53,-51,53,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,53,53,53,53,-166,-55,-167,-147,-167,-100,53,53,-167,-167,-109,-167,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,53,53,-167,-167,-167,-167,-167,53,53,-167,-167,-167,-167,-65,53,53,53,53,53,-66,53,-167,-167,-167,-167,-84,-85,53,-167,-167,-106,-167,-167,-74,-75,-92,-94,-86,-87,-108,-167,-167,-167,-167,-167,-76,-77,-82,-83,-167,-93,-167,-167,-167,-88,-89,-107,-167,53,53,53,-167,-167,53,-167,53,53,53,-167,-167,-80,-81,53,-167,-78,-79,-90,-91,]),'AND_GREATER':([0,9,10,12,13,14,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,33,34,36,39,40,60,61,62,63,64,65,73,74,75,76,77,80,81,86,87,88,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,134,135,136,137,138,139,140,143,145,147,150,151,155,156,157,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,198,199,200,201,202,207,208,209,210,217,218,222,223,224,225,226,227,228,231,237,238,239,240,241,242,247,251,252,253,254,256,263,264,273,278,283,284,289,291,292,293,295,296,297,298,299,300,301,304,308,309,310,312,313,314,315,316,317,318,319,320,323,326,327,328,329,330,331,335,336,337,341,343,344,345,346,],[54,54,54,-164,54,54,-56,-63,-64,-167,-167,-67,-68,-69,-70,-71,-72,-73,-51,-167,54,-52,-53,-167,-167,-110,54,54,-167,-167,-167,-167,-165,-57,-51,54,-54,54,-146,54,-51,54,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,54,54,54,54,-166,-55,-167,-147,-167,-100,54,54,-167,-167,-109,-167,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,54,54,-167,-167,-167,-167,-167,54,54,-167,-167,-167,-167,-65,54,54,54,54,54,-66,54,-167,-167,-167,-167,-84,-85,54,-167,-167,-106,-167,-167,-74,-75,-92,-94,-86,-87,-108,-167,-167,-167,-167,-167,-76,-77,-82,-83,-167,-93,-167,-167,-167,-88,-89,-107,-167,54,54,54,-167,-167,54,-167,54,54,54,-167,-167,-80,-81,54,-167,-78,-79,-90,-91,]),'AND_GREATER_GREATER':([0,9,10,12,13,14,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,33,34,36,39,40,60,61,62,63,64,65,73,74,75,76,77,80,81,86,87,88,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,134,135,136,137,138,139,140,143,145,147,150,151,155,156,157,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,198,199,200,201,202,207,208,209,210,217,218,222,223,224,225,226,227,228,231,237,238,239,240,241,242,247,251,252,253,254,256,263,264,273,278,283,284,289,291,292,293,295,296,297,298,299,300,301,304,308,309,310,312,313,314,315,316,317,318,319,320,323,326,327,328,329,330,331,335,336,337,341,343,344,345,346,],[55,55,55,-164,55,55,-56,-63,-64,-167,-167,-67,-68,-69,-70,-71,-72,-73,-51,-167,55,-52,-53,-167,-167,-110,55,55,-167,-167,-167,-167,-165,-57,-51,55,-54,55,-146,55,-51,55,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,55,55,55,55,-166,-55,-167,-147,-167,-100,55,55,-167,-167,-109,-167,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,55,55,-167,-167,-167,-167,-167,55,55,-167,-167,-167,-167,-65,55,55,55,55,55,-66,55,-167,-167,-167,-167,-84,-85,55,-167,-167,-106,-167,-167,-74,-75,-92,-94,-86,-87,-108,-167,-167,-167,-167,-167,-76,-77,-82,-83,-167,-93,-167,-167,-167,-88,-89,-107,-167,55,55,55,-167,-167,55,-167,55,55,55,-167,-167,-80,-81,55,-167,-78,-79,-90,-91,]),'$end':([1,3,5,56,57,58,59,],[0,-2,-4,-1,-141,-142,-3,]),'AMPERSAND':([6,7,8,11,13,14,15,16,17,18,19,22,23,24,25,26,27,28,29,33,34,40,66,67,68,69,70,71,72,74,75,76,77,86,87,88,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,139,141,144,147,150,151,157,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,193,194,195,196,206,207,208,222,228,229,231,241,242,253,257,258,259,260,261,262,263,264,273,278,282,283,284,289,297,298,299,300,304,312,313,314,335,336,343,344,345,346,],[60,-155,-156,-163,-58,-59,-61,-62,-56,-63,-64,-67,-68,-69,-70,-71,-72,-73,-51,-52,-53,-110,-157,-160,-143,-144,-145,-158,-159,-57,-51,-60,-54,-101,-51,-105,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,-153,-154,-55,200,-140,-100,-102,-103,-109,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,-151,-152,-161,-162,-97,-98,-104,-65,-66,-95,-99,-84,-85,-106,-135,-136,-137,-138,-139,-96,-74,-75,-92,-94,309,-86,-87,-108,-76,-77,-82,-83,-93,-88,-89,-107,-80,-81,-78,-79,-90,-91,]),'SEMICOLON':([6,7,8,9,10,11,12,13,14,15,16,17,18,19,22,23,24,25,26,27,28,29,33,34,40,66,67,68,69,70,71,72,73,74,75,76,77,86,87,88,89,90,93,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,138,139,141,144,147,150,151,157,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,193,194,195,196,206,207,208,211,222,228,229,231,234,235,241,242,250,253,257,258,259,260,261,262,263,264,265,273,278,282,283,284,289,297,298,299,300,304,312,313,314,335,336,343,344,345,346,],[61,-155,-156,69,69,-163,-164,-58,-59,-61,-62,-56,-63,-64,-67,-68,-69,-70,-71,-72,-73,-51,-52,-53,-110,-157,-160,-143,-144,-145,-158,-159,-165,-57,-51,-60,-54,-101,-51,-105,153,69,160,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,-153,-154,-166,-55,201,-140,-100,-102,-103,-109,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,-151,-152,-161,-162,-97,-98,-104,69,-65,-66,-95,-99,-5,69,-84,-85,69,-106,-135,-136,-137,-138,-139,-96,-74,-75,-6,-92,-94,310,-86,-87,-108,-76,-77,-82,-83,-93,-88,-89,-107,-80,-81,-78,-79,-90,-91,]),'AND_AND':([6,7,8,11,13,14,15,16,17,18,19,22,23,24,25,26,27,28,29,33,34,40,66,67,68,69,70,71,72,74,75,76,77,86,87,88,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,139,141,144,147,150,151,157,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,193,194,195,196,206,207,208,222,228,229,231,241,242,253,257,258,259,260,261,262,263,264,273,278,282,283,284,289,297,298,299,300,304,312,313,314,335,336,343,344,345,346,],[62,-155,-156,-163,-58,-59,-61,-62,-56,-63,-64,-67,-68,-69,-70,-71,-72,-73,-51,-52,-53,-110,-157,-160,-143,-144,-145,-158,-159,-57,-51,-60,-54,-101,-51,-105,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,62,62,-55,198,-140,-100,-102,-103,-109,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,-151,-152,-161,-162,-97,-98,-104,-65,-66,-95,-99,-84,-85,-106,-135,-136,198,198,198,-96,-74,-75,-92,-94,198,-86,-87,-108,-76,-77,-82,-83,-93,-88,-89,-107,-80,-81,-78,-79,-90,-91,]),'OR_OR':([6,7,8,11,13,14,15,16,17,18,19,22,23,24,25,26,27,28,29,33,34,40,66,67,68,69,70,71,72,74,75,76,77,86,87,88,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,139,141,144,147,150,151,157,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,193,194,195,196,206,207,208,222,228,229,231,241,242,253,257,258,259,260,261,262,263,264,273,278,282,283,284,289,297,298,299,300,304,312,313,314,335,336,343,344,345,346,],[63,-155,-156,-163,-58,-59,-61,-62,-56,-63,-64,-67,-68,-69,-70,-71,-72,-73,-51,-52,-53,-110,-157,-160,-143,-144,-145,-158,-159,-57,-51,-60,-54,-101,-51,-105,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,63,63,-55,199,-140,-100,-102,-103,-109,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,-151,-152,-161,-162,-97,-98,-104,-65,-66,-95,-99,-84,-85,-106,-135,-136,199,199,199,-96,-74,-75,-92,-94,199,-86,-87,-108,-76,-77,-82,-83,-93,-88,-89,-107,-80,-81,-78,-79,-90,-91,]),'DO':([8,11,13,14,15,16,17,18,19,22,23,24,25,26,27,28,29,33,34,40,66,67,68,69,70,71,72,74,75,76,77,78,79,81,82,86,87,88,89,90,93,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,139,141,142,143,144,147,150,151,152,153,154,157,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,195,196,200,201,202,206,207,208,212,213,220,222,225,226,227,228,229,231,236,241,242,253,257,258,259,260,261,262,263,264,266,267,273,278,283,284,285,289,294,297,298,299,300,304,311,312,313,314,335,336,343,344,345,346,],[-156,-163,-58,-59,-61,-62,-56,-63,-64,-67,-68,-69,-70,-71,-72,-73,-51,-52,-53,-110,-157,-160,-143,-144,-145,-158,-159,-57,-51,-60,-54,140,-130,-146,145,-101,-51,-105,-167,155,-167,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,-55,-131,-129,-147,-140,-100,-102,-103,209,-167,-167,-109,217,-167,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,-161,-162,-167,-167,-167,-97,-98,-104,237,239,251,-65,-133,-134,-132,-66,-95,-99,-167,-84,-85,-106,-135,-136,-137,-138,-139,-96,-74,-75,-167,295,-92,-94,-86,-87,-167,-108,319,-76,-77,-82,-83,-93,330,-88,-89,-107,-80,-81,-78,-79,-90,-91,]),'RIGHT_PAREN':([8,11,13,14,15,16,17,18,19,22,23,24,25,26,27,28,29,33,34,40,66,67,68,69,70,71,72,74,75,76,77,79,81,83,84,86,87,88,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,139,141,142,143,144,147,148,150,151,157,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,195,196,200,201,202,206,207,208,222,225,226,227,228,229,231,241,242,253,257,258,259,260,261,262,263,264,272,273,274,278,283,284,289,297,298,299,300,303,304,312,313,314,325,335,336,343,344,345,346,],[-156,-163,-58,-59,-61,-62,-56,-63,-64,-67,-68,-69,-70,-71,-72,-73,-51,-52,-53,-110,-157,-160,-143,-144,-145,-158,-159,-57,-51,-60,-54,-130,-146,146,147,-101,-51,-105,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,-55,-131,-129,-147,-140,-100,205,-102,-103,-109,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,-161,-162,-167,-167,-167,-97,-98,-104,-65,-133,-134,-132,-66,-95,-99,-84,-85,-106,-135,-136,-137,-138,-139,-96,-74,-75,-127,-92,301,-94,-86,-87,-108,-76,-77,-82,-83,326,-93,-88,-89,-107,-128,-80,-81,-78,-79,-90,-91,]),'RIGHT_CURLY':([8,11,13,14,15,16,17,18,19,22,23,24,25,26,27,28,29,33,34,40,66,67,68,69,70,71,72,74,75,76,77,79,81,86,87,88,91,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,139,141,142,143,144,147,150,151,157,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,195,196,200,201,202,206,207,208,215,222,225,226,227,228,229,231,233,241,242,249,253,257,258,259,260,261,262,263,264,269,271,273,278,283,284,287,289,297,298,299,300,304,308,309,310,312,313,314,322,327,328,329,334,335,336,340,343,344,345,346,],[-156,-163,-58,-59,-61,-62,-56,-63,-64,-67,-68,-69,-70,-71,-72,-73,-51,-52,-53,-110,-157,-160,-143,-144,-145,-158,-159,-57,-51,-60,-54,-130,-146,-101,-51,-105,157,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,-55,-131,-129,-147,-140,-100,-102,-103,-109,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,-161,-162,-167,-167,-167,-97,-98,-104,242,-65,-133,-134,-132,-66,-95,-99,264,-84,-85,284,-106,-135,-136,-137,-138,-139,-96,-74,-75,298,300,-92,-94,-86,-87,313,-108,-76,-77,-82,-83,-93,-167,-167,-167,-88,-89,-107,336,-132,-133,-134,344,-80,-81,346,-78,-79,-90,-91,]),'THEN':([8,11,13,14,15,16,17,18,19,22,23,24,25,26,27,28,29,33,34,40,66,67,68,69,70,71,72,74,75,76,77,79,81,86,87,88,94,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,139,141,142,143,144,147,150,151,157,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,195,196,200,201,202,206,207,208,222,225,226,227,228,229,231,241,242,253,257,258,259,260,261,262,263,264,273,278,283,284,289,290,297,298,299,300,304,312,313,314,335,336,343,344,345,346,],[-156,-163,-58,-59,-61,-62,-56,-63,-64,-67,-68,-69,-70,-71,-72,-73,-51,-52,-53,-110,-157,-160,-143,-144,-145,-158,-159,-57,-51,-60,-54,-130,-146,-101,-51,-105,161,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,-55,-131,-129,-147,-140,-100,-102,-103,-109,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,-161,-162,-167,-167,-167,-97,-98,-104,-65,-133,-134,-132,-66,-95,-99,-84,-85,-106,-135,-136,-137,-138,-139,-96,-74,-75,-92,-94,-86,-87,-108,315,-76,-77,-82,-83,-93,-88,-89,-107,-80,-81,-78,-79,-90,-91,]),'DONE':([8,11,13,14,15,16,17,18,19,22,23,24,25,26,27,28,29,33,34,40,66,67,68,69,70,71,72,74,75,76,77,79,81,86,87,88,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,139,141,142,143,144,147,150,151,157,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,195,196,197,200,201,202,203,206,207,208,214,222,225,226,227,228,229,231,232,241,242,248,253,257,258,259,260,261,262,263,264,268,270,273,278,283,284,286,289,297,298,299,300,304,308,309,310,312,313,314,321,327,328,329,333,335,336,339,343,344,345,346,],[-156,-163,-58,-59,-61,-62,-56,-63,-64,-67,-68,-69,-70,-71,-72,-73,-51,-52,-53,-110,-157,-160,-143,-144,-145,-158,-159,-57,-51,-60,-54,-130,-146,-101,-51,-105,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,-55,-131,-129,-147,-140,-100,-102,-103,-109,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,-161,-162,222,-167,-167,-167,228,-97,-98,-104,241,-65,-133,-134,-132,-66,-95,-99,263,-84,-85,283,-106,-135,-136,-137,-138,-139,-96,-74,-75,297,299,-92,-94,-86,-87,312,-108,-76,-77,-82,-83,-93,-167,-167,-167,-88,-89,-107,335,-132,-133,-134,343,-80,-81,345,-78,-79,-90,-91,]),'FI':([8,11,13,14,15,16,17,18,19,22,23,24,25,26,27,28,29,33,34,40,66,67,68,69,70,71,72,74,75,76,77,79,81,86,87,88,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,139,141,142,143,144,147,150,151,157,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,195,196,200,201,202,206,207,208,221,222,225,226,227,228,229,231,241,242,253,255,257,258,259,260,261,262,263,264,273,278,283,284,288,289,297,298,299,300,304,312,313,314,332,335,336,342,343,344,345,346,347,],[-156,-163,-58,-59,-61,-62,-56,-63,-64,-67,-68,-69,-70,-71,-72,-73,-51,-52,-53,-110,-157,-160,-143,-144,-145,-158,-159,-57,-51,-60,-54,-130,-146,-101,-51,-105,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,-55,-131,-129,-147,-140,-100,-102,-103,-109,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,-161,-162,-167,-167,-167,-97,-98,-104,253,-65,-133,-134,-132,-66,-95,-99,-84,-85,-106,289,-135,-136,-137,-138,-139,-96,-74,-75,-92,-94,-86,-87,314,-108,-76,-77,-82,-83,-93,-88,-89,-107,-112,-80,-81,-114,-78,-79,-90,-91,-113,]),'ELSE':([8,11,13,14,15,16,17,18,19,22,23,24,25,26,27,28,29,33,34,40,66,67,68,69,70,71,72,74,75,76,77,79,81,86,87,88,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,139,141,142,143,144,147,150,151,157,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,195,196,200,201,202,206,207,208,221,222,225,226,227,228,229,231,241,242,253,257,258,259,260,261,262,263,264,273,278,283,284,289,297,298,299,300,304,312,313,314,332,335,336,343,344,345,346,],[-156,-163,-58,-59,-61,-62,-56,-63,-64,-67,-68,-69,-70,-71,-72,-73,-51,-52,-53,-110,-157,-160,-143,-144,-145,-158,-159,-57,-51,-60,-54,-130,-146,-101,-51,-105,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,-55,-131,-129,-147,-140,-100,-102,-103,-109,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,-161,-162,-167,-167,-167,-97,-98,-104,254,-65,-133,-134,-132,-66,-95,-99,-84,-85,-106,-135,-136,-137,-138,-139,-96,-74,-75,-92,-94,-86,-87,-108,-76,-77,-82,-83,-93,-88,-89,-107,341,-80,-81,-78,-79,-90,-91,]),'ELIF':([8,11,13,14,15,16,17,18,19,22,23,24,25,26,27,28,29,33,34,40,66,67,68,69,70,71,72,74,75,76,77,79,81,86,87,88,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,139,141,142,143,144,147,150,151,157,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,195,196,200,201,202,206,207,208,221,222,225,226,227,228,229,231,241,242,253,257,258,259,260,261,262,263,264,273,278,283,284,289,297,298,299,300,304,312,313,314,332,335,336,343,344,345,346,],[-156,-163,-58,-59,-61,-62,-56,-63,-64,-67,-68,-69,-70,-71,-72,-73,-51,-52,-53,-110,-157,-160,-143,-144,-145,-158,-159,-57,-51,-60,-54,-130,-146,-101,-51,-105,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,-55,-131,-129,-147,-140,-100,-102,-103,-109,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,-161,-162,-167,-167,-167,-97,-98,-104,256,-65,-133,-134,-132,-66,-95,-99,-84,-85,-106,-135,-136,-137,-138,-139,-96,-74,-75,-92,-94,-86,-87,-108,-76,-77,-82,-83,-93,-88,-89,-107,256,-80,-81,-78,-79,-90,-91,]),'SEMI_SEMI':([8,11,13,14,15,16,17,18,19,22,23,24,25,26,27,28,29,33,34,40,66,67,68,69,70,71,72,74,75,76,77,79,81,86,87,88,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,139,141,142,143,144,147,150,151,157,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,195,196,200,201,202,206,207,208,222,225,226,227,228,229,231,241,242,246,253,257,258,259,260,261,262,263,264,273,277,278,283,284,289,297,298,299,300,301,304,312,313,314,323,324,326,335,336,337,338,343,344,345,346,],[-156,-163,-58,-59,-61,-62,-56,-63,-64,-67,-68,-69,-70,-71,-72,-73,-51,-52,-53,-110,-157,-160,-143,-144,-145,-158,-159,-57,-51,-60,-54,-130,-146,-101,-51,-105,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,-55,-131,-129,-147,-140,-100,-102,-103,-109,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,-161,-162,-167,-167,-167,-97,-98,-104,-65,-133,-134,-132,-66,-95,-99,-84,-85,279,-106,-135,-136,-137,-138,-139,-96,-74,-75,-92,305,-94,-86,-87,-108,-76,-77,-82,-83,-167,-93,-88,-89,-107,-118,-117,-167,-80,-81,-120,-119,-78,-79,-90,-91,]),'SEMI_AND':([8,11,13,14,15,16,17,18,19,22,23,24,25,26,27,28,29,33,34,40,66,67,68,69,70,71,72,74,75,76,77,79,81,86,87,88,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,139,141,142,143,144,147,150,151,157,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,195,196,200,201,202,206,207,208,222,225,226,227,228,229,231,241,242,246,253,257,258,259,260,261,262,263,264,273,277,278,283,284,289,297,298,299,300,301,304,312,313,314,323,324,326,335,336,337,338,343,344,345,346,],[-156,-163,-58,-59,-61,-62,-56,-63,-64,-67,-68,-69,-70,-71,-72,-73,-51,-52,-53,-110,-157,-160,-143,-144,-145,-158,-159,-57,-51,-60,-54,-130,-146,-101,-51,-105,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,-55,-131,-129,-147,-140,-100,-102,-103,-109,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,-161,-162,-167,-167,-167,-97,-98,-104,-65,-133,-134,-132,-66,-95,-99,-84,-85,280,-106,-135,-136,-137,-138,-139,-96,-74,-75,-92,306,-94,-86,-87,-108,-76,-77,-82,-83,-167,-93,-88,-89,-107,-118,-117,-167,-80,-81,-120,-119,-78,-79,-90,-91,]),'SEMI_SEMI_AND':([8,11,13,14,15,16,17,18,19,22,23,24,25,26,27,28,29,33,34,40,66,67,68,69,70,71,72,74,75,76,77,79,81,86,87,88,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,139,141,142,143,144,147,150,151,157,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,195,196,200,201,202,206,207,208,222,225,226,227,228,229,231,241,242,246,253,257,258,259,260,261,262,263,264,273,277,278,283,284,289,297,298,299,300,301,304,312,313,314,323,324,326,335,336,337,338,343,344,345,346,],[-156,-163,-58,-59,-61,-62,-56,-63,-64,-67,-68,-69,-70,-71,-72,-73,-51,-52,-53,-110,-157,-160,-143,-144,-145,-158,-159,-57,-51,-60,-54,-130,-146,-101,-51,-105,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,-55,-131,-129,-147,-140,-100,-102,-103,-109,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,-161,-162,-167,-167,-167,-97,-98,-104,-65,-133,-134,-132,-66,-95,-99,-84,-85,281,-106,-135,-136,-137,-138,-139,-96,-74,-75,-92,307,-94,-86,-87,-108,-76,-77,-82,-83,-167,-93,-88,-89,-107,-118,-117,-167,-80,-81,-120,-119,-78,-79,-90,-91,]),'ESAC':([8,11,13,14,15,16,17,18,19,22,23,24,25,26,27,28,29,33,34,40,66,67,68,69,70,71,72,74,75,76,77,79,81,86,87,88,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,139,141,142,143,144,147,150,151,157,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,195,196,200,201,202,206,207,208,216,222,225,226,227,228,229,231,241,242,243,244,245,246,253,257,258,259,260,261,262,263,264,273,276,277,278,279,280,281,283,284,289,297,298,299,300,301,304,305,306,307,312,313,314,323,324,326,335,336,337,338,343,344,345,346,],[-156,-163,-58,-59,-61,-62,-56,-63,-64,-67,-68,-69,-70,-71,-72,-73,-51,-52,-53,-110,-157,-160,-143,-144,-145,-158,-159,-57,-51,-60,-54,-130,-146,-101,-51,-105,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,-55,-131,-129,-147,-140,-100,-102,-103,-109,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,-161,-162,-167,-167,-167,-97,-98,-104,-167,-65,-133,-134,-132,-66,-95,-99,-84,-85,273,-167,278,-115,-106,-135,-136,-137,-138,-139,-96,-74,-75,-92,304,-116,-94,-121,-123,-125,-86,-87,-108,-76,-77,-82,-83,-167,-93,-122,-124,-126,-88,-89,-107,-118,-117,-167,-80,-81,-120,-119,-78,-79,-90,-91,]),'BAR':([8,11,13,14,15,16,17,18,19,22,23,24,25,26,27,28,29,33,34,40,74,75,76,77,86,87,88,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,139,147,150,151,157,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,195,196,206,207,208,222,228,229,231,241,242,253,262,263,264,272,273,274,278,283,284,289,297,298,299,300,303,304,312,313,314,325,335,336,343,344,345,346,],[64,-163,-58,-59,-61,-62,-56,-63,-64,-67,-68,-69,-70,-71,-72,-73,-51,-52,-53,-110,-57,-51,-60,-54,-101,-51,-105,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,-55,-100,-102,-103,-109,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,64,64,-97,-98,-104,-65,-66,-95,-99,-84,-85,-106,-96,-74,-75,-127,-92,302,-94,-86,-87,-108,-76,-77,-82,-83,302,-93,-88,-89,-107,-128,-80,-81,-78,-79,-90,-91,]),'BAR_AND':([8,11,13,14,15,16,17,18,19,22,23,24,25,26,27,28,29,33,34,40,74,75,76,77,86,87,88,96,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,139,147,150,151,157,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,195,196,206,207,208,222,228,229,231,241,242,253,262,263,264,273,278,283,284,289,297,298,299,300,304,312,313,314,335,336,343,344,345,346,],[65,-163,-58,-59,-61,-62,-56,-63,-64,-67,-68,-69,-70,-71,-72,-73,-51,-52,-53,-110,-57,-51,-60,-54,-101,-51,-105,-7,-10,-13,-14,-19,-22,-25,-28,-31,-37,-46,-34,-40,-43,-49,-50,-55,-100,-102,-103,-109,-111,-8,-11,-15,-16,-20,-23,-26,-29,-32,-38,-47,-35,-41,-44,-9,-12,-17,-18,-21,-24,-27,-30,-33,-39,-48,-36,-42,-45,65,65,-97,-98,-104,-65,-66,-95,-99,-84,-85,-106,-96,-74,-75,-92,-94,-86,-87,-108,-76,-77,-82,-83,-93,-88,-89,-107,-80,-81,-78,-79,-90,-91,]),'TIMEOPT':([12,],[73,]),'ARITH_FOR_EXPRS':([35,],[90,]),'COND_CMD':([41,],[95,]),'DASH':([52,53,105,106,115,116,],[126,129,173,176,187,190,]),'TIMEIGN':([73,],[138,]),'IN':([81,89,92,93,143,152,158,159,],[-146,-167,-167,-167,-147,211,216,219,]),'COND_END':([95,],[162,]),}
+
+_lr_action = { }
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = { }
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'inputunit':([0,],[1,]),'simple_list':([0,],[2,]),'simple_list1':([0,60,61,134,135,191,192,],[6,132,133,193,194,132,133,]),'pipeline_command':([0,9,10,60,61,80,134,135,191,192,223,224,225,226,227,247,316,317,318,323,327,328,329,337,],[7,66,71,7,7,144,7,7,7,7,144,144,144,144,144,144,144,144,144,144,144,144,144,144,]),'pipeline':([0,9,10,60,61,80,134,135,136,137,191,192,223,224,225,226,227,247,316,317,318,323,327,328,329,337,],[8,8,8,8,8,8,8,8,195,196,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'timespec':([0,9,10,60,61,80,134,135,191,192,223,224,225,226,227,247,316,317,318,323,327,328,329,337,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'command':([0,9,10,60,61,80,134,135,136,137,191,192,223,224,225,226,227,247,316,317,318,323,327,328,329,337,],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'simple_command':([0,9,10,32,60,61,80,134,135,136,137,191,192,223,224,225,226,227,247,316,317,318,323,327,328,329,337,],[13,13,13,88,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'shell_command':([0,9,10,32,60,61,80,87,134,135,136,137,149,191,192,204,223,224,225,226,227,230,247,316,317,318,323,327,328,329,337,],[14,14,14,86,14,14,14,151,14,14,14,14,207,14,14,207,14,14,14,14,14,207,14,14,14,14,14,14,14,14,14,]),'function_def':([0,9,10,60,61,80,134,135,136,137,191,192,223,224,225,226,227,247,316,317,318,323,327,328,329,337,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'coproc':([0,9,10,60,61,80,134,135,136,137,191,192,223,224,225,226,227,247,316,317,318,323,327,328,329,337,],[16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'simple_command_element':([0,9,10,13,32,60,61,80,88,134,135,136,137,191,192,223,224,225,226,227,247,316,317,318,323,327,328,329,337,],[17,17,17,74,17,17,17,17,74,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'for_command':([0,9,10,32,60,61,80,87,134,135,136,137,149,191,192,204,223,224,225,226,227,230,247,316,317,318,323,327,328,329,337,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'case_command':([0,9,10,32,60,61,80,87,134,135,136,137,149,191,192,204,223,224,225,226,227,230,247,316,317,318,323,327,328,329,337,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'select_command':([0,9,10,32,60,61,80,87,134,135,136,137,149,191,192,204,223,224,225,226,227,230,247,316,317,318,323,327,328,329,337,],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,]),'if_command':([0,9,10,32,60,61,80,87,134,135,136,137,149,191,192,204,223,224,225,226,227,230,247,316,317,318,323,327,328,329,337,],[23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,]),'subshell':([0,9,10,32,60,61,80,87,134,135,136,137,149,191,192,204,223,224,225,226,227,230,247,316,317,318,323,327,328,329,337,],[24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,]),'group_command':([0,9,10,32,60,61,80,87,134,135,136,137,149,191,192,204,223,224,225,226,227,230,247,316,317,318,323,327,328,329,337,],[25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,]),'arith_command':([0,9,10,32,60,61,80,87,134,135,136,137,149,191,192,204,223,224,225,226,227,230,247,316,317,318,323,327,328,329,337,],[26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,]),'cond_command':([0,9,10,32,60,61,80,87,134,135,136,137,149,191,192,204,223,224,225,226,227,230,247,316,317,318,323,327,328,329,337,],[27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,]),'arith_for_command':([0,9,10,32,60,61,80,87,134,135,136,137,149,191,192,204,223,224,225,226,227,230,247,316,317,318,323,327,328,329,337,],[28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,]),'redirection':([0,9,10,13,14,32,60,61,76,80,86,88,134,135,136,137,150,151,191,192,207,208,223,224,225,226,227,231,247,316,317,318,323,327,328,329,337,],[34,34,34,34,77,34,34,34,139,34,77,34,34,34,34,34,139,77,34,34,77,139,34,34,34,34,34,139,34,34,34,34,34,34,34,34,34,]),'simple_list_terminator':([2,],[56,]),'list_terminator':([9,10,90,211,235,250,],[67,72,154,236,266,285,]),'redirection_list':([14,86,151,207,],[76,150,208,231,]),'compound_list':([20,21,30,36,39,140,145,155,156,161,209,210,237,238,239,240,254,256,295,296,301,315,319,320,326,341,],[78,82,84,91,94,197,203,214,215,221,232,233,268,269,270,271,288,290,321,322,324,332,333,334,338,347,]),'list':([20,21,30,36,39,140,145,155,156,161,209,210,217,218,237,238,239,240,251,252,254,256,295,296,301,315,319,320,326,330,331,341,],[79,79,79,79,79,79,79,79,79,79,79,79,248,249,79,79,79,79,286,287,79,79,79,79,79,79,79,79,79,339,340,79,]),'newline_list':([20,21,30,36,39,62,63,64,65,85,89,92,93,140,145,146,153,154,155,156,160,161,198,199,200,201,202,205,209,210,216,217,218,236,237,238,239,240,244,251,252,254,256,266,285,291,292,293,295,296,301,308,309,310,315,319,320,326,330,331,341,],[80,80,80,80,80,134,135,136,137,149,152,158,159,80,80,204,212,213,80,80,220,80,223,224,225,226,227,230,80,80,243,247,247,267,80,80,80,80,276,247,247,80,80,294,311,316,317,318,80,80,323,327,328,329,80,80,80,337,247,247,80,]),'empty':([20,21,30,36,39,62,63,64,65,85,89,92,93,140,145,146,153,154,155,156,160,161,198,199,200,201,202,205,209,210,216,217,218,236,237,238,239,240,244,251,252,254,256,266,285,291,292,293,295,296,301,308,309,310,315,319,320,326,330,331,341,],[81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,]),'list1':([80,223,224,225,226,227,247,316,317,318,323,327,328,329,337,],[141,257,258,259,260,261,282,259,260,261,141,261,259,260,141,]),'list0':([80,247,323,337,],[142,142,142,142,]),'function_body':([149,204,230,],[206,229,262,]),'word_list':([211,219,],[235,250,]),'case_clause_sequence':([216,],[244,]),'case_clause':([216,],[245,]),'pattern_list':([216,244,],[246,277,]),'elif_clause':([221,332,],[255,342,]),'pattern':([243,275,276,],[274,303,274,]),}
+
+_lr_goto = { }
+for _k, _v in _lr_goto_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = { }
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> inputunit","S'",1,None,None,None),
+  ('inputunit -> simple_list simple_list_terminator','inputunit',2,'p_inputunit','/root/package/bashlint/bparser.py',16),
+  ('inputunit -> NEWLINE','inputunit',1,'p_inputunit','/root/package/bashlint/bparser.py',17),
+  ('inputunit -> error NEWLINE','inputunit',2,'p_inputunit','/root/package/bashlint/bparser.py',18),
+  ('inputunit -> EOF','inputunit',1,'p_inputunit','/root/package/bashlint/bparser.py',19),
+  ('word_list -> WORD','word_list',1,'p_word_list','/root/package/bashlint/bparser.py',31),
+  ('word_list -> word_list WORD','word_list',2,'p_word_list','/root/package/bashlint/bparser.py',32),
+  ('redirection -> LESS_LESS WORD','redirection',2,'p_redirection_heredoc','/root/package/bashlint/bparser.py',41),
+  ('redirection -> NUMBER LESS_LESS WORD','redirection',3,'p_redirection_heredoc','/root/package/bashlint/bparser.py',42),
+  ('redirection -> REDIR_WORD LESS_LESS WORD','redirection',3,'p_redirection_heredoc','/root/package/bashlint/bparser.py',43),
+  ('redirection -> LESS_LESS_MINUS WORD','redirection',2,'p_redirection_heredoc','/root/package/bashlint/bparser.py',44),
+  ('redirection -> NUMBER LESS_LESS_MINUS WORD','redirection',3,'p_redirection_heredoc','/root/package/bashlint/bparser.py',45),
+  ('redirection -> REDIR_WORD LESS_LESS_MINUS WORD','redirection',3,'p_redirection_heredoc','/root/package/bashlint/bparser.py',46),
+  ('redirection -> GREATER WORD','redirection',2,'p_redirection','/root/package/bashlint/bparser.py',65),
+  ('redirection -> LESS WORD','redirection',2,'p_redirection','/root/package/bashlint/bparser.py',66),
+  ('redirection -> NUMBER GREATER WORD','redirection',3,'p_redirection','/root/package/bashlint/bparser.py',67),
+  ('redirection -> NUMBER LESS WORD','redirection',3,'p_redirection','/root/package/bashlint/bparser.py',68),
+  ('redirection -> REDIR_WORD GREATER WORD','redirection',3,'p_redirection','/root/package/bashlint/bparser.py',69),
+  ('redirection -> REDIR_WORD LESS WORD','redirection',3,'p_redirection','/root/package/bashlint/bparser.py',70),
+  ('redirection -> GREATER_GREATER WORD','redirection',2,'p_redirection','/root/package/bashlint/bparser.py',71),
+  ('redirection -> NUMBER GREATER_GREATER WORD','redirection',3,'p_redirection','/root/package/bashlint/bparser.py',72),
+  ('redirection -> REDIR_WORD GREATER_GREATER WORD','redirection',3,'p_redirection','/root/package/bashlint/bparser.py',73),
+  ('redirection -> GREATER_BAR WORD','redirection',2,'p_redirection','/root/package/bashlint/bparser.py',74),
+  ('redirection -> NUMBER GREATER_BAR WORD','redirection',3,'p_redirection','/root/package/bashlint/bparser.py',75),
+  ('redirection -> REDIR_WORD GREATER_BAR WORD','redirection',3,'p_redirection','/root/package/bashlint/bparser.py',76),
+  ('redirection -> LESS_GREATER WORD','redirection',2,'p_redirection','/root/package/bashlint/bparser.py',77),
+  ('redirection -> NUMBER LESS_GREATER WORD','redirection',3,'p_redirection','/root/package/bashlint/bparser.py',78),
+  ('redirection -> REDIR_WORD LESS_GREATER WORD','redirection',3,'p_redirection','/root/package/bashlint/bparser.py',79),
+  ('redirection -> LESS_LESS_LESS WORD','redirection',2,'p_redirection','/root/package/bashlint/bparser.py',80),
+  ('redirection -> NUMBER LESS_LESS_LESS WORD','redirection',3,'p_redirection','/root/package/bashlint/bparser.py',81),
+  ('redirection -> REDIR_WORD LESS_LESS_LESS WORD','redirection',3,'p_redirection','/root/package/bashlint/bparser.py',82),
+  ('redirection -> LESS_AND NUMBER','redirection',2,'p_redirection','/root/package/bashlint/bparser.py',83),
+  ('redirection -> NUMBER LESS_AND NUMBER','redirection',3,'p_redirection','/root/package/bashlint/bparser.py',84),
+  ('redirection -> REDIR_WORD LESS_AND NUMBER','redirection',3,'p_redirection','/root/package/bashlint/bparser.py',85),
+  ('redirection -> GREATER_AND NUMBER','redirection',2,'p_redirection','/root/package/bashlint/bparser.py',86),
+  ('redirection -> NUMBER GREATER_AND NUMBER','redirection',3,'p_redirection','/root/package/bashlint/bparser.py',87),
+  ('redirection -> REDIR_WORD GREATER_AND NUMBER','redirection',3,'p_redirection','/root/package/bashlint/bparser.py',88),
+  ('redirection -> LESS_AND WORD','redirection',2,'p_redirection','/root/package/bashlint/bparser.py',89),
+  ('redirection -> NUMBER LESS_AND WORD','redirection',3,'p_redirection','/root/package/bashlint/bparser.py',90),
+  ('redirection -> REDIR_WORD LESS_AND WORD','redirection',3,'p_redirection','/root/package/bashlint/bparser.py',91),
+  ('redirection -> GREATER_AND WORD','redirection',2,'p_redirection','/root/package/bashlint/bparser.py',92),
+  ('redirection -> NUMBER GREATER_AND WORD','redirection',3,'p_redirection','/root/package/bashlint/bparser.py',93),
+  ('redirection -> REDIR_WORD GREATER_AND WORD','redirection',3,'p_redirection','/root/package/bashlint/bparser.py',94),
+  ('redirection -> GREATER_AND DASH','redirection',2,'p_redirection','/root/package/bashlint/bparser.py',95),
+  ('redirection -> NUMBER GREATER_AND DASH','redirection',3,'p_redirection','/root/package/bashlint/bparser.py',96),
+  ('redirection -> REDIR_WORD GREATER_AND DASH','redirection',3,'p_redirection','/root/package/bashlint/bparser.py',97),
+  ('redirection -> LESS_AND DASH','redirection',2,'p_redirection','/root/package/bashlint/bparser.py',98),
+  ('redirection -> NUMBER LESS_AND DASH','redirection',3,'p_redirection','/root/package/bashlint/bparser.py',99),
+  ('redirection -> REDIR_WORD LESS_AND DASH','redirection',3,'p_redirection','/root/package/bashlint/bparser.py',100),
+  ('redirection -> AND_GREATER WORD','redirection',2,'p_redirection','/root/package/bashlint/bparser.py',101),
+  ('redirection -> AND_GREATER_GREATER WORD','redirection',2,'p_redirection','/root/package/bashlint/bparser.py',102),
+  ('simple_command_element -> WORD','simple_command_element',1,'p_simple_command_element','/root/package/bashlint/bparser.py',149),
+  ('simple_command_element -> ASSIGNMENT_WORD','simple_command_element',1,'p_simple_command_element','/root/package/bashlint/bparser.py',150),
+  ('simple_command_element -> redirection','simple_command_element',1,'p_simple_command_element','/root/package/bashlint/bparser.py',151),
+  ('redirection_list -> redirection','redirection_list',1,'p_redirection_list','/root/package/bashlint/bparser.py',164),
+  ('redirection_list -> redirection_list redirection','redirection_list',2,'p_redirection_list','/root/package/bashlint/bparser.py',165),
+  ('simple_command -> simple_command_element','simple_command',1,'p_simple_command','/root/package/bashlint/bparser.py',173),
+  ('simple_command -> simple_command simple_command_element','simple_command',2,'p_simple_command','/root/package/bashlint/bparser.py',174),
+  ('command -> simple_command','command',1,'p_command','/root/package/bashlint/bparser.py',181),
+  ('command -> shell_command','command',1,'p_command','/root/package/bashlint/bparser.py',182),
+  ('command -> shell_command redirection_list','command',2,'p_command','/root/package/bashlint/bparser.py',183),
+  ('command -> function_def','command',1,'p_command','/root/package/bashlint/bparser.py',184),
+  ('command -> coproc','command',1,'p_command','/root/package/bashlint/bparser.py',185),
+  ('shell_command -> for_command','shell_command',1,'p_shell_command','/root/package/bashlint/bparser.py',197),
+  ('shell_command -> case_command','shell_command',1,'p_shell_command','/root/package/bashlint/bparser.py',198),
+  ('shell_command -> WHILE compound_list DO compound_list DONE','shell_command',5,'p_shell_command','/root/package/bashlint/bparser.py',199),
+  ('shell_command -> UNTIL compound_list DO compound_list DONE','shell_command',5,'p_shell_command','/root/package/bashlint/bparser.py',200),
+  ('shell_command -> select_command','shell_command',1,'p_shell_command','/root/package/bashlint/bparser.py',201),
+  ('shell_command -> if_command','shell_command',1,'p_shell_command','/root/package/bashlint/bparser.py',202),
+  ('shell_command -> subshell','shell_command',1,'p_shell_command','/root/package/bashlint/bparser.py',203),
+  ('shell_command -> group_command','shell_command',1,'p_shell_command','/root/package/bashlint/bparser.py',204),
+  ('shell_command -> arith_command','shell_command',1,'p_shell_command','/root/package/bashlint/bparser.py',205),
+  ('shell_command -> cond_command','shell_command',1,'p_shell_command','/root/package/bashlint/bparser.py',206),
+  ('shell_command -> arith_for_command','shell_command',1,'p_shell_command','/root/package/bashlint/bparser.py',207),
+  ('for_command -> FOR WORD newline_list DO compound_list DONE','for_command',6,'p_for_command','/root/package/bashlint/bparser.py',244),
+  ('for_command -> FOR WORD newline_list LEFT_CURLY compound_list RIGHT_CURLY','for_command',6,'p_for_command','/root/package/bashlint/bparser.py',245),
+  ('for_command -> FOR WORD SEMICOLON newline_list DO compound_list DONE','for_command',7,'p_for_command','/root/package/bashlint/bparser.py',246),
+  ('for_command -> FOR WORD SEMICOLON newline_list LEFT_CURLY compound_list RIGHT_CURLY','for_command',7,'p_for_command','/root/package/bashlint/bparser.py',247),
+  ('for_command -> FOR WORD newline_list IN word_list list_terminator newline_list DO compound_list DONE','for_command',10,'p_for_command','/root/package/bashlint/bparser.py',248),
+  ('for_command -> FOR WORD newline_list IN word_list list_terminator newline_list LEFT_CURLY compound_list RIGHT_CURLY','for_command',10,'p_for_command','/root/package/bashlint/bparser.py',249),
+  ('for_command -> FOR WORD newline_list IN list_terminator newline_list DO compound_list DONE','for_command',9,'p_for_command','/root/package/bashlint/bparser.py',250),
+  ('for_command -> FOR WORD newline_list IN list_terminator newline_list LEFT_CURLY compound_list RIGHT_CURLY','for_command',9,'p_for_command','/root/package/bashlint/bparser.py',251),
+  ('arith_for_command -> FOR ARITH_FOR_EXPRS list_terminator newline_list DO compound_list DONE','arith_for_command',7,'p_arith_for_command','/root/package/bashlint/bparser.py',267),
+  ('arith_for_command -> FOR ARITH_FOR_EXPRS list_terminator newline_list LEFT_CURLY compound_list RIGHT_CURLY','arith_for_command',7,'p_arith_for_command','/root/package/bashlint/bparser.py',268),
+  ('arith_for_command -> FOR ARITH_FOR_EXPRS DO compound_list DONE','arith_for_command',5,'p_arith_for_command','/root/package/bashlint/bparser.py',269),
+  ('arith_for_command -> FOR ARITH_FOR_EXPRS LEFT_CURLY compound_list RIGHT_CURLY','arith_for_command',5,'p_arith_for_command','/root/package/bashlint/bparser.py',270),
+  ('select_command -> SELECT WORD newline_list DO list DONE','select_command',6,'p_select_command','/root/package/bashlint/bparser.py',274),
+  ('select_command -> SELECT WORD newline_list LEFT_CURLY list RIGHT_CURLY','select_command',6,'p_select_command','/root/package/bashlint/bparser.py',275),
+  ('select_command -> SELECT WORD SEMICOLON newline_list DO list DONE','select_command',7,'p_select_command','/root/package/bashlint/bparser.py',276),
+  ('select_command -> SELECT WORD SEMICOLON newline_list LEFT_CURLY list RIGHT_CURLY','select_command',7,'p_select_command','/root/package/bashlint/bparser.py',277),
+  ('select_command -> SELECT WORD newline_list IN word_list list_terminator newline_list DO list DONE','select_command',10,'p_select_command','/root/package/bashlint/bparser.py',278),
+  ('select_command -> SELECT WORD newline_list IN word_list list_terminator newline_list LEFT_CURLY list RIGHT_CURLY','select_command',10,'p_select_command','/root/package/bashlint/bparser.py',279),
+  ('case_command -> CASE WORD newline_list IN newline_list ESAC','case_command',6,'p_case_command','/root/package/bashlint/bparser.py',283),
+  ('case_command -> CASE WORD newline_list IN case_clause_sequence newline_list ESAC','case_command',7,'p_case_command','/root/package/bashlint/bparser.py',284),
+  ('case_command -> CASE WORD newline_list IN case_clause ESAC','case_command',6,'p_case_command','/root/package/bashlint/bparser.py',285),
+  ('function_def -> WORD LEFT_PAREN RIGHT_PAREN newline_list function_body','function_def',5,'p_function_def','/root/package/bashlint/bparser.py',289),
+  ('function_def -> FUNCTION WORD LEFT_PAREN RIGHT_PAREN newline_list function_body','function_def',6,'p_function_def','/root/package/bashlint/bparser.py',290),
+  ('function_def -> FUNCTION WORD newline_list function_body','function_def',4,'p_function_def','/root/package/bashlint/bparser.py',291),
+  ('function_body -> shell_command','function_body',1,'p_function_body','/root/package/bashlint/bparser.py',300),
+  ('function_body -> shell_command redirection_list','function_body',2,'p_function_body','/root/package/bashlint/bparser.py',301),
+  ('subshell -> LEFT_PAREN compound_list RIGHT_PAREN','subshell',3,'p_subshell','/root/package/bashlint/bparser.py',311),
+  ('coproc -> COPROC shell_command','coproc',2,'p_coproc','/root/package/bashlint/bparser.py',319),
+  ('coproc -> COPROC shell_command redirection_list','coproc',3,'p_coproc','/root/package/bashlint/bparser.py',320),
+  ('coproc -> COPROC WORD shell_command','coproc',3,'p_coproc','/root/package/bashlint/bparser.py',321),
+  ('coproc -> COPROC WORD shell_command redirection_list','coproc',4,'p_coproc','/root/package/bashlint/bparser.py',322),
+  ('coproc -> COPROC simple_command','coproc',2,'p_coproc','/root/package/bashlint/bparser.py',323),
+  ('if_command -> IF compound_list THEN compound_list FI','if_command',5,'p_if_command','/root/package/bashlint/bparser.py',327),
+  ('if_command -> IF compound_list THEN compound_list ELSE compound_list FI','if_command',7,'p_if_command','/root/package/bashlint/bparser.py',328),
+  ('if_command -> IF compound_list THEN compound_list elif_clause FI','if_command',6,'p_if_command','/root/package/bashlint/bparser.py',329),
+  ('group_command -> LEFT_CURLY compound_list RIGHT_CURLY','group_command',3,'p_group_command','/root/package/bashlint/bparser.py',340),
+  ('arith_command -> ARITH_CMD','arith_command',1,'p_arith_command','/root/package/bashlint/bparser.py',348),
+  ('cond_command -> COND_START COND_CMD COND_END','cond_command',3,'p_cond_command','/root/package/bashlint/bparser.py',352),
+  ('elif_clause -> ELIF compound_list THEN compound_list','elif_clause',4,'p_elif_clause','/root/package/bashlint/bparser.py',356),
+  ('elif_clause -> ELIF compound_list THEN compound_list ELSE compound_list','elif_clause',6,'p_elif_clause','/root/package/bashlint/bparser.py',357),
+  ('elif_clause -> ELIF compound_list THEN compound_list elif_clause','elif_clause',5,'p_elif_clause','/root/package/bashlint/bparser.py',358),
+  ('case_clause -> pattern_list','case_clause',1,'p_case_clause','/root/package/bashlint/bparser.py',368),
+  ('case_clause -> case_clause_sequence pattern_list','case_clause',2,'p_case_clause','/root/package/bashlint/bparser.py',369),
+  ('pattern_list -> newline_list pattern RIGHT_PAREN compound_list','pattern_list',4,'p_pattern_list','/root/package/bashlint/bparser.py',373),
+  ('pattern_list -> newline_list pattern RIGHT_PAREN newline_list','pattern_list',4,'p_pattern_list','/root/package/bashlint/bparser.py',374),
+  ('pattern_list -> newline_list LEFT_PAREN pattern RIGHT_PAREN compound_list','pattern_list',5,'p_pattern_list','/root/package/bashlint/bparser.py',375),
+  ('pattern_list -> newline_list LEFT_PAREN pattern RIGHT_PAREN newline_list','pattern_list',5,'p_pattern_list','/root/package/bashlint/bparser.py',376),
+  ('case_clause_sequence -> pattern_list SEMI_SEMI','case_clause_sequence',2,'p_case_clause_sequence','/root/package/bashlint/bparser.py',380),
+  ('case_clause_sequence -> case_clause_sequence pattern_list SEMI_SEMI','case_clause_sequence',3,'p_case_clause_sequence','/root/package/bashlint/bparser.py',381),
+  ('case_clause_sequence -> pattern_list SEMI_AND','case_clause_sequence',2,'p_case_clause_sequence','/root/package/bashlint/bparser.py',382),
+  ('case_clause_sequence -> case_clause_sequence pattern_list SEMI_AND','case_clause_sequence',3,'p_case_clause_sequence','/root/package/bashlint/bparser.py',383),
+  ('case_clause_sequence -> pattern_list SEMI_SEMI_AND','case_clause_sequence',2,'p_case_clause_sequence','/root/package/bashlint/bparser.py',384),
+  ('case_clause_sequence -> case_clause_sequence pattern_list SEMI_SEMI_AND','case_clause_sequence',3,'p_case_clause_sequence','/root/package/bashlint/bparser.py',385),
+  ('pattern -> WORD','pattern',1,'p_pattern','/root/package/bashlint/bparser.py',389),
+  ('pattern -> pattern BAR WORD','pattern',3,'p_pattern','/root/package/bashlint/bparser.py',390),
+  ('list -> newline_list list0','list',2,'p_list','/root/package/bashlint/bparser.py',394),
+  ('compound_list -> list','compound_list',1,'p_compound_list','/root/package/bashlint/bparser.py',398),
+  ('compound_list -> newline_list list1','compound_list',2,'p_compound_list','/root/package/bashlint/bparser.py',399),
+  ('list0 -> list1 NEWLINE newline_list','list0',3,'p_list0','/root/package/bashlint/bparser.py',410),
+  ('list0 -> list1 AMPERSAND newline_list','list0',3,'p_list0','/root/package/bashlint/bparser.py',411),
+  ('list0 -> list1 SEMICOLON newline_list','list0',3,'p_list0','/root/package/bashlint/bparser.py',412),
+  ('list1 -> list1 AND_AND newline_list list1','list1',4,'p_list1','/root/package/bashlint/bparser.py',421),
+  ('list1 -> list1 OR_OR newline_list list1','list1',4,'p_list1','/root/package/bashlint/bparser.py',422),
+  ('list1 -> list1 AMPERSAND newline_list list1','list1',4,'p_list1','/root/package/bashlint/bparser.py',423),
+  ('list1 -> list1 SEMICOLON newline_list list1','list1',4,'p_list1','/root/package/bashlint/bparser.py',424),
+  ('list1 -> list1 NEWLINE newline_list list1','list1',4,'p_list1','/root/package/bashlint/bparser.py',425),
+  ('list1 -> pipeline_command','list1',1,'p_list1','/root/package/bashlint/bparser.py',426),
+  ('simple_list_terminator -> NEWLINE','simple_list_terminator',1,'p_simple_list_terminator','/root/package/bashlint/bparser.py',436),
+  ('simple_list_terminator -> EOF','simple_list_terminator',1,'p_simple_list_terminator','/root/package/bashlint/bparser.py',437),
+  ('list_terminator -> NEWLINE','list_terminator',1,'p_list_terminator','/root/package/bashlint/bparser.py',441),
+  ('list_terminator -> SEMICOLON','list_terminator',1,'p_list_terminator','/root/package/bashlint/bparser.py',442),
+  ('list_terminator -> EOF','list_terminator',1,'p_list_terminator','/root/package/bashlint/bparser.py',443),
+  ('newline_list -> empty','newline_list',1,'p_newline_list','/root/package/bashlint/bparser.py',448),
+  ('newline_list -> newline_list NEWLINE','newline_list',2,'p_newline_list','/root/package/bashlint/bparser.py',449),
+  ('simple_list -> simple_list1','simple_list',1,'p_simple_list','/root/package/bashlint/bparser.py',453),
+  ('simple_list -> simple_list1 AMPERSAND','simple_list',2,'p_simple_list','/root/package/bashlint/bparser.py',454),
+  ('simple_list -> simple_list1 SEMICOLON','simple_list',2,'p_simple_list','/root/package/bashlint/bparser.py',455),
+  ('simple_list1 -> simple_list1 AND_AND newline_list simple_list1','simple_list1',4,'p_simple_list1','/root/package/bashlint/bparser.py',474),
+  ('simple_list1 -> simple_list1 OR_OR newline_list simple_list1','simple_list1',4,'p_simple_list1','/root/package/bashlint/bparser.py',475),
+  ('simple_list1 -> simple_list1 AMPERSAND simple_list1','simple_list1',3,'p_simple_list1','/root/package/bashlint/bparser.py',476),
+  ('simple_list1 -> simple_list1 SEMICOLON simple_list1','simple_list1',3,'p_simple_list1','/root/package/bashlint/bparser.py',477),
+  ('simple_list1 -> pipeline_command','simple_list1',1,'p_simple_list1','/root/package/bashlint/bparser.py',478),
+  ('pipeline_command -> pipeline','pipeline_command',1,'p_pipeline_command','/root/package/bashlint/bparser.py',487),
+  ('pipeline_command -> BANG pipeline_command','pipeline_command',2,'p_pipeline_command','/root/package/bashlint/bparser.py',488),
+  ('pipeline_command -> timespec pipeline_command','pipeline_command',2,'p_pipeline_command','/root/package/bashlint/bparser.py',489),
+  ('pipeline_command -> timespec list_terminator','pipeline_command',2,'p_pipeline_command','/root/package/bashlint/bparser.py',490),
+  ('pipeline_command -> BANG list_terminator','pipeline_command',2,'p_pipeline_command','/root/package/bashlint/bparser.py',491),
+  ('pipeline -> pipeline BAR newline_list pipeline','pipeline',4,'p_pipeline','/root/package/bashlint/bparser.py',510),
+  ('pipeline -> pipeline BAR_AND newline_list pipeline','pipeline',4,'p_pipeline','/root/package/bashlint/bparser.py',511),
+  ('pipeline -> command','pipeline',1,'p_pipeline','/root/package/bashlint/bparser.py',512),
+  ('timespec -> TIME','timespec',1,'p_timespec','/root/package/bashlint/bparser.py',521),
+  ('timespec -> TIME TIMEOPT','timespec',2,'p_timespec','/root/package/bashlint/bparser.py',522),
+  ('timespec -> TIME TIMEOPT TIMEIGN','timespec',3,'p_timespec','/root/package/bashlint/bparser.py',523),
+  ('empty -> <empty>','empty',0,'p_empty','/root/package/bashlint/bparser.py',527),
+]
@@ -12,7 +12,7 @@ import os, sys
 if sys.version_info > (3, 0):
     from six.moves import xrange
 
-from bashlint import data_tools
+from bashlint import batch_parser
 from nlp_tools import tokenizer
 
 
@@ -21,7 +21,7 @@ def extract_rewrites(data):
     nls, cms = data
 
     # Step 1: group pairs with the same natural language description.
-    group_pairs_by_nl = collections.defaultdict(set)
+    pairs = []
     for nl, cm in zip(nls, cms):
         nl = nl.strip()
         cm = cm.strip()
@@ -31,9 +31,13 @@ def extract_rewrites(data):
             continue
         if not cm:
             continue
+        pairs.append((nl, cm))
+    cm_temps = [result.template for result in batch_parser.parse_commands(
+        [cm for _, cm in pairs], ['template'])]
+    group_pairs_by_nl = collections.defaultdict(set)
+    for (nl, _), cm_temp in zip(pairs, cm_temps):
         nl_tokens, _ = tokenizer.ner_tokenizer(nl)
         nl_temp = ' '.join(nl_tokens)
-        cm_temp = data_tools.cmd2template(cm)
         if not cm_temp in group_pairs_by_nl[nl_temp]:
             group_pairs_by_nl[nl_temp].add(cm_temp)
 
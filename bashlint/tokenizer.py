@@ -29,6 +29,18 @@ def _shellexp(c):
 def _shellbreak(c):
     return 'break' in sh_syntaxtab[c]
 
+# a word of a simple command: unquoted characters other than metacharacters,
+# blanks and quotes, backslash-escaped characters, and single or double
+# quoted strings
+_simplewordre = re.compile(r'''(?:[^()<>;&| \t\n"'`\\$]|\\.|'[^']*'|"(?:[^"\\`$]|\\.)*")+''',
+                           re.DOTALL)
+
+def _simpleline(s):
+    '''true if the words of s can be read by the fast path of the tokenizer:
+    s has no expansions, substitutions, heredocs or quoted newlines'''
+    return not ('$' in s or '`' in s or '\\\n' in s or '<<' in s or
+                '<(' in s or '>(' in s)
+
 class tokentype(enum.Enum):
     IF = 1
     THEN = 2
@@ -126,6 +138,13 @@ valid_reserved_first_command = {
     "coproc" : tokentype.COPROC
 }
 
+# words and preceding tokens that _createtokenword may turn into something else
+# than a plain WORD token (see _readsimpletokenword)
+_nonplainwords = set(valid_reserved_first_command)
+_nonplainwords.update(['in', 'do', 'esac', '{', '}', '-p', '--', ']]'])
+_nonplainwordpredecessors = set([tokentype.FUNCTION, tokentype.LESS_AND,
+                                 tokentype.GREATER_AND])
+
 class MatchedPairError(errors.ParsingError):
     def __init__(self, startline, message, tokenizer):
         # TODO use startline?
@@ -198,13 +217,17 @@ eoftoken = token(tokentype.EOF, None)
 
 class tokenizer(object):
     def __init__(self, s, parserstate, strictmode=True, eoftoken=None,
-                 lastreadtoken=None, tokenbeforethat=None, twotokensago=None):
+                 lastreadtoken=None, tokenbeforethat=None, twotokensago=None,
+                 fastpath=True):
         self._shell_eof_token = eoftoken
         self._shell_input_line = s
         self._added_newline = False
         if self._shell_input_line and self._shell_input_line[-1] != '\n':
             self._shell_input_line += '\n' # bash/parse.y L2431
             self._added_newline = True
+        # words of simple commands are matched by a regular expression
+        # instead of being read one character at a time
+        self._fastpath = fastpath and _simpleline(self._shell_input_line)
         self._shell_input_line_index = 0
         # self._shell_input_line_terminator = None
         self._two_tokens_ago = twotokensago or token(None, None)
@@ -237,6 +260,25 @@ class tokenizer(object):
         # the tokenizer and the parser, which also needs it
         self.redirstack = []
 
+    def resume(self, index, parserstate):
+        '''start over at index of the input, as a new tokenizer of the rest
+        of the input would, but keeping token positions relative to the whole
+        input'''
+        self._shell_input_line_index = index
+        self._two_tokens_ago = token(None, None)
+        self._token_before_that = token(None, None)
+        self._last_read_token = token(None, None)
+        self._current_token = token(None, None)
+        self._eol_ungetc_lookahead = None
+        self._token_to_read = None
+        self._parserstate = parserstate
+        self._line_number = 0
+        self._open_brace_count = 0
+        self._esacs_needed_count = 0
+        self._dstack = []
+        self._positions = []
+        self.redirstack = []
+
     @property
     def source(self):
         if self._added_newline:
@@ -388,6 +430,11 @@ class tokenizer(object):
         return self._readtokenword(character)
 
     def _readtokenword(self, c):
+        if self._fastpath:
+            t = self._readsimpletokenword()
+            if t is not None:
+                return t
+
         d = {}
         d['all_digit_token'] = c.isdigit()
         d['dollar_present'] = d['quoted'] = d['pass_next_character'] = d['compound_assignment'] = False
@@ -530,11 +577,57 @@ class tokenizer(object):
             cd = self._current_delimiter()
             c = self._getc(cd != "'" and not d['pass_next_character'])
 
+        return self._createtokenword(''.join(tokenword), c, d)
+
+    def _readsimpletokenword(self):
+        '''read the word that starts with the last character read in a single
+        regular expression match. returns None if the word has to be read by
+        _readtokenword, e.g. if it has unterminated quotes'''
+        if self._eol_ungetc_lookahead is not None or self._dstack:
+            return None
+        line = self._shell_input_line
+        start = self._shell_input_line_index - 1
+        m = _simplewordre.match(line, start)
+        if m is None:
+            return None
+        end = m.end()
+        # the word must end with a metacharacter or a blank, as in
+        # _readtokenword
+        if end == len(line) or not _shellbreak(line[end]):
+            return None
+        self._shell_input_line_index = end
+
+        tokenword = m.group()
+        c = line[end]
+        quoted = '"' in tokenword or "'" in tokenword or '\\' in tokenword
+        if (c not in '<>' and '=' not in tokenword and
+            tokenword not in _nonplainwords and
+            not self._esacs_needed_count and
+            parserflags.ALLOWOPNBRC not in self._parserstate and
+            self._last_read_token.ttype not in _nonplainwordpredecessors):
+            # a plain word: neither a number, a reserved word, an assignment
+            # nor a redirection word, and the parser state is left unchanged
+            # (see _createtokenword)
+            self._recordpos()
+            tokenword = self._createtoken(tokentype.WORD, tokenword,
+                                          butils.typedset(wordflags))
+            if quoted:
+                tokenword.flags.add(wordflags.QUOTED)
+            return tokenword
+
+        d = {'all_digit_token' : tokenword.isdigit(),
+             'dollar_present' : False,
+             'quoted' : quoted,
+             'pass_next_character' : False,
+             'compound_assignment' : False}
+        return self._createtokenword(tokenword, c, d)
+
+    def _createtokenword(self, tokenword, c, d):
+        '''create the token of a word read by _readtokenword, c is the
+        character that follows the word'''
         # got_token
         self._recordpos()
 
-        tokenword = ''.join(tokenword)
-
         if d['all_digit_token'] and (c in '<>' or self._last_read_token.ttype in (tokentype.LESS_AND, tokentype.GREATER_AND)) and shutils.legal_number(tokenword):
             return self._createtoken(tokentype.NUMBER, int(tokenword))
 
@@ -1155,3 +1248,63 @@ class tokenizer(object):
 
         if self._parserstate & parserflags.CONDEXPR and tokstr == ']]':
             return tokentype.COND_END
+
+
+def test_tokenizer_fast_path(input_file, num_repeats=3):
+    """
+    Check that the fast path of the bash tokenizer produces the same tokens
+    and bashlex trees as the full tokenizer on the commands in input_file,
+    and measure the throughput of both.
+    """
+    import time
+    from bashlint import bparser
+
+    with open(input_file) as f:
+        cmds = [cmd.strip() for cmd in f]
+
+    def tokenize(cmd, fastpath):
+        try:
+            return [(t.ttype, t.value, t.lexpos, t.endlexpos, set(t.flags))
+                    for t in tokenizer(cmd, state.parserstate(),
+                                       fastpath=fastpath)]
+        except Exception as e:
+            return repr(e)
+
+    def parse(cmd, fastpath):
+        try:
+            return bparser._parser(
+                cmd, tokenizerargs={'fastpath': fastpath}).parse().dump()
+        except Exception as e:
+            return repr(e)
+
+    num_mismatches = 0
+    for cmd in cmds:
+        if tokenize(cmd, True) != tokenize(cmd, False) \
+                or parse(cmd, True) != parse(cmd, False):
+            num_mismatches += 1
+            print('Mismatch: {}'.format(cmd))
+    num_simple = sum(_simpleline(cmd) for cmd in cmds)
+    print('{} commands, {} simple, {} mismatches'.format(
+        len(cmds), num_simple, num_mismatches))
+
+    for fastpath in [False, True]:
+        start_time = time.time()
+        for _ in range(num_repeats):
+            for cmd in cmds:
+                tokenize(cmd, fastpath)
+        tokenize_time = (time.time() - start_time) / num_repeats
+        start_time = time.time()
+        for _ in range(num_repeats):
+            for cmd in cmds:
+                parse(cmd, fastpath)
+        parse_time = (time.time() - start_time) / num_repeats
+        print('fast path {}: {:.0f} commands/s tokenized, '
+              '{:.0f} commands/s parsed'.format(
+                'on' if fastpath else 'off', len(cmds) / tokenize_time,
+                len(cmds) / parse_time))
+    assert(num_mismatches == 0)
+
+
+if __name__ == '__main__':
+    import sys
+    test_tokenizer_fast_path(sys.argv[1])
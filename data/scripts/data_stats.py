@@ -11,7 +11,7 @@ import os, sys
 sys.path.append('../../')  # for bashlint
 import re
 
-from bashlint import bash, data_tools
+from bashlint import bash, batch_parser, data_tools
 from nlp_tools.tokenizer import basic_tokenizer
 
 
@@ -19,13 +19,11 @@ def u_hist_to_radar_chart():
     input_file = sys.argv[1]
 
     u_hist = collections.defaultdict(int)
-    with open(input_file) as f:
-        for cmd in f:
-            ast = data_tools.bash_parser(cmd, verbose=False)
-            for u in data_tools.get_utilities(ast):
-                if u in bash.BLACK_LIST or u in bash.GREY_LIST:
-                    continue
-                u_hist[u] += 1
+    for result in batch_parser.parse_file(input_file, ['utilities']):
+        for u in result.utilities:
+            if u in bash.BLACK_LIST or u in bash.GREY_LIST:
+                continue
+            u_hist[u] += 1
 
     selected_utilities = []
     for i, (u, freq) in enumerate(
@@ -67,17 +65,16 @@ def compute_cm_stats():
     unique_tokens = set()
     tokens_per_cmd = []
     cmds_per_token = collections.defaultdict(int)
-    with open(input_file) as f:
-        for line in f:
-            cm = line.strip()
-            unique_commands.add(cm)
-            temp = data_tools.cmd2template(cm, loose_constraints=True)
-            unique_templates.add(temp)
-            tokens = data_tools.bash_tokenizer(cm, loose_constraints=True)
-            unique_tokens |= set(tokens)
-            tokens_per_cmd.append(len(tokens))
-            for token in tokens:
-                cmds_per_token[token] += 1
+    for result in batch_parser.parse_file(input_file, ['template', 'tokens'],
+            tokenizer_args={'loose_constraints': True},
+            template_args={'loose_constraints': True}):
+        unique_commands.add(result.cmd)
+        unique_templates.add(result.template)
+        tokens = result.tokens
+        unique_tokens |= set(tokens)
+        tokens_per_cmd.append(len(tokens))
+        for token in tokens:
+            cmds_per_token[token] += 1
     print('# unique commands: {}'.format(len(unique_commands)))
     print('# unique templates: {}'.format(len(unique_templates)))
     print('# unique tokens: {}'.format(len(unique_tokens)))
@@ -168,19 +165,17 @@ def compute_bash_stats():
     unique_keywords = set()
     cmds_per_utility = collections.defaultdict(int)
     cmds_per_flag = collections.defaultdict(int)
-    with open(input_file) as f:
-        for line in f:
-            cm = line.strip()
-            tokens = data_tools.bash_tokenizer(cm, loose_constraints=True, with_prefix=True)
-            for token in tokens:
-                if token.startswith('UTILITY<KIND_PREFIX>'):
-                    unique_utilities.add(token)
-                    cmds_per_utility[token] += 1
-                elif token.startswith('FLAG<KIND_PREFIX>'):
-                    unique_flags.add(token)
-                    cmds_per_flag[token] += 1
-                elif not token.startswith('ARGUMENT<KIND_PREFIX>'):
-                    unique_keywords.add(token)
+    for result in batch_parser.parse_file(input_file, ['tokens'],
+            tokenizer_args={'loose_constraints': True, 'with_prefix': True}):
+        for token in result.tokens:
+            if token.startswith('UTILITY<KIND_PREFIX>'):
+                unique_utilities.add(token)
+                cmds_per_utility[token] += 1
+            elif token.startswith('FLAG<KIND_PREFIX>'):
+                unique_flags.add(token)
+                cmds_per_flag[token] += 1
+            elif not token.startswith('ARGUMENT<KIND_PREFIX>'):
+                unique_keywords.add(token)
     print('# unique utilities: {}'.format(len(unique_utilities)))
     print('# unique flags: {}'.format(len(unique_flags)))
     print('# unique keywords: {}'.format(len(unique_keywords)))
@@ -194,13 +189,11 @@ def compute_flag_stats():
     train_file = sys.argv[2]
 
     u_hist = collections.defaultdict(int)
-    with open(input_file) as f:
-        for cmd in f:
-            ast = data_tools.bash_parser(cmd, verbose=False)
-            for u in data_tools.get_utilities(ast):
-                if u in bash.BLACK_LIST or u in bash.GREY_LIST:
-                    continue
-                u_hist[u] += 1
+    for result in batch_parser.parse_file(input_file, ['utilities']):
+        for u in result.utilities:
+            if u in bash.BLACK_LIST or u in bash.GREY_LIST:
+                continue
+            u_hist[u] += 1
     
     sorted_u_by_freq = sorted(u_hist.items(), key=lambda x:x[1], reverse=True)
     most_frequent_10 = [u for u, _ in sorted_u_by_freq[:10]]
@@ -208,17 +201,15 @@ def compute_flag_stats():
     
     most_frequent_10_flags = collections.defaultdict(set)
     least_frequent_10_flags = collections.defaultdict(set)
-    with open(train_file) as f:
-        for cmd in f:
-            tokens = data_tools.bash_tokenizer(cmd, loose_constraints=True,
-                                               with_flag_head=True)
-            for token in tokens:
-                if '@@' in token:
-                    u, f = token.split('@@')
-                    if u in most_frequent_10:
-                        most_frequent_10_flags[u].add(f)
-                    if u in least_frequent_10:
-                        least_frequent_10_flags[u].add(f)
+    for result in batch_parser.parse_file(train_file, ['tokens'],
+            tokenizer_args={'loose_constraints': True, 'with_flag_head': True}):
+        for token in result.tokens:
+            if '@@' in token:
+                u, f = token.split('@@')
+                if u in most_frequent_10:
+                    most_frequent_10_flags[u].add(f)
+                if u in least_frequent_10:
+                    least_frequent_10_flags[u].add(f)
 
     for u in most_frequent_10:
         if u in most_frequent_10_flags:
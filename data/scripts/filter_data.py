@@ -11,7 +11,7 @@ import collections
 import os, sys
 sys.path.append('../../')  # for bashlint
 
-from bashlint import bash, data_tools
+from bashlint import bash, batch_parser, data_tools
 
 data_splits = ['train', 'dev', 'test']
 
@@ -20,14 +20,16 @@ NUM_UTILITIES = 100
 def compute_top_utilities(path, k):
     print('computing top most frequent utilities...') 
     utilities = collections.defaultdict(int)
+    commands = []
     with open(path, encoding='utf-8') as f:
         while (True):
             command = f.readline().strip()
             if not command:
                 break
-            ast = data_tools.bash_parser(command, verbose=False)
-            for u in data_tools.get_utilities(ast):
-                utilities[u] += 1
+            commands.append(command)
+    for result in batch_parser.parse_commands(commands, ['utilities']):
+        for u in result.utilities:
+            utilities[u] += 1
     top_utilities = []
 
     freq_threshold = -1   
@@ -45,8 +47,8 @@ def compute_top_utilities(path, k):
 
 
 def filter_by_most_frequent_utilities(data_dir, num_utilities):
-    def select(ast, utility_set):
-        for ut in data_tools.get_utilities(ast):
+    def select(ast, utilities, utility_set):
+        for ut in utilities:
             if not ut in utility_set:
                 print('Utility currently not handled: {} - {}'.format(
                     ut, data_tools.ast2command(ast, loose_constraints=True).encode('utf-8')))
@@ -62,16 +64,17 @@ def filter_by_most_frequent_utilities(data_dir, num_utilities):
             nls = [nl.strip() for nl in f.readlines()]
         with open(cm_file_path, encoding='utf-8') as f:
             cms = [cm.strip() for cm in f.readlines()]
+        parse_results = batch_parser.parse_commands(cms, ['ast', 'utilities'])
         nl_outfile_path = os.path.join(data_dir, split + '.nl.filtered')
         cm_outfile_path = os.path.join(data_dir, split + '.cm.filtered')
         with open(nl_outfile_path, 'w', encoding='utf-8') as nl_outfile:
             with open(cm_outfile_path, 'w', encoding='utf-8') as cm_outfile:
-                for nl, cm in zip(nls, cms):
+                for nl, cm, result in zip(nls, cms, parse_results):
                     if len(nl.split()) > 50:
                         print('lenthy description skipped: {}'.format(nl))
                         continue
-                    ast = data_tools.bash_parser(cm)
-                    if ast and select(ast, top_utilities):
+                    ast = result.ast
+                    if ast and select(ast, result.utilities, top_utilities):
                         nl_outfile.write('{}\n'.format(nl))
                         cm_outfile.write('{}\n'.format(cm))
                             
@@ -8,18 +8,16 @@ sys.path.append('/home/xilin/Projects/tellina/learning_module/')
 
 import numpy as np
 
-from bashlint import bash, data_tools
+from bashlint import bash, batch_parser, data_tools
 
 
 def get_u_hist_from_file(input_file):
     u_hist = collections.defaultdict(int)
-    with open(input_file) as f:
-        for cmd in f:
-            ast = data_tools.bash_parser(cmd, verbose=False)
-            for u in data_tools.get_utilities(ast):
-                if u in bash.BLACK_LIST or u in bash.GREY_LIST:
-                    continue
-                u_hist[u] += 1
+    for result in batch_parser.parse_file(input_file, ['utilities']):
+        for u in result.utilities:
+            if u in bash.BLACK_LIST or u in bash.GREY_LIST:
+                continue
+            u_hist[u] += 1
     return u_hist
 
 
@@ -57,22 +55,21 @@ def get_flag_statistics(top_utilities, input_file):
     flag_counts = {}
     for u in top_utilities:
         flag_counts[u] = set()
-    with open(input_file) as f:
-        for cmd in f:
-            ast = data_tools.bash_parser(cmd, verbose=False)
-            if ast:
-                # DFS 
-                stack = []
-                stack.extend(ast.children)
-                while stack:
-                    node = stack.pop()
-                    if node.is_option():
-                        u = node.utility.value
-                        if u in flag_counts:
-                            flag_counts[u].add(node.value)
-                    stack.extend(node.children)
-            else:
-                print(cmd)
+    for result in batch_parser.parse_file(input_file, ['ast']):
+        ast = result.ast
+        if ast:
+            # DFS 
+            stack = []
+            stack.extend(ast.children)
+            while stack:
+                node = stack.pop()
+                if node.is_option():
+                    u = node.utility.value
+                    if u in flag_counts:
+                        flag_counts[u].add(node.value)
+                stack.extend(node.children)
+        else:
+            print(result.cmd)
     total_flag_count = 0
     for i in range(len(top_utilities)-1, -1, -1):
         u = top_utilities[i]
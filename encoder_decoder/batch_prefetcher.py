@@ -0,0 +1,123 @@
+"""
+Background batch preparation for training.
+
+BatchPrefetcher samples a bucket and a batch of training examples for each
+training step and formats it with model.get_batch in background threads, so
+that the session does not wait on Python batch construction between steps.
+
+Each step's bucket and examples are drawn from a random generator seeded with
+(seed, step), hence the sequence of batches only depends on the seed and not
+on the number of workers or on thread scheduling.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import sys
+import threading
+if sys.version_info > (3, 0):
+    from six.moves import xrange
+
+import numpy as np
+
+
+class BatchPrefetcher(object):
+    def __init__(self, model, data, buckets_scale, num_workers=1,
+                 queue_depth=4, seed=None):
+        """
+        :param model: Model object whose get_batch formats the examples.
+        :param data: Training examples grouped by bucket.
+        :param buckets_scale: Increasing numbers from 0 to 1; the length of
+            [scale[i-1], scale[i]] is the probability of selecting bucket i.
+        :param num_workers: Number of background threads. If 0, batches are
+            prepared synchronously by next_batch.
+        :param queue_depth: Maximum number of batches prepared ahead of the
+            training step.
+        :param seed: Base random seed; drawn from the numpy global random
+            generator if not set.
+        """
+        assert(queue_depth > 0)
+        self.model = model
+        self.data = data
+        self.buckets_scale = buckets_scale
+        self.queue_depth = queue_depth
+        if seed is None:
+            seed = np.random.randint(2**31 - 1)
+        self.seed = seed
+
+        # steps [self.next_read_step, self.next_step) are being prepared or
+        # waiting in self.batches
+        self.next_step = 0
+        self.next_read_step = 0
+        self.batches = {}
+        self.stopped = False
+        self.lock = threading.Condition()
+
+        self.workers = []
+        for _ in xrange(num_workers):
+            worker = threading.Thread(target=self.run)
+            worker.daemon = True
+            worker.start()
+            self.workers.append(worker)
+
+    def sample_batch(self, step):
+        """
+        Sample the bucket and the examples of a training step.
+
+        :return: (bucket_id, formatted_example)
+        """
+        random_state = np.random.RandomState([self.seed, step])
+        random_number_01 = random_state.random_sample()
+        bucket_id = min([i for i in xrange(len(self.buckets_scale))
+                         if self.buckets_scale[i] > random_number_01])
+        formatted_example = self.model.get_batch(
+            self.data, bucket_id, random_state=random_state)
+        return bucket_id, formatted_example
+
+    def next_batch(self):
+        """
+        Block until the batch of the next training step is ready.
+
+        :return: (bucket_id, formatted_example)
+        """
+        if not self.workers:
+            step = self.next_read_step
+            self.next_read_step += 1
+            return self.sample_batch(step)
+
+        with self.lock:
+            while not self.next_read_step in self.batches:
+                self.lock.wait()
+            batch, error = self.batches.pop(self.next_read_step)
+            self.next_read_step += 1
+            self.lock.notify_all()
+        if error is not None:
+            raise error
+        return batch
+
+    def close(self):
+        with self.lock:
+            self.stopped = True
+            self.lock.notify_all()
+        for worker in self.workers:
+            worker.join()
+        self.workers = []
+
+    def run(self):
+        while True:
+            with self.lock:
+                while not self.stopped and \
+                        self.next_step - self.next_read_step >= self.queue_depth:
+                    self.lock.wait()
+                if self.stopped:
+                    return
+                step = self.next_step
+                self.next_step += 1
+            try:
+                batch, error = self.sample_batch(step), None
+            except Exception as e:
+                batch, error = None, e
+            with self.lock:
+                self.batches[step] = (batch, error)
+                self.lock.notify_all()
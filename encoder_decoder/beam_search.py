@@ -17,7 +17,8 @@ from encoder_decoder.graph_utils import nest_map
 class BeamDecoder(object):
     def __init__(self, num_layers, start_token=-1, stop_token=-1, batch_size=1,
                  beam_size=7, use_attention=False, use_copy=False,
-                 copy_fun='copynet', alpha=1.0, locally_normalized=True):
+                 copy_fun='copynet', alpha=1.0, locally_normalized=True,
+                 use_backpointers=False, grammar_constraint=None):
         """
         :param num_classes: int. Number of output classes used
         :param num_layers: int. Number of layers used in the RNN cell.
@@ -29,6 +30,14 @@ class BeamDecoder(object):
         :param alpha: parameter used for length normalization.
         :param locally_normalized: set to true if local normalization is to be
             performed at each search step.
+        :param use_backpointers: set to true to keep only the current symbols
+            and cell states in the beam search state and record per-step
+            back-pointers instead of the full histories, which are
+            reconstructed after the last step (see
+            BeamDecoderCellWrapper.backtrack).
+        :param grammar_constraint: if set, a
+            grammar_constraints.BashGrammarConstraint used to mask the output
+            symbols which cannot follow each partial sequence.
         """
         self.num_layers = num_layers
         self.start_token = start_token
@@ -40,6 +49,8 @@ class BeamDecoder(object):
         self.copy_fun = copy_fun
         self.alpha = alpha
         self.locally_normalized = locally_normalized
+        self.use_backpointers = use_backpointers
+        self.grammar_constraint = grammar_constraint
         print("creating beam search decoder: alpha = {}".format(self.alpha))
 
     @classmethod
@@ -78,7 +89,9 @@ class BeamDecoder(object):
                                       self.batch_size, self.beam_size,
                                       self.use_attention, self.use_copy,
                                       self.copy_fun, self.alpha,
-                                      self.locally_normalized)
+                                      self.locally_normalized,
+                                      self.use_backpointers,
+                                      self.grammar_constraint)
 
     def wrap_state(self, state, output_project):
         dummy = BeamDecoderCellWrapper(None, output_project, self.num_layers,
@@ -86,7 +99,9 @@ class BeamDecoder(object):
                                        self.batch_size, self.beam_size,
                                        self.use_attention, self.use_copy,
                                        self.copy_fun, self.alpha,
-                                       self.locally_normalized)
+                                       self.locally_normalized,
+                                       self.use_backpointers,
+                                       self.grammar_constraint)
         if nest.is_sequence(state):
             dtype = nest.flatten(state)[0].dtype
         else:
@@ -140,7 +155,8 @@ class BeamDecoderCellWrapper(tf.compat.v1.nn.rnn_cell.RNNCell):
     def __init__(self, cell, output_project, num_layers,
                  start_token=-1, stop_token=-1, batch_size=1, beam_size=7,
                  use_attention=False, use_copy=False, copy_fun='copynet',
-                 alpha=1.0, locally_normalized=True):
+                 alpha=1.0, locally_normalized=True, use_backpointers=False,
+                 grammar_constraint=None):
         self.cell = cell
         self.output_project = output_project
         self.num_layers = num_layers
@@ -153,9 +169,19 @@ class BeamDecoderCellWrapper(tf.compat.v1.nn.rnn_cell.RNNCell):
         self.copy_fun = copy_fun
         self.alpha = alpha
         self.locally_normalized = locally_normalized
+        self.use_backpointers = use_backpointers
+        self.grammar_constraint = grammar_constraint
 
         self.full_size = self.batch_size * self.beam_size
         self.seq_len = tf.constant(1e-12, shape=[self.full_size], dtype=tf.float32)
+        # ids of the grammar states of the partial sequences
+        self.grammar_states = tf.zeros([self.full_size], dtype=tf.int64)
+
+        # Per-step search history (only recorded if use_backpointers is set)
+        self.initial_state = None
+        self.parent_refs_history = []
+        self.symbols_history = []
+        self.cell_states_history = []
 
     def __call__(self, cell_inputs, state, scope=None):
         (
@@ -164,7 +190,11 @@ class BeamDecoderCellWrapper(tf.compat.v1.nn.rnn_cell.RNNCell):
             past_cell_states        # LSTM: ([batch_size*self.beam_size, :, dim],
                                     #        [batch_size*self.beam_size, :, dim])
                                     # GRU: [batch_size*self.beam_size, :, dim]
+                                    # (without the time dimension if
+                                    # use_backpointers is set)
         ) = state
+        if self.use_backpointers and self.initial_state is None:
+            self.initial_state = state
 
         past_cell_state = self.get_last_cell_state(past_cell_states)
         if self.use_copy and self.copy_fun == 'copynet':
@@ -198,6 +228,22 @@ class BeamDecoderCellWrapper(tf.compat.v1.nn.rnn_cell.RNNCell):
         stop_mask = tf.expand_dims(tf.cast(
             tf.equal(input_symbols, self.stop_token), tf.float32), 1)
 
+        if self.grammar_constraint is not None:
+            # mask the symbols which cannot follow the partial sequences
+            # according to the grammar
+            grammar_states, grammar_mask = tf.compat.v1.py_func(
+                self.grammar_constraint.step,
+                [self.grammar_states, input_symbols], [tf.int64, tf.float32])
+            grammar_states.set_shape([self.full_size])
+            grammar_mask.set_shape(
+                [self.full_size, self.grammar_constraint.vocab_size])
+            if num_classes > self.grammar_constraint.vocab_size:
+                # copied source tokens are not constrained
+                grammar_mask = tf.concat(axis=1, values=[grammar_mask,
+                    tf.ones([self.full_size,
+                             num_classes - self.grammar_constraint.vocab_size])])
+            logprobs = tf.add(logprobs, -1e18 * (1 - grammar_mask))
+
         # done_mask: indicates stop token in the output vocabulary
         # [1, num_classes]
         # [- - _STOP - - -]
@@ -235,9 +281,15 @@ class BeamDecoderCellWrapper(tf.compat.v1.nn.rnn_cell.RNNCell):
         parent_refs = tf.reshape(indices // num_classes, [-1]) # [batch_size*self.beam_size]
         parent_refs = parent_refs + parent_refs_offsets
 
-        beam_symbols = tf.concat(axis=1, values=[tf.gather(past_beam_symbols, parent_refs),
-                                                 tf.reshape(symbols, [-1, 1])])
+        if self.use_backpointers:
+            # [batch_size*self.beam_size, 1]
+            beam_symbols = tf.reshape(symbols, [-1, 1])
+        else:
+            beam_symbols = tf.concat(axis=1, values=[tf.gather(past_beam_symbols, parent_refs),
+                                                     tf.reshape(symbols, [-1, 1])])
         self.seq_len = tf.squeeze(tf.gather(seq_len, parent_refs), axis=[1])
+        if self.grammar_constraint is not None:
+            self.grammar_states = tf.gather(grammar_states, parent_refs)
 
         if self.use_attention:
             ranked_alignments = nest_map(
@@ -257,7 +309,14 @@ class BeamDecoderCellWrapper(tf.compat.v1.nn.rnn_cell.RNNCell):
             )
             return c_states
 
-        if nest.is_sequence(cell_state):
+        if self.use_backpointers:
+            # the cell state histories are reconstructed in self.backtrack
+            ranked_cell_states = nest_map(
+                lambda element: tf.gather(element, parent_refs), cell_state)
+            self.parent_refs_history.append(parent_refs)
+            self.symbols_history.append(tf.reshape(symbols, [-1]))
+            self.cell_states_history.append(ranked_cell_states)
+        elif nest.is_sequence(cell_state):
             if self.num_layers > 1:
                 ranked_cell_states = [concat_and_gather_tuple_states(pc_states, c_state)
                     for pc_states, c_state in zip(past_cell_states, cell_state)]
@@ -285,7 +344,49 @@ class BeamDecoderCellWrapper(tf.compat.v1.nn.rnn_cell.RNNCell):
         else:
             return ranked_cell_output, compound_cell_state
 
+    def backtrack(self, state):
+        """
+        Reconstruct the symbol and cell state histories of the final beams by
+        following the back-pointers recorded at each step.
+
+        Requires use_backpointers to be set.
+
+        :param state: The beam search state after the last step.
+        :return: The final beam search state in the format used when
+            use_backpointers is not set, i.e. with the full symbol and
+            cell state histories.
+        """
+        assert(self.use_backpointers)
+        initial_symbols, _, initial_cell_state = self.initial_state
+        _, beam_logprobs, _ = state
+
+        # rows[i] is the index of the ancestor of final beam entry i
+        # among the beam entries after the current step
+        rows = tf.range(self.full_size)
+        symbols = []
+        flat_cell_states = []
+        for parent_refs, step_symbols, step_cell_states in zip(
+                reversed(self.parent_refs_history),
+                reversed(self.symbols_history),
+                reversed(self.cell_states_history)):
+            symbols.append(tf.gather(step_symbols, rows))
+            flat_cell_states.append([tf.gather(element, rows)
+                for element in nest.flatten(step_cell_states)])
+            rows = tf.gather(parent_refs, rows)
+        symbols.append(tf.gather(initial_symbols[:, 0], rows))
+        flat_cell_states.append([tf.gather(element, rows)
+            for element in nest.flatten(initial_cell_state)])
+
+        beam_symbols = tf.stack(symbols[::-1], axis=1)
+        cell_states = nest.pack_sequence_as(initial_cell_state,
+            [tf.stack(step_elements, axis=1)
+             for step_elements in zip(*flat_cell_states[::-1])])
+        return beam_symbols, beam_logprobs, cell_states
+
     def get_last_cell_state(self, past_cell_states):
+        if self.use_backpointers:
+            return past_cell_states
+
         def get_last_tuple_state(pc_states):
             c_states, h_states = pc_states
             lc_state = c_states[:, -1, :]
@@ -320,6 +421,9 @@ class BeamDecoderCellWrapper(tf.compat.v1.nn.rnn_cell.RNNCell):
                                          # TODO: dtype-dependent value here
         )
 
+        if self.use_backpointers:
+            return beam_symbols, beam_logprobs, cell_state
+
         return (
             beam_symbols,
             beam_logprobs,
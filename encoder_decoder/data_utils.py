@@ -8,6 +8,9 @@ from __future__ import print_function
 
 import collections
 import functools
+import hashlib
+import itertools
+import json
 import os
 import pickle
 import sys
@@ -115,6 +118,18 @@ class DataPoint(object):
         self.alignments = None
         self.sc_fillers = None      # TODO: this field is no longer used
 
+    @property
+    def alignments(self):
+        # alignment matrices loaded from a compiled feature file are only
+        # built when first accessed
+        if callable(self._alignments):
+            self._alignments = self._alignments()
+        return self._alignments
+
+    @alignments.setter
+    def alignments(self, alignments):
+        self._alignments = alignments
+
 
 class Vocab(object):
     def __init__(self):
@@ -151,28 +166,6 @@ def read_data(FLAGS, split, source, target, use_buckets=True, buckets=None,
     def get_data_file_path(data_dir, split, lang, channel):
         return os.path.join(data_dir, '{}.{}.{}'.format(split, lang, channel))
 
-    def get_source_ids(s):
-        source_ids = []
-        for token in s.split(TOKEN_SEPARATOR):
-            if token in vocab.sc_vocab:
-                source_ids.append(vocab.sc_vocab[token])
-            else:
-                source_ids.append(UNK_ID)
-        return source_ids
-
-    def get_target_input_ids(s):
-        target_ids = []
-        for token in s.split(TOKEN_SEPARATOR):
-            if token in vocab.tg_vocab:
-                target_ids.append(vocab.tg_vocab[token])
-            else:
-                target_ids.append(UNK_ID)
-        if add_start_token:
-            target_ids.insert(0, ROOT_ID)
-        if add_end_token:
-            target_ids.append(EOS_ID)
-        return target_ids
-
     if load_features:
         vocab = load_vocabulary(FLAGS)
 
@@ -181,79 +174,58 @@ def read_data(FLAGS, split, source, target, use_buckets=True, buckets=None,
     tg_path = get_data_file_path(data_dir, split, target, 'filtered')
     print("source file: {}".format(sc_path))
     print("target file: {}".format(tg_path))
-    sc_file = open(sc_path, encoding='utf-8')
-    tg_file = open(tg_path, encoding='utf-8')
+
+    dataset = []
+    with open(sc_path, encoding='utf-8') as sc_file:
+        with open(tg_path, encoding='utf-8') as tg_file:
+            for sc_txt in sc_file.readlines():
+                data_point = DataPoint()
+                data_point.sc_txt = sc_txt.strip()
+                data_point.tg_txt = tg_file.readline().strip()
+                dataset.append(data_point)
+    num_data = len(dataset)
+    data_size = len(dataset)
 
     if load_features:
         token_ext = 'normalized.{}'.format(FLAGS.channel) \
             if FLAGS.normalized else FLAGS.channel
-        sc_token_path = get_data_file_path(data_dir, split, source, token_ext)
-        tg_token_path = get_data_file_path(data_dir, split, target, token_ext)
-        print("source tokenized sequence file: {}".format(sc_token_path))
-        print("target tokenized sequence file: {}".format(tg_token_path))
-        sc_token_file = open(sc_token_path, encoding='utf-8')
-        tg_token_file = open(tg_token_path, encoding='utf-8')
-        with open(os.path.join(data_dir, '{}.{}.align'.format(split, FLAGS.channel)), 'rb') as f:
-            alignments = pickle.load(f)
+        feature_paths = {
+            'sc_tokens': get_data_file_path(data_dir, split, source, token_ext),
+            'tg_tokens': get_data_file_path(data_dir, split, target, token_ext),
+            'alignments': os.path.join(
+                data_dir, '{}.{}.align'.format(split, FLAGS.channel))
+        }
+        print("source tokenized sequence file: {}".format(
+            feature_paths['sc_tokens']))
+        print("target tokenized sequence file: {}".format(
+            feature_paths['tg_tokens']))
+        copynet = FLAGS.use_copy and FLAGS.copy_fun == 'copynet'
+        if copynet:
+            copy_token_ext = 'copy.{}'.format(token_ext)
+            feature_paths['sc_copy_tokens'] = get_data_file_path(
+                data_dir, split, source, copy_token_ext)
+            feature_paths['tg_copy_tokens'] = get_data_file_path(
+                data_dir, split, target, copy_token_ext)
+        features = load_compiled_features(
+            data_dir, split, source, target, token_ext, feature_paths, vocab,
+            add_start_token, add_end_token)
+        assert(features.num_data == num_data)
 
-    dataset = []
-    num_data = 0
-    max_sc_length = 0
-    max_tg_length = 0
-
-    for i, sc_txt in enumerate(sc_file.readlines()):
-        data_point = DataPoint()
-        data_point.sc_txt = sc_txt.strip()
-        data_point.tg_txt = tg_file.readline().strip()
-        if load_features:
-            data_point.sc_ids = \
-                get_source_ids(sc_token_file.readline().strip())
-            if len(data_point.sc_ids) > max_sc_length:
-                max_sc_length = len(data_point.sc_ids)
-            data_point.tg_ids = \
-                get_target_input_ids(tg_token_file.readline().strip())
-            data_point.alignments = alignments[i]
-            if len(data_point.tg_ids) > max_tg_length:
-                max_tg_length = len(data_point.tg_ids)
-        dataset.append(data_point)
-        num_data += 1
-    data_size = len(dataset)
-    sc_file.close()
-    tg_file.close()
-    if load_features:
-        sc_token_file.close()
-        tg_token_file.close()
+        for i, data_point in enumerate(dataset):
+            data_point.sc_ids = features.sc_ids[i]
+            data_point.tg_ids = features.tg_ids[i]
+            data_point.alignments = features.alignments[i]
+            if copynet:
+                data_point.csc_ids = features.csc_ids[i]
+                data_point.ctg_ids = features.ctg_ids[i]
+        max_sc_length = max([len(x) for x in features.sc_ids] + [0])
+        max_tg_length = max([len(x) for x in features.tg_ids] + [0])
 
     print('{} data points read.'.format(num_data))
     if load_features:
         print('max_source_length = {}'.format(max_sc_length))
         print('max_target_length = {}'.format(max_tg_length))
 
-        if FLAGS.use_copy and FLAGS.copy_fun == 'copynet':
-            copy_token_ext = 'copy.{}'.format(token_ext)
-            sc_copy_token_path = get_data_file_path(data_dir, split, source,
-                                                    copy_token_ext)
-            tg_copy_token_path = get_data_file_path(data_dir, split, target,
-                                                    copy_token_ext)
-            sc_token_file = open(sc_token_path, encoding='utf-8')
-            tg_token_file = open(tg_token_path, encoding='utf-8')
-            sc_copy_token_file = open(sc_copy_token_path, encoding='utf-8')
-            tg_copy_token_file = open(tg_copy_token_path, encoding='utf-8')
-            for i, data_point in enumerate(dataset):
-                sc_tokens = sc_token_file.readline().strip().split(TOKEN_SEPARATOR)
-                tg_tokens = tg_token_file.readline().strip().split(TOKEN_SEPARATOR)
-                sc_copy_tokens = \
-                    sc_copy_token_file.readline().strip().split(TOKEN_SEPARATOR)
-                tg_copy_tokens = \
-                    tg_copy_token_file.readline().strip().split(TOKEN_SEPARATOR)
-                data_point.csc_ids, data_point.ctg_ids = \
-                    compute_copy_indices(sc_tokens, tg_tokens,
-                        sc_copy_tokens, tg_copy_tokens, vocab.tg_vocab, token_ext)
-            sc_token_file.close()
-            tg_token_file.close()
-            sc_copy_token_file.close()
-            tg_copy_token_file.close()
-
     if load_features and use_buckets:
         print('Group data points into buckets...')
         if split == 'train':
@@ -318,6 +290,234 @@ def read_data(FLAGS, split, source, target, use_buckets=True, buckets=None,
     return D
 
 
+class CompiledFeatures(object):
+    """
+    Feature vectors of a dataset split. The id sequences are views into flat
+    int32 arrays memory-mapped from the compiled feature file.
+    """
+    def __init__(self):
+        self.num_data = 0
+        self.sc_ids = None
+        self.tg_ids = None
+        self.csc_ids = None         # CopyNet training source ids
+        self.ctg_ids = None         # CopyNet training target ids
+        self.alignments = None      # functions building the CSR matrices
+
+
+COMPILED_FEATURES_VERSION = 1
+
+
+def get_vocab_signature(rev_vocab):
+    return hashlib.md5('\n'.join(rev_vocab[i] for i in xrange(len(rev_vocab)))
+                       .encode('utf-8')).hexdigest()
+
+
+def load_compiled_features(data_dir, split, source, target, token_ext,
+                           feature_paths, vocab, add_start_token=False,
+                           add_end_token=False):
+    """
+    Load the feature vectors of a dataset split from its compiled feature
+    file, compiling the text feature files first if the compiled file does
+    not exist or is out of date.
+
+    The compiled file is specific to the vocabularies (hence also the
+    minimum vocabulary frequency), the start/end tokens and whether CopyNet
+    features are used; it is rebuilt if any of the text feature files has
+    changed since it was written.
+
+    :param feature_paths: Paths to the text feature files: 'sc_tokens',
+        'tg_tokens', 'alignments' and, for CopyNet, 'sc_copy_tokens' and
+        'tg_copy_tokens'.
+    """
+    signature = {
+        'version': COMPILED_FEATURES_VERSION,
+        'sc_vocab': get_vocab_signature(vocab.rev_sc_vocab),
+        'tg_vocab': get_vocab_signature(vocab.rev_tg_vocab),
+        'add_start_token': add_start_token,
+        'add_end_token': add_end_token,
+        'copynet': 'sc_copy_tokens' in feature_paths
+    }
+    digest = hashlib.md5(json.dumps(signature, sort_keys=True)
+                         .encode('utf-8')).hexdigest()[:12]
+    path = os.path.join(data_dir, '{}.{}-{}.{}.{}.features'.format(
+        split, source, target, token_ext, digest))
+    header = dict(signature)
+    header['feature_files'] = dict(
+        (key, [os.path.getsize(feature_path),
+               int(os.path.getmtime(feature_path))])
+        for key, feature_path in feature_paths.items())
+
+    if os.path.exists(path):
+        arrays, compiled_header = read_compiled_feature_file(path)
+        if compiled_header == header:
+            print("compiled feature file: {}".format(path))
+            return arrays_to_features(arrays)
+    print("Compiling feature files into {}...".format(path))
+    arrays = compile_features(feature_paths, vocab, token_ext,
+                              add_start_token, add_end_token)
+    try:
+        write_compiled_feature_file(path, header, arrays)
+    except (IOError, OSError) as e:
+        print("Warning: cannot save compiled feature file: {}".format(e))
+    return arrays_to_features(arrays)
+
+
+def compile_features(feature_paths, vocab, token_ext, add_start_token=False,
+                     add_end_token=False):
+    """
+    Convert the text feature files of a dataset split into flat arrays:
+    for each id sequence type, the concatenated ids ('<name>') and the start
+    offsets of each data point ('<name>_offsets'); the alignment matrices
+    are stored in CSR format with one row pointer array per data point.
+    """
+    def get_source_ids(s):
+        source_ids = []
+        for token in s.split(TOKEN_SEPARATOR):
+            if token in vocab.sc_vocab:
+                source_ids.append(vocab.sc_vocab[token])
+            else:
+                source_ids.append(UNK_ID)
+        return source_ids
+
+    def get_target_input_ids(s):
+        target_ids = []
+        for token in s.split(TOKEN_SEPARATOR):
+            if token in vocab.tg_vocab:
+                target_ids.append(vocab.tg_vocab[token])
+            else:
+                target_ids.append(UNK_ID)
+        if add_start_token:
+            target_ids.insert(0, ROOT_ID)
+        if add_end_token:
+            target_ids.append(EOS_ID)
+        return target_ids
+
+    def read_lines(path):
+        with open(path, encoding='utf-8') as f:
+            return [line.strip() for line in f.readlines()]
+
+    def flatten(sequences, dtype=np.int32):
+        offsets = np.zeros(len(sequences) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(x) for x in sequences])
+        return np.fromiter(itertools.chain.from_iterable(sequences),
+                           dtype=dtype, count=int(offsets[-1])), offsets
+
+    arrays = {}
+    sc_token_lines = read_lines(feature_paths['sc_tokens'])
+    tg_token_lines = read_lines(feature_paths['tg_tokens'])
+    arrays['sc_ids'], arrays['sc_ids_offsets'] = \
+        flatten([get_source_ids(x) for x in sc_token_lines])
+    arrays['tg_ids'], arrays['tg_ids_offsets'] = \
+        flatten([get_target_input_ids(x) for x in tg_token_lines])
+
+    if 'sc_copy_tokens' in feature_paths:
+        sc_copy_token_lines = read_lines(feature_paths['sc_copy_tokens'])
+        tg_copy_token_lines = read_lines(feature_paths['tg_copy_tokens'])
+        csc_ids, ctg_ids = [], []
+        for i in xrange(len(sc_token_lines)):
+            csc, ctg = compute_copy_indices(
+                sc_token_lines[i].split(TOKEN_SEPARATOR),
+                tg_token_lines[i].split(TOKEN_SEPARATOR),
+                sc_copy_token_lines[i].split(TOKEN_SEPARATOR),
+                tg_copy_token_lines[i].split(TOKEN_SEPARATOR),
+                vocab.tg_vocab, token_ext)
+            csc_ids.append(csc)
+            ctg_ids.append(ctg)
+        arrays['csc_ids'], arrays['csc_ids_offsets'] = flatten(csc_ids)
+        arrays['ctg_ids'], arrays['ctg_ids_offsets'] = flatten(ctg_ids)
+
+    with open(feature_paths['alignments'], 'rb') as f:
+        alignments = [ssp.csr_matrix(x) for x in pickle.load(f)]
+    arrays['alignment_shapes'] = np.array(
+        [x.shape for x in alignments], dtype=np.int64).reshape([-1, 2])
+    arrays['alignment_indptr'], arrays['alignment_indptr_offsets'] = \
+        flatten([x.indptr for x in alignments])
+    arrays['alignment_indices'], arrays['alignment_indices_offsets'] = \
+        flatten([x.indices for x in alignments])
+    arrays['alignment_data'] = np.fromiter(itertools.chain.from_iterable(
+        x.data for x in alignments), dtype=np.int32,
+        count=len(arrays['alignment_indices']))
+    return arrays
+
+
+def arrays_to_features(arrays):
+    def split(name):
+        offsets = arrays[name + '_offsets']
+        return [arrays[name][offsets[i]:offsets[i+1]]
+                for i in xrange(len(offsets) - 1)]
+
+    features = CompiledFeatures()
+    features.sc_ids = split('sc_ids')
+    features.tg_ids = split('tg_ids')
+    features.num_data = len(features.sc_ids)
+    if 'csc_ids' in arrays:
+        features.csc_ids = split('csc_ids')
+        features.ctg_ids = split('ctg_ids')
+    # alignment matrices are built lazily (see DataPoint.alignments)
+    indptrs = split('alignment_indptr')
+    offsets = arrays['alignment_indices_offsets']
+    features.alignments = []
+    for i, shape in enumerate(arrays['alignment_shapes']):
+        features.alignments.append(functools.partial(ssp.csr_matrix,
+            (arrays['alignment_data'][offsets[i]:offsets[i+1]],
+             arrays['alignment_indices'][offsets[i]:offsets[i+1]],
+             indptrs[i]), shape=tuple(shape), copy=False))
+    return features
+
+
+def write_compiled_feature_file(path, header, arrays):
+    """
+    File layout: the header length (little-endian int64), the JSON header,
+    then each array, starting at 8-byte aligned offsets recorded in the
+    header.
+    """
+    def align(n):
+        return (n + 7) // 8 * 8
+
+    header = dict(header)
+    header['arrays'] = {}
+    offset = 0
+    for name in sorted(arrays):
+        array = np.ascontiguousarray(arrays[name])
+        header['arrays'][name] = [offset, array.dtype.str, list(array.shape)]
+        offset = align(offset + array.nbytes)
+    header_bytes = json.dumps(header, sort_keys=True).encode('utf-8')
+    data_start = align(8 + len(header_bytes))
+
+    # write to a temporary file first so that concurrent readers never see
+    # a partially written file
+    tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+    with open(tmp_path, 'wb') as o_f:
+        o_f.write(np.array([len(header_bytes)], dtype='<i8').tobytes())
+        o_f.write(header_bytes)
+        for name in sorted(arrays):
+            o_f.seek(data_start + header['arrays'][name][0])
+            o_f.write(np.ascontiguousarray(arrays[name]).tobytes())
+    os.rename(tmp_path, path)
+
+
+def read_compiled_feature_file(path):
+    """
+    Memory-map the arrays of a compiled feature file.
+
+    :return: (arrays, header)
+    """
+    with open(path, 'rb') as f:
+        header_length = int(np.frombuffer(f.read(8), dtype='<i8')[0])
+        header = json.loads(f.read(header_length).decode('utf-8'))
+    data_start = (8 + header_length + 7) // 8 * 8
+    arrays = {}
+    for name, (offset, dtype, shape) in header.pop('arrays').items():
+        if np.prod(shape) == 0:
+            arrays[name] = np.zeros(shape, dtype=dtype)
+        else:
+            # plain ndarray views of the mapped memory are cheaper to slice
+            arrays[name] = np.memmap(path, dtype=dtype, mode='r',
+                                     offset=data_start + offset,
+                                     shape=tuple(shape)).view(np.ndarray)
+    return arrays, header
+
+
 def load_vocabulary(FLAGS):
     data_dir = FLAGS.data_dir
     source, target = ('nl', 'cm') if not FLAGS.explain else ('cm', 'nl')
@@ -441,14 +641,25 @@ def prepare_data(FLAGS):
         (2) cm vocabulary
         (3) nl token ids
         (4) cm token ids
+        (5) compiled feature files of the specified channel (read by
+            read_data)
     """
     data_dir = FLAGS.data_dir
     channel = FLAGS.channel if FLAGS.channel else ''
     if channel and FLAGS.normalized:
         channel = 'normalized.{}'.format(channel)
+    # word normalizations are shared across channels, splits and runs
+    tokenizer_table_path = os.path.join(data_dir, 'nl.tokenizer.table')
+    tokenizer.get_tokenizer().load_table(tokenizer_table_path)
     prepare_dataset_split(data_dir, 'train', channel=channel)
     prepare_dataset_split(data_dir, 'dev', channel=channel)
     prepare_dataset_split(data_dir, 'test', channel=channel)
+    tokenizer.get_tokenizer().save_table(tokenizer_table_path)
+    if channel:
+        source, target = ('nl', 'cm') if not FLAGS.explain else ('cm', 'nl')
+        for split in data_splits:
+            read_data(FLAGS, split, source, target, use_buckets=False,
+                      add_start_token=True, add_end_token=True)
 
 
 def prepare_dataset_split(data_dir, split, channel=''):
@@ -733,6 +944,30 @@ def tokens_to_ids(tokens, vocabulary):
     return token_ids
 
 
+def pad_batch(inputs, output_length, reversed_output=False):
+    """
+    Pack a batch of index sequences into a [batch_size, output_length] matrix.
+
+    Each sequence is padded with PAD_ID to output_length and, if
+    reversed_output is set, reversed after padding (so that the paddings come
+    first). Sequences longer than output_length are truncated to their first
+    (or last, if reversed_output is set) output_length indices.
+    """
+    if reversed_output:
+        inputs = [input[-output_length:] for input in inputs]
+    else:
+        inputs = [input[:output_length] for input in inputs]
+    lengths = np.array([len(input) for input in inputs], dtype=np.int64)
+    batch_inputs = np.full([len(inputs), output_length], PAD_ID,
+                           dtype=np.int32)
+    batch_inputs[np.arange(output_length) < lengths[:, np.newaxis]] = \
+        np.fromiter(itertools.chain.from_iterable(inputs), dtype=np.int32,
+                    count=int(np.sum(lengths)))
+    if reversed_output:
+        batch_inputs = batch_inputs[:, ::-1]
+    return batch_inputs
+
+
 def compute_copy_indices(sc_tokens, tg_tokens, sc_copy_tokens, tg_copy_tokens,
                          tg_vocab, channel):
     assert(len(sc_tokens) == len(sc_copy_tokens))
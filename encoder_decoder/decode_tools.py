@@ -13,13 +13,16 @@ matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 
 import numpy as np
+import tensorflow as tf
 
+import collections
 import datetime, time
+import pickle
 import re
 import shutil
 
 from bashlint import bash, data_tools
-from encoder_decoder import data_utils, slot_filling
+from encoder_decoder import data_utils, framework, slot_filling
 from eval import tree_dist
 from nlp_tools import constants, format_args, tokenizer
 
@@ -36,29 +39,27 @@ def demo(sess, model, FLAGS):
     sentence = sys.stdin.readline()
 
     vocabs = data_utils.load_vocabulary(FLAGS)
+    if FLAGS.fill_argument_slots:
+        slot_filling_classifier = get_slot_filling_classifer(FLAGS)
+    else:
+        slot_filling_classifier = None
+    translation_cache = get_translation_cache(FLAGS, vocabs)
 
     while sentence:
-        if FLAGS.fill_argument_slots:
-            slot_filling_classifier = get_slot_filling_classifer(FLAGS)
-            batch_outputs, sequence_logits = translate_fun(sentence, sess, model,
-                vocabs, FLAGS, slot_filling_classifier=slot_filling_classifier)
-        else:
-            batch_outputs, sequence_logits = translate_fun(sentence, sess, model,
-                vocabs, FLAGS)
+        batch_outputs, sequence_logits = translate_fun(sentence, sess, model,
+            vocabs, FLAGS, slot_filling_classifier=slot_filling_classifier,
+            translation_cache=translation_cache)
+        top_k_predictions = get_top_k_predictions(
+            batch_outputs, sequence_logits, min(FLAGS.beam_size, 10), FLAGS)
         if FLAGS.token_decoding_algorithm == 'greedy':
-            tree, pred_cmd, outputs = batch_outputs[0]
-            score = sequence_logits[0]
+            pred_cmd, score = top_k_predictions[0]
             print('{} ({})'.format(pred_cmd, score))
         elif FLAGS.token_decoding_algorithm == 'beam_search':
-            if batch_outputs:
-                top_k_predictions = batch_outputs[0]
-                top_k_scores = sequence_logits[0]
-                for j in xrange(min(FLAGS.beam_size, 10, len(batch_outputs[0]))):
-                    if len(top_k_predictions) <= j:
-                        break
-                    top_k_pred_tree, top_k_pred_cmd = top_k_predictions[j]
+            if top_k_predictions:
+                for j, (top_k_pred_cmd, top_k_score) in \
+                        enumerate(top_k_predictions):
                     print('Prediction {}: {} ({}) '.format(
-                        j+1, top_k_pred_cmd, top_k_scores[j]))
+                        j+1, top_k_pred_cmd, top_k_score))
                 print()
             else:
                 print(APOLOGY_MSG)
@@ -66,54 +67,198 @@ def demo(sess, model, FLAGS):
         sys.stdout.flush()
         sentence = sys.stdin.readline()
 
+    if translation_cache is not None and translation_cache.path:
+        translation_cache.save()
+
+
+def get_top_k_predictions(batch_outputs, sequence_logits, top_k, FLAGS):
+    """
+    Extract the (command, score) pairs of the top-k predictions from the
+    output of translate_fun.
+    """
+    if not batch_outputs:
+        return []
+    if FLAGS.token_decoding_algorithm == 'greedy':
+        _, pred_cmd = batch_outputs[0]
+        return [(pred_cmd, sequence_logits[0])]
+    top_k_predictions = batch_outputs[0]
+    top_k_scores = sequence_logits[0]
+    return [(top_k_predictions[j][1], top_k_scores[j])
+            for j in xrange(min(top_k, len(top_k_predictions)))]
+
 
 def translate_fun(data_point, sess, model, vocabs, FLAGS,
-                  slot_filling_classifier=None):
-    tg_ids = [data_utils.ROOT_ID]
-    decoder_features = [[tg_ids]]
+                  slot_filling_classifier=None, translation_cache=None):
+    return translate_batch([data_point], sess, model, vocabs, FLAGS,
+        slot_filling_classifier=slot_filling_classifier,
+        translation_cache=translation_cache)[0]
+
+
+def translate_batch(data_points, sess, model, vocabs, FLAGS,
+                    slot_filling_classifier=None, translation_cache=None):
+    """
+    Translate a list of examples with one neural network step per
+    model.batch_size examples.
+
+    :param data_points: list of examples, each of which is either a natural
+        language string or a data group as returned by
+        data_utils.group_parallel_data.
+    :param translation_cache: If set, examples whose encoder input is in the
+        cache skip the neural network and only have their argument slots
+        filled (see TranslationCache).
+    :return: list of (decoded_outputs, sequence_logits) pairs aligned with
+        data_points, each identical to what translate_fun returns for the
+        example.
+    """
+    example_features = [get_example_features(data_point, vocabs, FLAGS)
+                        for data_point in data_points]
+    return translate_example_features(
+        example_features, sess, model, vocabs, FLAGS,
+        slot_filling_classifier, translation_cache)
+
+
+def translate_example_features(example_features, sess, model, vocabs, FLAGS,
+                               slot_filling_classifier=None,
+                               translation_cache=None):
+    """
+    translate_batch on examples whose features are computed with
+    get_example_features.
+    """
+    results = [None] * len(example_features)
+
+    # Examples in a batch must share the same bucket
+    bucket_groups = collections.defaultdict(list)
+    for i, features in enumerate(example_features):
+        if translation_cache is not None:
+            templates = translation_cache.get(
+                get_translation_cache_key(features, FLAGS))
+            if templates is not None:
+                results[i] = (fill_template_beam(templates, FLAGS,
+                                                 features[3],
+                                                 slot_filling_classifier),
+                              templates.sequence_logits)
+                continue
+        bucket_groups[get_bucket_id(model, features[1])].append(i)
+
+    for bucket_id in sorted(bucket_groups):
+        example_ids = bucket_groups[bucket_id]
+        for start in xrange(0, len(example_ids), model.batch_size):
+            batch_ids = example_ids[start:start+model.batch_size]
+            batch_results = translate_bucket_batch(
+                [example_features[i] for i in batch_ids], bucket_id, sess,
+                model, vocabs, FLAGS, slot_filling_classifier,
+                translation_cache)
+            for i, result in zip(batch_ids, batch_results):
+                results[i] = result
+    return results
+
+
+def get_example_features(data_point, vocabs, FLAGS):
+    """
+    Compute the neural network input features of a single example.
+
+    :return: (source_str, encoder_features, copy_tokens, sc_fillers), where
+        encoder_features is indexed by channel.
+    """
     if type(data_point) is str:
         source_str = data_point
-        encoder_features = query_to_encoder_features(data_point, vocabs, FLAGS)
+        encoder_features = [channel[0] for channel in
+                            query_to_encoder_features(data_point, vocabs, FLAGS)]
     else:
         source_str = data_point[0].sc_txt
-        encoder_features = [[data_point[0].sc_ids]]
+        encoder_features = [data_point[0].sc_ids]
         if FLAGS.use_copy and FLAGS.copy_fun == 'copynet':
-            encoder_features.append([data_point[0].csc_ids])
+            encoder_features.append(data_point[0].csc_ids)
 
     if FLAGS.use_copy and FLAGS.copy_fun == 'copynet':
-        # append dummy copynet target features (
-        # used only for computing training objectives)
-        ctg_ids = [data_utils.ROOT_ID]
-        decoder_features.append([ctg_ids])
         # tokenize the source string with minimal changes on the token form
-        copy_tokens = [query_to_copy_tokens(source_str, FLAGS)]
+        copy_tokens = query_to_copy_tokens(source_str, FLAGS)
     else:
         copy_tokens = None
     if FLAGS.normalized:
         _, entities = tokenizer.ner_tokenizer(source_str)
-        sc_fillers = [entities[0]]
+        sc_fillers = entities[0]
     else:
         sc_fillers = None
+    return source_str, encoder_features, copy_tokens, sc_fillers
+
 
-    # Which bucket does it belong to?
+def get_bucket_id(model, encoder_features):
+    """
+    Which bucket does the example belong to?
+    """
     bucket_ids = [b for b in xrange(len(model.buckets))
-                  if model.buckets[b][0] > len(encoder_features[0][0])]
-    bucket_id = min(bucket_ids) if bucket_ids else (len(model.buckets) - 1)
-    
-    # Get a 1-element batch to feed the sentence to the model.
+                  if model.buckets[b][0] > len(encoder_features[0])]
+    return min(bucket_ids) if bucket_ids else (len(model.buckets) - 1)
+
+
+def translate_bucket_batch(example_features, bucket_id, sess, model, vocabs,
+                           FLAGS, slot_filling_classifier=None,
+                           translation_cache=None):
+    """
+    Run one neural network step on at most model.batch_size examples from
+    the same bucket and split the decoding output back out per example.
+    """
+    batch_size = len(example_features)
+    assert(batch_size <= model.batch_size)
+    # The graph is built for a fixed batch size, pad the batch with copies of
+    # the last example and discard their outputs.
+    padded_features = example_features + \
+        [example_features[-1]] * (model.batch_size - batch_size)
+
+    copynet = FLAGS.use_copy and FLAGS.copy_fun == 'copynet'
+    encoder_features = [[features[1][0] for features in padded_features]]
+    decoder_features = [[[data_utils.ROOT_ID]] * model.batch_size]
+    if copynet:
+        encoder_features.append(
+            [features[1][1] for features in padded_features])
+        # append dummy copynet target features (
+        # used only for computing training objectives)
+        decoder_features.append([[data_utils.ROOT_ID]] * model.batch_size)
+
     formatted_example = model.format_batch(
         encoder_features, decoder_features, bucket_id=bucket_id)
 
     # Compute neural network decoding output
     model_outputs = model.step(sess, formatted_example, bucket_id,
                                forward_only=True)
-    sequence_logits = model_outputs.sequence_logits
-
-    decoded_outputs = decode(model_outputs, FLAGS, vocabs, sc_fillers=sc_fillers,
-                             slot_filling_classifier=slot_filling_classifier,
-                             copy_tokens=copy_tokens)
 
-    return decoded_outputs, sequence_logits
+    results = []
+    for batch_id in xrange(batch_size):
+        features = example_features[batch_id]
+        _, _, copy_tokens, sc_fillers = features
+        templates = TemplateBeam(slice_model_outputs(
+            model_outputs, batch_id, FLAGS), FLAGS, vocabs, copy_tokens)
+        if translation_cache is not None:
+            translation_cache.put(
+                get_translation_cache_key(features, FLAGS), templates)
+        results.append((
+            fill_template_beam(templates, FLAGS, sc_fillers,
+                               slot_filling_classifier),
+            templates.sequence_logits))
+    return results
+
+
+def slice_model_outputs(model_outputs, batch_id, FLAGS):
+    """
+    Extract the neural network output of a single example from a batch output.
+    """
+    if FLAGS.token_decoding_algorithm == 'beam_search':
+        decoder_start = batch_id * FLAGS.beam_size
+        decoder_end = (batch_id + 1) * FLAGS.beam_size
+    else:
+        decoder_start, decoder_end = batch_id, batch_id + 1
+    O = framework.Output()
+    O.output_symbols = model_outputs.output_symbols[batch_id:batch_id+1]
+    O.sequence_logits = model_outputs.sequence_logits[batch_id:batch_id+1]
+    O.losses = model_outputs.losses
+    O.attn_alignments = model_outputs.attn_alignments
+    O.pointers = model_outputs.pointers
+    O.encoder_hidden_states = \
+        model_outputs.encoder_hidden_states[batch_id:batch_id+1]
+    O.decoder_hidden_states = \
+        model_outputs.decoder_hidden_states[decoder_start:decoder_end]
+    return O
 
 
 def decode(model_outputs, FLAGS, vocabs, sc_fillers=None,
@@ -132,158 +277,388 @@ def decode(model_outputs, FLAGS, vocabs, sc_fillers=None,
           how to parse and a dummy string for those we don't
         - target is the output string
     """
-    rev_tg_vocab = vocabs.rev_tg_vocab
-
-    encoder_outputs = model_outputs.encoder_hidden_states
-    decoder_outputs = model_outputs.decoder_hidden_states
-
-    if FLAGS.fill_argument_slots:
-        assert(sc_fillers is not None)
-        assert(slot_filling_classifier is not None)
-        assert(encoder_outputs is not None)
-        assert(decoder_outputs is not None)
-
-    output_symbols = model_outputs.output_symbols
-    batch_size = len(output_symbols)
     batch_outputs = []
-    num_output_examples = 0
+    for batch_id in xrange(len(model_outputs.output_symbols)):
+        templates = TemplateBeam(
+            slice_model_outputs(model_outputs, batch_id, FLAGS), FLAGS, vocabs,
+            None if copy_tokens is None else copy_tokens[batch_id])
+        batch_outputs.extend(fill_template_beam(
+            templates, FLAGS,
+            None if sc_fillers is None else sc_fillers[batch_id],
+            slot_filling_classifier))
+    return batch_outputs
 
-    for batch_id in xrange(batch_size):
-        def as_str(output, r_tg_vocab):
-            if output < FLAGS.tg_vocab_size:
-                token = r_tg_vocab[output]
-            else:
-                if FLAGS.use_copy and FLAGS.copy_fun == 'copynet':
-                    source_id = output - FLAGS.tg_vocab_size
-                    if source_id >= 0 and source_id < len(copy_tokens[batch_id]):
-                        token = copy_tokens[batch_id][source_id]
-                    else:
-                        return data_utils._UNK
-                else:
-                    return data_utils._UNK
-            return token
 
-        top_k_predictions = output_symbols[batch_id]
+class TemplateBeam(object):
+    """
+    The decoded command templates of a single example, i.e. the decoding
+    output before argument slot filling.
+
+    The templates only depend on the neural network output, hence they can be
+    reused for any source sentence which has the same encoder input. Beam
+    entries are decoded and checked for grammaticality lazily, since slot
+    filling usually stops after the first few qualified entries.
+    """
+    def __init__(self, example_outputs, FLAGS, vocabs, copy_tokens=None):
+        """
+        :param example_outputs: neural network output of a single example
+            (see slice_model_outputs).
+        :param copy_tokens: copynet source tokens of the example.
+        """
+        self.FLAGS = FLAGS
+        self.vocabs = vocabs
+        self.copy_tokens = copy_tokens
+
+        top_k_predictions = example_outputs.output_symbols[0]
         if FLAGS.token_decoding_algorithm == 'beam_search':
             assert(len(top_k_predictions) == FLAGS.beam_size)
-            beam_outputs = []
         else:
             # pack greedy decoding results into size-1 beam
             top_k_predictions = [top_k_predictions]
-
-        for beam_id in xrange(len(top_k_predictions)):
-            # Step 1: transform the neural network output into readable strings
-            prediction = top_k_predictions[beam_id]
-            outputs = [int(pred) for pred in prediction]
-            
-            # If there is an EOS symbol in outputs, cut them at that point.
-            if data_utils.EOS_ID in outputs:
-                outputs = outputs[:outputs.index(data_utils.EOS_ID)]
-            if data_utils.PAD_ID in outputs:
-                outputs = outputs[:outputs.index(data_utils.PAD_ID)]
-            output_tokens = []
-            tg_slots = {}
-            for token_id in xrange(len(outputs)):
-                output = outputs[token_id]
-                pred_token = as_str(output, rev_tg_vocab)
-                if data_tools.flag_suffix in pred_token:
-                    pred_token = pred_token.split(data_tools.flag_suffix)[0]
-                # process argument slots
-                if pred_token in bash.argument_types:
-                    if token_id > 0 and format_args.is_min_flag(
-                        rev_tg_vocab[outputs[token_id-1]]):
-                        pred_token_type = 'Timespan'
-                    else:
-                        pred_token_type = pred_token
-                    tg_slots[token_id] = (pred_token, pred_token_type)
-                output_tokens.append(pred_token)
-
-            if FLAGS.channel == 'partial.token':
-                # process partial-token outputs
-                merged_output_tokens = []
-                buffer = ''
-                load_buffer = False
-                for token in output_tokens:
-                    if load_buffer:
-                        if token == data_utils._ARG_END:
-                            merged_output_tokens.append(buffer)
-                            load_buffer = False
-                            buffer = ''
-                        else:
-                            buffer += token
+        self.predictions = top_k_predictions
+        self.sequence_logits = example_outputs.sequence_logits
+        if FLAGS.fill_argument_slots:
+            self.encoder_outputs = example_outputs.encoder_hidden_states[0]
+            self.decoder_outputs = example_outputs.decoder_hidden_states
+        else:
+            # The hidden states are only used by the slot filling classifier
+            self.encoder_outputs = None
+            self.decoder_outputs = None
+        self.templates = {}
+
+    def __len__(self):
+        return len(self.predictions)
+
+    def __getitem__(self, beam_id):
+        """
+        :return: (output_tokens, tg_slots, target, target_ast) of the beam
+            entry or None if the entry is filtered as non-grammatical.
+        """
+        if not beam_id in self.templates:
+            self.templates[beam_id] = self.decode_template(beam_id)
+        return self.templates[beam_id]
+
+    def as_str(self, output):
+        FLAGS = self.FLAGS
+        if output < FLAGS.tg_vocab_size:
+            token = self.vocabs.rev_tg_vocab[output]
+        else:
+            if FLAGS.use_copy and FLAGS.copy_fun == 'copynet':
+                source_id = output - FLAGS.tg_vocab_size
+                if source_id >= 0 and source_id < len(self.copy_tokens):
+                    token = self.copy_tokens[source_id]
+                else:
+                    return data_utils._UNK
+            else:
+                return data_utils._UNK
+        return token
+
+    def decode_template(self, beam_id):
+        FLAGS = self.FLAGS
+        rev_tg_vocab = self.vocabs.rev_tg_vocab
+
+        # Step 1: transform the neural network output into readable strings
+        prediction = self.predictions[beam_id]
+        outputs = [int(pred) for pred in prediction]
+
+        # If there is an EOS symbol in outputs, cut them at that point.
+        if data_utils.EOS_ID in outputs:
+            outputs = outputs[:outputs.index(data_utils.EOS_ID)]
+        if data_utils.PAD_ID in outputs:
+            outputs = outputs[:outputs.index(data_utils.PAD_ID)]
+        output_tokens = []
+        tg_slots = {}
+        for token_id in xrange(len(outputs)):
+            output = outputs[token_id]
+            pred_token = self.as_str(output)
+            if data_tools.flag_suffix in pred_token:
+                pred_token = pred_token.split(data_tools.flag_suffix)[0]
+            # process argument slots
+            if pred_token in bash.argument_types:
+                if token_id > 0 and format_args.is_min_flag(
+                    rev_tg_vocab[outputs[token_id-1]]):
+                    pred_token_type = 'Timespan'
+                else:
+                    pred_token_type = pred_token
+                tg_slots[token_id] = (pred_token, pred_token_type)
+            output_tokens.append(pred_token)
+
+        if FLAGS.channel == 'partial.token':
+            # process partial-token outputs
+            merged_output_tokens = []
+            buffer = ''
+            load_buffer = False
+            for token in output_tokens:
+                if load_buffer:
+                    if token == data_utils._ARG_END:
+                        merged_output_tokens.append(buffer)
+                        load_buffer = False
+                        buffer = ''
                     else:
-                        if token == data_utils._ARG_START:
-                            load_buffer = True
-                        else:
-                            merged_output_tokens.append(token)
-                if buffer:
-                    merged_output_tokens.append(buffer)
-                output_tokens = merged_output_tokens
-    
-            if FLAGS.channel == 'char':
-                target = ''
-                for char in output_tokens:
-                    if char == data_utils.constants._SPACE:
-                        target += ' '
+                        buffer += token
+                else:
+                    if token == data_utils._ARG_START:
+                        load_buffer = True
                     else:
-                        target += char
-            else:
-                target = ' '.join(output_tokens)
-            
-            # Step 2: checvik if the predicted command template is grammatical
-            if FLAGS.grammatical_only and not FLAGS.explain:
-                if FLAGS.dataset.startswith('bash'):
-                    target = re.sub('( ;\s+)|( ;$)', ' \\; ', target)
-                    target_ast = data_tools.bash_parser(target, verbose=False)
-                elif FLAGS.dataset.startswith('regex'):
-                    # TODO: check if a predicted regular expression is legal
-                    target_ast = '__DUMMY_TREE__'
+                        merged_output_tokens.append(token)
+            if buffer:
+                merged_output_tokens.append(buffer)
+            output_tokens = merged_output_tokens
+
+        if FLAGS.channel == 'char':
+            target = ''
+            for char in output_tokens:
+                if char == data_utils.constants._SPACE:
+                    target += ' '
                 else:
-                    target_ast = data_tools.paren_parser(target)
-                # filter out non-grammatical output
-                if target_ast is None:
-                    continue
-            else:
+                    target += char
+        else:
+            target = ' '.join(output_tokens)
+
+        # Step 2: check if the predicted command template is grammatical
+        if FLAGS.grammatical_only and not FLAGS.explain:
+            if FLAGS.dataset.startswith('bash'):
+                target = re.sub('( ;\s+)|( ;$)', ' \\; ', target)
+                target_ast = data_tools.bash_parser(target, verbose=False)
+            elif FLAGS.dataset.startswith('regex'):
+                # TODO: check if a predicted regular expression is legal
                 target_ast = '__DUMMY_TREE__'
-
-            # Step 3: check if the predicted command templates have enough
-            # slots to hold the fillers (to rule out templates that are
-            # trivially unqualified)
-            output_example = False
-            if FLAGS.explain or not FLAGS.dataset.startswith('bash') \
-                    or not FLAGS.normalized:
-                output_example = True
             else:
-                # Step 3: match the fillers to the argument slots
-                batch_sc_fillers = sc_fillers[batch_id]
-                if len(tg_slots) >= len(batch_sc_fillers):
-                    if FLAGS.fill_argument_slots:
-                        target_ast, target, _ = slot_filling.stable_slot_filling(
-                            output_tokens, batch_sc_fillers, tg_slots, None,
-                            encoder_outputs[batch_id],
-                            decoder_outputs[batch_id*FLAGS.beam_size+beam_id],
-                            slot_filling_classifier, verbose=False)
-                    else:
-                        output_example = True
-                    if not output_example and (target_ast is not None):
-                        output_example = True
+                target_ast = data_tools.paren_parser(target)
+            # filter out non-grammatical output
+            if target_ast is None:
+                return None
+        else:
+            target_ast = '__DUMMY_TREE__'
+
+        return output_tokens, tg_slots, target, target_ast
 
-            if output_example:
-                if FLAGS.token_decoding_algorithm == 'greedy':
-                    batch_outputs.append((target_ast, target))
+
+def fill_template_beam(templates, FLAGS, sc_fillers=None,
+                       slot_filling_classifier=None):
+    """
+    Fill the argument slots of the decoded command templates of a single
+    example with the argument values extracted from its source sentence.
+
+    :param templates: TemplateBeam of the example.
+    :param sc_fillers: argument values extracted from the source sentence.
+    :return: list of (target_ast, target) tuples for greedy decoding, and
+        the nested list for beam search decoding (empty if no template
+        qualifies), in the same format as decode.
+    """
+    if FLAGS.fill_argument_slots:
+        assert(sc_fillers is not None)
+        assert(slot_filling_classifier is not None)
+        assert(templates.encoder_outputs is not None)
+        assert(templates.decoder_outputs is not None)
+
+    beam_outputs = []
+    for beam_id in xrange(len(templates)):
+        template = templates[beam_id]
+        if template is None:
+            continue
+        output_tokens, tg_slots, target, target_ast = template
+
+        # Step 3: check if the predicted command templates have enough
+        # slots to hold the fillers (to rule out templates that are
+        # trivially unqualified)
+        output_example = False
+        if FLAGS.explain or not FLAGS.dataset.startswith('bash') \
+                or not FLAGS.normalized:
+            output_example = True
+        else:
+            # Step 3: match the fillers to the argument slots
+            if len(tg_slots) >= len(sc_fillers):
+                if FLAGS.fill_argument_slots:
+                    # slot filling modifies the template tokens in place
+                    target_ast, target, _ = slot_filling.stable_slot_filling(
+                        list(output_tokens), sc_fillers, tg_slots, None,
+                        templates.encoder_outputs,
+                        templates.decoder_outputs[beam_id],
+                        slot_filling_classifier, verbose=False)
                 else:
-                    beam_outputs.append((target_ast, target))
-                num_output_examples += 1
+                    output_example = True
+                if not output_example and (target_ast is not None):
+                    output_example = True
 
-            # The threshold is used to increase decoding speed
-            if num_output_examples == 20:
-                break
+        if output_example:
+            beam_outputs.append((target_ast, target))
 
-        if FLAGS.token_decoding_algorithm == 'beam_search':
-            if beam_outputs:
-                batch_outputs.append(beam_outputs)
+        # The threshold is used to increase decoding speed
+        if len(beam_outputs) == 20:
+            break
 
-    return batch_outputs
+    if FLAGS.token_decoding_algorithm == 'greedy':
+        return beam_outputs
+    else:
+        return [beam_outputs] if beam_outputs else []
+
+
+def get_translation_cache_key(example_features, FLAGS):
+    """
+    The neural network output of an example is determined by its encoder
+    input. With argument normalization, sentences which only differ in their
+    argument values share the same encoder input.
+    """
+    _, encoder_features, copy_tokens, _ = example_features
+    key = tuple(tuple(channel) for channel in encoder_features)
+    if FLAGS.use_copy and FLAGS.copy_fun == 'copynet':
+        # copied tokens are part of the decoded templates
+        key += (tuple(copy_tokens),)
+    return key
+
+
+class TranslationCache(object):
+    """
+    LRU cache of decoded command templates (TemplateBeam) keyed by the
+    encoder input of the source sentence.
+
+    On a cache hit, the neural network step is skipped and only the argument
+    slots of the cached templates are re-filled with the argument values of
+    the new sentence.
+    """
+    def __init__(self, capacity, path=None, signature=None):
+        """
+        :param capacity: Maximum number of cached entries.
+        :param path: If set, the cache is loaded from and saved to this path.
+        :param signature: Signature of the model and decoding settings the
+            cached templates are decoded with (see translation_cache_signature).
+            A saved cache with a different signature is not loaded.
+        """
+        self.capacity = capacity
+        self.path = path
+        self.signature = signature
+        self.entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key, templates):
+        self.entries[key] = templates
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+
+    def hit_rate(self):
+        num_lookups = self.hits + self.misses
+        return float(self.hits) / num_lookups if num_lookups > 0 else 0.0
+
+    def stats(self):
+        return {
+            'size': len(self.entries),
+            'capacity': self.capacity,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate()
+        }
+
+    def save(self, path=None):
+        """
+        Save the neural network outputs of the cached entries. The decoded
+        templates are recomputed lazily after loading.
+        """
+        path = path or self.path
+        entries = []
+        for key, templates in list(self.entries.items()):
+            entries.append((key, templates.predictions,
+                            templates.sequence_logits,
+                            templates.encoder_outputs,
+                            templates.decoder_outputs,
+                            templates.copy_tokens))
+        with open(path, 'wb') as o_f:
+            pickle.dump((self.signature, entries), o_f)
+        print('{} translation cache entries saved to {}'.format(
+            len(entries), path))
+
+    def load(self, FLAGS, vocabs, path=None):
+        """
+        Load the entries of a saved cache. A cache saved with a different
+        signature is ignored.
+
+        :return: True if the entries are loaded.
+        """
+        path = path or self.path
+        with open(path, 'rb') as f:
+            data = pickle.load(f)
+        if not (isinstance(data, tuple) and len(data) == 2
+                and data[0] == self.signature):
+            print('Translation cache {} is out of date, ignored'.format(path))
+            return False
+        entries = data[1]
+        for key, predictions, sequence_logits, encoder_outputs, \
+                decoder_outputs, copy_tokens in entries:
+            O = framework.Output()
+            if FLAGS.token_decoding_algorithm == 'greedy':
+                predictions = predictions[0]
+            O.output_symbols = [predictions]
+            O.sequence_logits = sequence_logits
+            O.encoder_hidden_states = [encoder_outputs]
+            O.decoder_hidden_states = decoder_outputs
+            self.put(key, TemplateBeam(O, FLAGS, vocabs, copy_tokens))
+        print('{} translation cache entries loaded from {}'.format(
+            len(entries), path))
+        return True
+
+
+TRANSLATION_CACHE_VERSION = 2
+
+
+def translation_cache_signature(FLAGS, vocabs):
+    """
+    Cached templates are only valid for the model checkpoint, vocabularies,
+    decoder and decoding settings they were decoded with.
+    """
+    ckpt = tf.train.get_checkpoint_state(
+        os.path.join(FLAGS.model_root_dir, FLAGS.model_dir))
+    if ckpt and ckpt.model_checkpoint_path:
+        checkpoint_path = ckpt.model_checkpoint_path
+        checkpoint_step = checkpoint_path.rsplit('-', 1)[-1]
+    else:
+        checkpoint_path = checkpoint_step = None
+    return (TRANSLATION_CACHE_VERSION,
+            checkpoint_path,
+            checkpoint_step,
+            data_utils.get_vocab_signature(vocabs.rev_sc_vocab),
+            data_utils.get_vocab_signature(vocabs.rev_tg_vocab),
+            FLAGS.token_decoding_algorithm,
+            FLAGS.beam_size,
+            FLAGS.channel,
+            FLAGS.use_copy,
+            FLAGS.copy_fun,
+            # the cached beams keep the network outputs only when argument
+            # slots are filled, and depend on the decoder they come from
+            FLAGS.fill_argument_slots,
+            FLAGS.grammar_constrained_decoding,
+            FLAGS.numpy_inference)
+
+
+def get_translation_cache(FLAGS, vocabs):
+    """
+    Create the translation cache specified by FLAGS.translation_cache_size
+    and FLAGS.translation_cache_path. Returns None if caching is disabled.
+    """
+    if FLAGS.translation_cache_size <= 0:
+        return None
+    path = FLAGS.translation_cache_path or None
+    translation_cache = TranslationCache(
+        FLAGS.translation_cache_size, path,
+        translation_cache_signature(FLAGS, vocabs))
+    if path and os.path.exists(path):
+        translation_cache.load(FLAGS, vocabs)
+    return translation_cache
 
 
 def decode_set(sess, model, dataset, top_k, FLAGS, verbose=False):
@@ -314,6 +689,16 @@ def decode_set(sess, model, dataset, top_k, FLAGS, verbose=False):
     eval_file = open(eval_file_path, 'w')
     eval_file.write('example_id, description, ground_truth, prediction, ' +
                     'correct template, correct command\n')
+
+    # Translate all examples in batches before writing the predictions
+    if FLAGS.fill_argument_slots:
+        slot_filling_classifier = get_slot_filling_classifer(FLAGS)
+    else:
+        slot_filling_classifier = None
+    translations = translate_batch(
+        [data_group for _, data_group in grouped_dataset], sess, model,
+        vocabs, FLAGS, slot_filling_classifier=slot_filling_classifier)
+
     for example_id in xrange(len(grouped_dataset)):
         key, data_group = grouped_dataset[example_id]
 
@@ -326,6 +711,8 @@ def decode_set(sess, model, dataset, top_k, FLAGS, verbose=False):
             sc_temp = ' '.join(sc_tokens)
         tg_txts = [dp.tg_txt for dp in data_group]
         tg_asts = [data_tools.bash_parser(tg_txt) for tg_txt in tg_txts]
+        tg_temps = tree_dist.TemplateSet(tg_asts, ignore_arg_value=True)
+        tg_strs = tree_dist.TemplateSet(tg_asts)
         if verbose:
             print('\nExample {}:'.format(example_id))
             print('Original Source: {}'.format(sc_txt.encode('utf-8')))
@@ -333,13 +720,7 @@ def decode_set(sess, model, dataset, top_k, FLAGS, verbose=False):
             for j in xrange(len(data_group)):
                 print('GT Target {}: {}'.format(j+1, data_group[j].tg_txt.encode('utf-8')))
 
-        if FLAGS.fill_argument_slots:
-            slot_filling_classifier = get_slot_filling_classifer(FLAGS)
-            batch_outputs, sequence_logits = translate_fun(data_group, sess, model,
-                vocabs, FLAGS, slot_filling_classifier=slot_filling_classifier)
-        else:
-            batch_outputs, sequence_logits = translate_fun(data_group, sess, model,
-                vocabs, FLAGS)
+        batch_outputs, sequence_logits = translations[example_id]
         if FLAGS.tg_char:
             batch_outputs, batch_char_outputs = batch_outputs
 
@@ -348,8 +729,7 @@ def decode_set(sess, model, dataset, top_k, FLAGS, verbose=False):
             if FLAGS.token_decoding_algorithm == 'greedy':
                 tree, pred_cmd = batch_outputs[0]
                 if nl2bash:
-                    pred_cmd = data_tools.ast2command(
-                        tree, loose_constraints=True)
+                    pred_cmd = data_tools.linearize(tree).command
                 score = sequence_logits[0]
                 if verbose:
                     print('Prediction: {} ({})'.format(pred_cmd, score))
@@ -369,16 +749,16 @@ def decode_set(sess, model, dataset, top_k, FLAGS, verbose=False):
                         eval_row += ','
                     top_k_pred_tree, top_k_pred_cmd = top_k_predictions[j]
                     if nl2bash:
-                        pred_cmd = data_tools.ast2command(
-                            top_k_pred_tree, loose_constraints=True)
+                        # also memoizes the templates compared by one_match
+                        pred_cmd = data_tools.linearize(top_k_pred_tree).command
                     else:
                         pred_cmd = top_k_pred_cmd
                     pred_file.write('{}|||'.format(pred_cmd.encode('utf-8')))
                     eval_row += '"{}",'.format(pred_cmd.replace('"', '""'))
                     temp_match = tree_dist.one_match(
-                        tg_asts, top_k_pred_tree, ignore_arg_value=True)
+                        tg_temps, top_k_pred_tree, ignore_arg_value=True)
                     str_match = tree_dist.one_match(
-                        tg_asts, top_k_pred_tree, ignore_arg_value=False)
+                        tg_strs, top_k_pred_tree, ignore_arg_value=False)
                     if temp_match:
                         eval_row += 'y,'
                     if str_match:
@@ -405,6 +785,106 @@ def decode_set(sess, model, dataset, top_k, FLAGS, verbose=False):
         'predictions.{}.latest.csv'.format(model.decode_sig)))
 
 
+def test_translation_cache(FLAGS):
+    """
+    Check that a translation cache saved under one setting of the flags
+    which change the cached templates is ignored when loaded under another.
+
+    :return: number of flags whose change is not detected.
+    """
+    import tempfile
+
+    vocabs = data_utils.load_vocabulary(FLAGS)
+    path = os.path.join(tempfile.mkdtemp(), 'translation.cache')
+    flags = ['fill_argument_slots', 'grammar_constrained_decoding',
+             'numpy_inference']
+    num_errors = 0
+    for flag in flags:
+        value = getattr(FLAGS, flag)
+        TranslationCache(1, path, translation_cache_signature(
+            FLAGS, vocabs)).save()
+        try:
+            # a cache saved and loaded with the same flags is loaded
+            assert(TranslationCache(1, path, translation_cache_signature(
+                FLAGS, vocabs)).load(FLAGS, vocabs))
+            setattr(FLAGS, flag, not value)
+            if TranslationCache(1, path, translation_cache_signature(
+                    FLAGS, vocabs)).load(FLAGS, vocabs):
+                num_errors += 1
+                print('Cache saved with --{}={} loaded with --{}={}'.format(
+                    flag, value, flag, not value))
+        finally:
+            setattr(FLAGS, flag, value)
+    os.remove(path)
+    os.rmdir(os.path.dirname(path))
+    print('{} flags checked, {} not in the translation cache signature'.format(
+        len(flags), num_errors))
+    return num_errors
+
+
+def test_numpy_inference(sess, model, numpy_model, dataset, FLAGS, top_k=10):
+    """
+    Check that the NumPy inference engine reproduces the top-k predictions
+    of the TensorFlow model on the dev/test dataset.
+
+    :param model: TensorFlow prediction model object.
+    :param numpy_model: numpy_engine.NumpyModel with the exported parameters
+        of the same model.
+    :return: number of examples whose predictions differ.
+    """
+    tokenizer_selector = 'cm' if FLAGS.explain else 'nl'
+    grouped_dataset = data_utils.group_parallel_data(
+        dataset, tokenizer_selector=tokenizer_selector)
+    data_groups = [data_group for _, data_group in grouped_dataset]
+    vocabs = data_utils.load_vocabulary(FLAGS)
+    if FLAGS.fill_argument_slots:
+        slot_filling_classifier = get_slot_filling_classifer(FLAGS)
+    else:
+        slot_filling_classifier = None
+
+    start_time = time.time()
+    translations = translate_batch(data_groups, sess, model, vocabs, FLAGS,
+        slot_filling_classifier=slot_filling_classifier)
+    tf_time = time.time() - start_time
+    start_time = time.time()
+    numpy_translations = translate_batch(data_groups, None, numpy_model,
+        vocabs, FLAGS, slot_filling_classifier=slot_filling_classifier)
+    numpy_time = time.time() - start_time
+
+    num_mismatches = 0
+    max_score_diff = 0
+    for example_id in xrange(len(data_groups)):
+        predictions = get_top_k_predictions(
+            translations[example_id][0], translations[example_id][1], top_k,
+            FLAGS)
+        numpy_predictions = get_top_k_predictions(
+            numpy_translations[example_id][0],
+            numpy_translations[example_id][1], top_k, FLAGS)
+        if [cmd for cmd, _ in predictions] != \
+                [cmd for cmd, _ in numpy_predictions]:
+            num_mismatches += 1
+            print('Example {}: {}'.format(
+                example_id, data_groups[example_id][0].sc_txt.strip()))
+            for j, (pred, numpy_pred) in enumerate(
+                    zip(predictions, numpy_predictions)):
+                if pred != numpy_pred:
+                    print('- Prediction {}: {} ({})'.format(j+1, *pred))
+                    print('+ Prediction {}: {} ({})'.format(j+1, *numpy_pred))
+                    break
+        else:
+            for (_, score), (_, numpy_score) in \
+                    zip(predictions, numpy_predictions):
+                max_score_diff = max(max_score_diff,
+                                     abs(float(score) - float(numpy_score)))
+
+    print('{} / {} examples have identical top-{} predictions '
+          '(max score difference = {})'.format(
+            len(data_groups) - num_mismatches, len(data_groups), top_k,
+            max_score_diff))
+    print('TensorFlow: {:.2f}s, NumPy: {:.2f}s'.format(tf_time, numpy_time))
+    return num_mismatches
+
+
 def get_slot_filling_classifer(FLAGS):
     # create slot filling classifier
     mapping_param_dir = os.path.join(FLAGS.model_dir, 'train.mappings.X.Y.npz')
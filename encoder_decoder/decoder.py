@@ -34,8 +34,6 @@ class Decoder(graph_utils.NNModel):
             2. "beam_search"
         """
         super(Decoder, self).__init__(hyperparameters)
-        if self.forward_only:
-            self.hyperparams['batch_size'] = 1
 
         self.scope = scope
         self.dim = dim
@@ -62,7 +60,9 @@ class Decoder(graph_utils.NNModel):
                 self.use_copy,
                 self.copy_fun,
                 self.alpha,
-                locally_normalized=(self.training_algorithm != "bso")
+                locally_normalized=(self.training_algorithm != "bso"),
+                use_backpointers=self.beam_search_backpointers,
+                grammar_constraint=self.grammar_constraint
             ) if self.decoding_algorithm == "beam_search" else None
 
         self.output_project = self.output_project()
@@ -0,0 +1,211 @@
+"""
+Micro-benchmark of the host-side work of a training step: batch formatting
+(EncoderDecoderModel.format_batch) and feed dictionary construction
+(EncoderDecoderModel.feed_input). The per-element Python loops used before
+these functions were vectorized are kept here as the baseline.
+
+Usage:
+    python -m encoder_decoder.feed_benchmark [batch_size] [num_steps]
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import random
+import sys
+import time
+if sys.version_info > (3, 0):
+    from six.moves import xrange
+
+import numpy as np
+
+import tensorflow as tf
+
+from encoder_decoder import data_utils, framework, graph_utils
+
+
+class FeedModel(framework.EncoderDecoderModel):
+    """
+    EncoderDecoderModel with only the input placeholders defined.
+    """
+    def __init__(self, hyperparams, buckets=None):
+        graph_utils.NNModel.__init__(self, hyperparams, buckets)
+        self.define_placeholders()
+
+
+def loop_format_batch(model, encoder_input_channels, decoder_input_channels,
+                      bucket_id=-1):
+    """
+    Baseline (loop-based) version of EncoderDecoderModel.format_batch.
+    """
+    def load_channel(inputs, output_length, reversed_output=True):
+        padded_inputs = []
+        batch_inputs = []
+        for batch_idx in xrange(batch_size):
+            input = inputs[batch_idx]
+            paddings = [data_utils.PAD_ID] * (output_length - len(input))
+            if reversed_output:
+                padded_inputs.append(list(reversed(input + paddings)))
+            else:
+                padded_inputs.append(input + paddings)
+        for length_idx in xrange(output_length):
+            batched_dim = np.array([padded_inputs[batch_idx][length_idx]
+                    for batch_idx in xrange(batch_size)], dtype=np.int32)
+            batch_inputs.append(batched_dim)
+        return batch_inputs
+
+    if bucket_id != -1:
+        encoder_size, decoder_size = model.buckets[bucket_id]
+    else:
+        encoder_size, decoder_size = \
+            model.max_source_length, model.max_target_length
+    batch_size = len(encoder_input_channels[0])
+
+    batch_encoder_inputs = load_channel(
+        encoder_input_channels[0], encoder_size, reversed_output=True)
+    batch_decoder_inputs = load_channel(
+        decoder_input_channels[0], decoder_size, reversed_output=False)
+    if model.copynet:
+        batch_encoder_copy_inputs = load_channel(
+            encoder_input_channels[1], encoder_size, reversed_output=True)
+        batch_copy_targets = load_channel(
+            decoder_input_channels[1], decoder_size, reversed_output=False)
+
+    batch_encoder_input_masks = []
+    batch_decoder_input_masks = []
+    for length_idx in xrange(encoder_size):
+        batch_encoder_input_mask = np.ones(batch_size, dtype=np.float32)
+        for batch_idx in xrange(batch_size):
+            source = batch_encoder_inputs[length_idx][batch_idx]
+            if source == data_utils.PAD_ID:
+                batch_encoder_input_mask[batch_idx] = 0.0
+        batch_encoder_input_masks.append(batch_encoder_input_mask)
+
+    for length_idx in xrange(decoder_size):
+        batch_decoder_input_mask = np.ones(batch_size, dtype=np.float32)
+        for batch_idx in xrange(batch_size):
+            if length_idx < decoder_size - 1:
+                target = batch_decoder_inputs[length_idx+1][batch_idx]
+            if length_idx == decoder_size - 1 or target == data_utils.PAD_ID:
+                batch_decoder_input_mask[batch_idx] = 0.0
+        batch_decoder_input_masks.append(batch_decoder_input_mask)
+
+    E = framework.Example()
+    E.encoder_inputs = batch_encoder_inputs
+    E.encoder_attn_masks = batch_encoder_input_masks
+    E.decoder_inputs = batch_decoder_inputs
+    E.target_weights = batch_decoder_input_masks
+    if model.use_copy:
+        E.encoder_copy_inputs = batch_encoder_copy_inputs
+        E.copy_targets = batch_copy_targets
+    return E
+
+
+def loop_feed_input(model, E):
+    """
+    Baseline (loop-based) version of EncoderDecoderModel.feed_input.
+    """
+    encoder_size, decoder_size = len(E.encoder_inputs), len(E.decoder_inputs)
+    input_feed = {}
+    for l in xrange(encoder_size):
+        input_feed[model.encoder_inputs[l].name] = E.encoder_inputs[l]
+        input_feed[model.encoder_attn_masks[l].name] = E.encoder_attn_masks[l]
+    for l in xrange(decoder_size):
+        input_feed[model.decoder_inputs[l].name] = E.decoder_inputs[l]
+        input_feed[model.target_weights[l].name] = E.target_weights[l]
+    if model.copynet:
+        for l in xrange(encoder_size):
+            input_feed[model.encoder_copy_inputs[l].name] = \
+                E.encoder_copy_inputs[l]
+        for l in xrange(decoder_size-1):
+            input_feed[model.targets[l].name] = E.copy_targets[l]
+
+    for l in xrange(encoder_size, model.max_source_length):
+        input_feed[model.encoder_inputs[l].name] = np.zeros(
+            E.encoder_inputs[-1].shape, dtype=np.int32)
+        input_feed[model.encoder_attn_masks[l].name] = np.zeros(
+            E.encoder_attn_masks[-1].shape, dtype=np.int32)
+        if model.copynet:
+            input_feed[model.encoder_copy_inputs[l].name] = \
+                np.zeros(E.encoder_copy_inputs[-1].shape, dtype=np.int32)
+    for l in xrange(decoder_size, model.max_target_length + 1):
+        input_feed[model.decoder_inputs[l].name] = np.zeros(
+            E.decoder_inputs[-1].shape, dtype=np.int32)
+        input_feed[model.target_weights[l].name] = np.zeros(
+            E.target_weights[-1].shape, dtype=np.int32)
+        if model.copynet:
+            input_feed[model.targets[l-1].name] = np.zeros(
+                E.copy_targets[-1].shape, dtype=np.int32)
+    return input_feed
+
+
+def random_batch(batch_size, encoder_size, decoder_size, vocab_size=1000):
+    """
+    Random encoder and decoder input channels of a bucket (decoder inputs
+    start with ROOT and end with EOS, as produced by data_utils).
+    """
+    encoder_inputs, decoder_inputs = [], []
+    for _ in xrange(batch_size):
+        encoder_inputs.append([random.randint(data_utils.ROOT_ID + 1, vocab_size)
+            for _ in xrange(random.randint(1, encoder_size))])
+        decoder_inputs.append([data_utils.ROOT_ID] +
+            [random.randint(data_utils.ROOT_ID + 1, vocab_size)
+             for _ in xrange(random.randint(0, decoder_size - 2))] +
+            [data_utils.EOS_ID])
+    # the copy channels have the same shape as the token channels
+    return [encoder_inputs, encoder_inputs], [decoder_inputs, decoder_inputs]
+
+
+def benchmark(batch_size=128, num_steps=100, use_copy=True):
+    hyperparams = {
+        'max_source_length': 80,
+        'max_target_length': 90,
+        'use_copy': use_copy,
+        'copy_fun': 'copynet'
+    }
+    buckets = [(30, 40), (40, 50), (80, 90)]
+    with tf.Graph().as_default():
+        model = FeedModel(hyperparams, buckets)
+
+    batches = []
+    for step in xrange(num_steps):
+        bucket_id = step % len(buckets)
+        encoder_size, decoder_size = buckets[bucket_id]
+        batches.append(random_batch(batch_size, encoder_size, decoder_size) +
+                       (bucket_id,))
+
+    # check that both versions produce the same feed
+    for encoder_input_channels, decoder_input_channels, bucket_id in batches:
+        feed = model.feed_input(model.format_batch(
+            encoder_input_channels, decoder_input_channels, bucket_id))
+        loop_feed = loop_feed_input(model, loop_format_batch(model,
+            encoder_input_channels, decoder_input_channels, bucket_id))
+        assert(set(feed.keys()) == set(loop_feed.keys()))
+        for name in feed:
+            assert(feed[name].dtype == loop_feed[name].dtype)
+            assert(np.array_equal(feed[name], loop_feed[name]))
+
+    def time_steps(format_batch, feed_input):
+        start_time = time.time()
+        for encoder_input_channels, decoder_input_channels, bucket_id \
+                in batches:
+            feed_input(format_batch(
+                encoder_input_channels, decoder_input_channels, bucket_id))
+        return (time.time() - start_time) / num_steps
+
+    loop_time = time_steps(
+        lambda x, y, z: loop_format_batch(model, x, y, z),
+        lambda E: loop_feed_input(model, E))
+    vectorized_time = time_steps(model.format_batch, model.feed_input)
+    print('batch size = {}, copynet = {}'.format(batch_size, use_copy))
+    print('loop:       {:.3f} ms/step'.format(loop_time * 1000))
+    print('vectorized: {:.3f} ms/step'.format(vectorized_time * 1000))
+    print('speedup:    {:.1f}x'.format(loop_time / vectorized_time))
+
+
+if __name__ == '__main__':
+    batch_size = int(sys.argv[1]) if len(sys.argv) > 1 else 128
+    num_steps = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    benchmark(batch_size, num_steps, use_copy=False)
+    benchmark(batch_size, num_steps, use_copy=True)
@@ -72,9 +72,11 @@ class EncoderDecoderModel(graph_utils.NNModel):
 
     # --- Graph Operations --- #
 
-    def define_graph(self):
-        self.debug_vars = []
-
+    def define_placeholders(self):
+        """
+        Create the input placeholders for all positions up to
+        max_source_length and max_target_length.
+        """
         # Feeds for inputs.
         self.encoder_inputs = []        # encoder inputs.
         self.encoder_attn_masks = []    # mask out PAD symbols in the encoder
@@ -112,6 +114,21 @@ class EncoderDecoderModel(graph_utils.NNModel):
                     tf.compat.v1.placeholder(
                         tf.int32, shape=[None], name="copy_target{0}".format(i)))
 
+        # Placeholder names and zero-fill vectors used by feed_input
+        self.feed_names = {
+            'encoder_inputs': [x.name for x in self.encoder_inputs],
+            'encoder_attn_masks': [x.name for x in self.encoder_attn_masks],
+            'decoder_inputs': [x.name for x in self.decoder_inputs],
+            'target_weights': [x.name for x in self.target_weights],
+            'encoder_copy_inputs': [x.name for x in self.encoder_copy_inputs],
+            'targets': [x.name for x in self.targets]
+        }
+        self.dummy_feeds = {}
+
+    def define_graph(self):
+        self.debug_vars = []
+        self.define_placeholders()
+
         # Compute training outputs and losses in the forward direction.
         if self.buckets:
             self.output_symbols = []
@@ -415,31 +432,19 @@ class EncoderDecoderModel(graph_utils.NNModel):
         """
         def load_channel(inputs, output_length, reversed_output=True):
             """
-            Convert a batch of feature vectors into a batched feature vector.
+            Convert a batch of feature vectors into a [output_length,
+            batch_size] matrix of batched feature vectors.
             """
-            padded_inputs = []
-            batch_inputs = []
-            for batch_idx in xrange(batch_size):
-                input = inputs[batch_idx]
-                paddings = [data_utils.PAD_ID] * (output_length - len(input))
-                if reversed_output:
-                    padded_inputs.append(list(reversed(input + paddings)))
-                else:
-                    padded_inputs.append(input + paddings)
-            for length_idx in xrange(output_length):
-                batched_dim = np.array([padded_inputs[batch_idx][length_idx]
-                        for batch_idx in xrange(batch_size)], dtype=np.int32)
-                batch_inputs.append(batched_dim)
-            return batch_inputs
+            return np.ascontiguousarray(data_utils.pad_batch(
+                inputs, output_length, reversed_output=reversed_output).T)
 
         if bucket_id != -1:
             encoder_size, decoder_size = self.buckets[bucket_id]
         else:
             encoder_size, decoder_size = \
                 self.max_source_length, self.max_target_length
-        batch_size = len(encoder_input_channels[0])
 
-        # create batch-major vectors
+        # create time-major matrices
         batch_encoder_inputs = load_channel(
             encoder_input_channels[0], encoder_size, reversed_output=True)
         batch_decoder_inputs = load_channel(
@@ -450,45 +455,35 @@ class EncoderDecoderModel(graph_utils.NNModel):
             batch_copy_targets = load_channel(
                 decoder_input_channels[1], decoder_size, reversed_output=False)
 
-        batch_encoder_input_masks = []
-        batch_decoder_input_masks = []
-        for length_idx in xrange(encoder_size):
-            batch_encoder_input_mask = np.ones(batch_size, dtype=np.float32)
-            for batch_idx in xrange(batch_size):
-                source = batch_encoder_inputs[length_idx][batch_idx]
-                if source == data_utils.PAD_ID:
-                    batch_encoder_input_mask[batch_idx] = 0.0
-            batch_encoder_input_masks.append(batch_encoder_input_mask)
-
-        for length_idx in xrange(decoder_size):
-            # Create target_weights to be 0 for targets that are padding.
-            batch_decoder_input_mask = np.ones(batch_size, dtype=np.float32)
-            for batch_idx in xrange(batch_size):
-                # We set weight to 0 if the corresponding target is a PAD symbol.
-                # The corresponding target is decoder_input shifted by 1 forward.
-                if length_idx < decoder_size - 1:
-                    target = batch_decoder_inputs[length_idx+1][batch_idx]
-                if length_idx == decoder_size - 1 or target == data_utils.PAD_ID:
-                    batch_decoder_input_mask[batch_idx] = 0.0
-            batch_decoder_input_masks.append(batch_decoder_input_mask)
+        batch_encoder_input_masks = \
+            (batch_encoder_inputs != data_utils.PAD_ID).astype(np.float32)
+        # Create target_weights to be 0 for targets that are padding.
+        # The corresponding target is decoder_input shifted by 1 forward.
+        batch_decoder_input_masks = np.zeros(batch_decoder_inputs.shape,
+                                             dtype=np.float32)
+        batch_decoder_input_masks[:-1] = \
+            batch_decoder_inputs[1:] != data_utils.PAD_ID
 
+        # lists of per-step vectors (views into the matrices)
         E = Example()
-        E.encoder_inputs = batch_encoder_inputs
-        E.encoder_attn_masks = batch_encoder_input_masks
-        E.decoder_inputs = batch_decoder_inputs
-        E.target_weights = batch_decoder_input_masks
+        E.encoder_inputs = list(batch_encoder_inputs)
+        E.encoder_attn_masks = list(batch_encoder_input_masks)
+        E.decoder_inputs = list(batch_decoder_inputs)
+        E.target_weights = list(batch_decoder_input_masks)
         if self.use_copy:
-            E.encoder_copy_inputs = batch_encoder_copy_inputs
-            E.copy_targets = batch_copy_targets
+            E.encoder_copy_inputs = list(batch_encoder_copy_inputs)
+            E.copy_targets = list(batch_copy_targets)
 
         return E
 
 
-    def get_batch(self, data, bucket_id=-1, use_all=False):
+    def get_batch(self, data, bucket_id=-1, use_all=False, random_state=None):
         """
         Randomly sample a batch of examples from the specified bucket and
         convert the feature vectors into the dimensions required by the neural
         network.
+        :param random_state: np.random.RandomState used for sampling (the
+            global numpy random generator is used if not set).
         """
         encoder_inputs, decoder_inputs = [], []
         if self.copynet:
@@ -502,7 +497,9 @@ class EncoderDecoderModel(graph_utils.NNModel):
         # Randomly sample a batch of encoder and decoder inputs from data
         data_ids = list(xrange(len(sample_pool)))
         if not use_all:
-            data_ids = np.random.choice(data_ids, self.batch_size)
+            if random_state is None:
+                random_state = np.random
+            data_ids = random_state.choice(data_ids, self.batch_size)
         for i in data_ids:
             data_point = sample_pool[i]
             encoder_inputs.append(data_point.sc_ids)
@@ -526,40 +523,43 @@ class EncoderDecoderModel(graph_utils.NNModel):
         Assign the data vectors to the corresponding neural network variables.
         """
         encoder_size, decoder_size = len(E.encoder_inputs), len(E.decoder_inputs)
-        input_feed = {}
-        for l in xrange(encoder_size):
-            input_feed[self.encoder_inputs[l].name] = E.encoder_inputs[l]
-            input_feed[self.encoder_attn_masks[l].name] = E.encoder_attn_masks[l]
-        for l in xrange(decoder_size):
-            input_feed[self.decoder_inputs[l].name] = E.decoder_inputs[l]
-            input_feed[self.target_weights[l].name] = E.target_weights[l]
-        if self.copynet:
-            for l in xrange(encoder_size):
-                input_feed[self.encoder_copy_inputs[l].name] = \
-                    E.encoder_copy_inputs[l]
-            for l in xrange(decoder_size-1):
-                input_feed[self.targets[l].name] = E.copy_targets[l]
-
+        batch_size = len(E.encoder_inputs[-1])
+        feed_names = self.feed_names
         # Apply dummy values to encoder and decoder inputs
-        for l in xrange(encoder_size, self.max_source_length):
-            input_feed[self.encoder_inputs[l].name] = np.zeros(
-                E.encoder_inputs[-1].shape, dtype=np.int32)
-            input_feed[self.encoder_attn_masks[l].name] = np.zeros(
-                E.encoder_attn_masks[-1].shape, dtype=np.int32)
-            if self.copynet:
-                input_feed[self.encoder_copy_inputs[l].name] = \
-                    np.zeros(E.encoder_copy_inputs[-1].shape, dtype=np.int32)
-        for l in xrange(decoder_size, self.max_target_length + 1):
-            input_feed[self.decoder_inputs[l].name] = np.zeros(
-                E.decoder_inputs[-1].shape, dtype=np.int32)
-            input_feed[self.target_weights[l].name] = np.zeros(
-                E.target_weights[-1].shape, dtype=np.int32)
-            if self.copynet:
-                input_feed[self.targets[l-1].name] = np.zeros(
-                    E.copy_targets[-1].shape, dtype=np.int32)
-        
+        input_feed = dict(
+            self.get_dummy_feed(encoder_size, decoder_size, batch_size))
+        input_feed.update(zip(feed_names['encoder_inputs'], E.encoder_inputs))
+        input_feed.update(zip(feed_names['encoder_attn_masks'],
+                              E.encoder_attn_masks))
+        input_feed.update(zip(feed_names['decoder_inputs'], E.decoder_inputs))
+        input_feed.update(zip(feed_names['target_weights'], E.target_weights))
+        if self.copynet:
+            input_feed.update(zip(feed_names['encoder_copy_inputs'],
+                                  E.encoder_copy_inputs))
+            input_feed.update(zip(feed_names['targets'][:decoder_size-1],
+                                  E.copy_targets))
         return input_feed
 
+    def get_dummy_feed(self, encoder_size, decoder_size, batch_size):
+        """
+        Feed of zero vectors for the input positions beyond encoder_size and
+        decoder_size, cached per input shape. The zero vector is shared by all
+        positions (TensorFlow does not modify the fed arrays).
+        """
+        key = (encoder_size, decoder_size, batch_size)
+        if not key in self.dummy_feeds:
+            dummy = np.zeros(batch_size, dtype=np.int32)
+            feed_names = self.feed_names
+            dummy_names = feed_names['encoder_inputs'][encoder_size:] + \
+                feed_names['encoder_attn_masks'][encoder_size:] + \
+                feed_names['decoder_inputs'][decoder_size:] + \
+                feed_names['target_weights'][decoder_size:]
+            if self.copynet:
+                dummy_names += \
+                    feed_names['encoder_copy_inputs'][encoder_size:] + \
+                    feed_names['targets'][decoder_size-1:]
+            self.dummy_feeds[key] = dict((name, dummy) for name in dummy_names)
+        return self.dummy_feeds[key]
 
     def step(self, session, formatted_example, bucket_id=-1, forward_only=False):
         """Run a step of the model feeding the given inputs.
@@ -0,0 +1,392 @@
+"""
+Grammar constraints for beam search decoding of bash command templates.
+
+The tracker consumes a command template token by token (in the format produced
+by data_tools.bash_tokenizer with arg_type_only=True, with_flag_argtype=True)
+and maintains the set of target tokens that may legally follow the prefix
+according to the utility grammar in bashlint.grammar. The constraint is
+conservative: a token is only ruled out if no prefix of a command accepted by
+the bashlint grammar (lint.normalize_ast) can continue with it.
+
+The beam search decoder (beam_search.BeamDecoderCellWrapper) calls
+BashGrammarConstraint.step once per decoding step to advance the grammar
+state of each beam entry and mask the logits of illegal next tokens.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import sys
+if sys.version_info > (3, 0):
+    from six.moves import xrange
+
+import re
+import threading
+
+import numpy as np
+
+from bashlint import data_tools, lint
+from bashlint.grammar import bg, COMPOUND_FLAG_S, COMMAND_S, \
+    ARG_COMMAND_S, EXEC_COMMAND_S
+from encoder_decoder import data_utils
+
+# Grammar stack frames
+#   (CMD_F, stop_tokens, merge): expecting the utility of a (nested) command;
+#       if merge is set, the command is a quoted argument of the enclosing
+#       utility (e.g. rsync -e) and the flags that follow may belong to
+#       either of them
+#   (UTIL_F, utilities, num_open_args, stop_tokens): reading the flags and
+#       arguments of a command; utilities are the candidate utilities the
+#       flags may belong to
+#   (SUBST_F,): inside a command/process substitution
+CMD_F = 0
+UTIL_F = 1
+SUBST_F = 2
+
+# Token classes
+ARG_T = 0
+UTILITY_T = 1
+FLAG_T = 2
+EOS_T = 3
+PIPE_T = 4
+SUBST_START_T = 5
+SUBST_END_T = 6
+SPECIAL_T = 7
+
+SUBST_START_TOKENS = {'$(', '<(', '>('}
+# Types that appear in the argument type suffix of flag tokens
+FLAG_ARG_TYPES = sorted(set(bg.name2type.values()) |
+                        {'ReservedWord', 'UTILITY', 'Unknown'},
+                        key=lambda x: -len(x))
+FLAG_ARG_TYPE_RE = re.compile('|'.join(FLAG_ARG_TYPES))
+
+# The decoding of a beam entry is finished
+DONE_STATE = 'DONE'
+
+
+def classify_token(token):
+    if token in [data_utils._EOS, data_utils._PAD]:
+        return EOS_T
+    if token.startswith('__SP__') and not token in [
+            data_utils._UNK, data_utils._ARG_UNK]:
+        return SPECIAL_T
+    if data_tools.flag_suffix in token:
+        return FLAG_T
+    if token == '|':
+        return PIPE_T
+    if token in SUBST_START_TOKENS:
+        return SUBST_START_T
+    if token == ')':
+        return SUBST_END_T
+    if token in bg.grammar:
+        return UTILITY_T
+    return ARG_T
+
+
+def flag_arguments(token):
+    """
+    Split a flag token into the flag name and the number of arguments it takes
+    in the template.
+    """
+    flag, suffix = token.split(data_tools.flag_suffix, 1)
+    if not suffix:
+        return flag, 0, False
+    arg_types = FLAG_ARG_TYPE_RE.findall(suffix)
+    takes_command = 'UTILITY' in arg_types
+    num_args = len([t for t in arg_types if t != 'UTILITY'])
+    return flag, max(num_args, 0 if takes_command else 1), takes_command
+
+
+class BashGrammarTracker(object):
+    """
+    Incremental grammar state tracker over command template tokens.
+
+    Grammar states are immutable tuples of stack frames so that they can be
+    shared by beam entries with a common prefix.
+    """
+    def __init__(self):
+        self.initial_state = ((CMD_F, (), False),)
+        # (utility, flag) -> (legal, exec stop tokens)
+        self.flag_cache = {}
+        self.command_utilities = {}
+
+    def check_flag(self, utility, flag):
+        """
+        Use BashGrammar.push to check if flag is a legal flag of utility.
+
+        :return: (legal, stop_tokens), where stop_tokens are the stop tokens
+            of the embedded command if the flag takes one (e.g. find -exec).
+        """
+        key = (utility, flag)
+        if not key in self.flag_cache:
+            bash_grammar = bg.new_cursor()
+            bash_grammar.consume(utility)
+            try:
+                result = bash_grammar.push(flag, COMPOUND_FLAG_S)
+            except (ValueError, AttributeError):
+                result = None
+            stop_tokens = ()
+            if result and result[-1][1] == '__OPEN__':
+                for next_state in bash_grammar.next_states:
+                    if next_state.type == EXEC_COMMAND_S:
+                        stop_tokens = tuple('\\;' if t == ';' else t
+                                            for t in next_state.stop_tokens)
+            self.flag_cache[key] = (bool(result), stop_tokens)
+        return self.flag_cache[key]
+
+    def takes_command(self, utility):
+        """
+        Whether the positional arguments of utility include an embedded
+        command (e.g. xargs, sudo).
+        """
+        if not utility in self.command_utilities:
+            self.command_utilities[utility] = any(
+                arg.type in [COMMAND_S, ARG_COMMAND_S]
+                for arg in bg.grammar[utility].positional_arguments)
+        return self.command_utilities[utility]
+
+    def is_legal(self, state, token, token_type=None):
+        if state == DONE_STATE:
+            return True
+        if token_type is None:
+            token_type = classify_token(token)
+        if token_type == SPECIAL_T:
+            return False
+
+        in_subst = any(frame[0] == SUBST_F for frame in state)
+        top = state[-1]
+        if top[0] == CMD_F:
+            return token_type in [UTILITY_T, SUBST_START_T] or \
+                   (token_type == SUBST_END_T and in_subst)
+
+        # top[0] == UTIL_F
+        _, utilities, num_open_args, _ = top
+        if num_open_args > 0:
+            # expecting the argument of a flag
+            return token_type in [ARG_T, UTILITY_T, SUBST_START_T]
+        if token_type == EOS_T:
+            return not in_subst
+        if token_type == SUBST_END_T:
+            return in_subst
+        if token_type == FLAG_T:
+            flag, _, _ = flag_arguments(token)
+            return any(self.check_flag(utility, flag)[0]
+                       for utility in utilities)
+        return True
+
+    def advance(self, state, token, token_type=None):
+        """
+        :return: the grammar state after consuming token, or None if the token
+            is illegal.
+        """
+        if state == DONE_STATE:
+            return DONE_STATE
+        if token_type is None:
+            token_type = classify_token(token)
+        if not self.is_legal(state, token, token_type):
+            return None
+        if token_type == EOS_T:
+            return DONE_STATE
+
+        stack = list(state)
+        top = stack[-1]
+        if top[0] == CMD_F:
+            _, stop_tokens, merge = top
+            if token_type == UTILITY_T:
+                # start of a (nested) command
+                if merge:
+                    stack.pop()
+                    _, utilities, num_open_args, stop_tokens = stack[-1]
+                    stack[-1] = (UTIL_F, utilities + (token,),
+                                 num_open_args, stop_tokens)
+                else:
+                    stack[-1] = (UTIL_F, (token,), 0, stop_tokens)
+            elif token_type == SUBST_START_T:
+                # substitution used as the command, e.g. $( which python ) ...
+                stack[-1] = (UTIL_F, (), 0, stop_tokens)
+                stack += [(SUBST_F,), (CMD_F, (), False)]
+            else:
+                # empty substitution
+                stack = self.close_substitution(stack)
+            return tuple(stack)
+
+        _, utilities, num_open_args, stop_tokens = top
+        if num_open_args > 0:
+            stack[-1] = (UTIL_F, utilities, num_open_args - 1, stop_tokens)
+            if token_type == SUBST_START_T:
+                stack += [(SUBST_F,), (CMD_F, (), False)]
+            return tuple(stack)
+
+        if token_type == PIPE_T:
+            while stack and stack[-1][0] != SUBST_F:
+                stack.pop()
+            stack.append((CMD_F, (), False))
+        elif token_type == SUBST_START_T:
+            stack += [(SUBST_F,), (CMD_F, (), False)]
+        elif token_type == SUBST_END_T:
+            stack = self.close_substitution(stack)
+        elif token_type == FLAG_T:
+            flag, num_args, takes_command = flag_arguments(token)
+            stack[-1] = (UTIL_F, utilities, num_args, stop_tokens)
+            if takes_command:
+                exec_stop_tokens = ()
+                for utility in utilities:
+                    legal, exec_stop_tokens = self.check_flag(utility, flag)
+                    if legal:
+                        break
+                if exec_stop_tokens:
+                    stack.append((CMD_F, exec_stop_tokens, False))
+                else:
+                    stack.append((CMD_F, (), True))
+        elif token_type == UTILITY_T:
+            if any(self.takes_command(utility) for utility in utilities):
+                # the rest of the tokens belong to the embedded command
+                stack.append((UTIL_F, (token,), 0, ()))
+            else:
+                # either an argument or the start of the next command in a
+                # command list
+                stack[-1] = (UTIL_F, utilities + (token,), 0, stop_tokens)
+        else:
+            # a stop token closes the innermost embedded command it belongs to
+            # (only the top frame can be a CMD_F frame)
+            for i in xrange(len(stack) - 1, -1, -1):
+                if stack[i][0] == SUBST_F:
+                    break
+                if token in stack[i][3]:
+                    stack = stack[:i]
+                    break
+        return tuple(stack)
+
+    @staticmethod
+    def close_substitution(stack):
+        while stack[-1][0] != SUBST_F:
+            stack.pop()
+        stack.pop()
+        return stack
+
+
+class BashGrammarConstraint(object):
+    """
+    Maps the grammar states of a batch of beam entries to masks over the
+    target vocabulary.
+
+    Grammar states are interned as integer ids so that they can be stored in
+    the beam search state and reordered with the beam entries.
+    """
+    def __init__(self, rev_tg_vocab):
+        self.rev_tg_vocab = rev_tg_vocab
+        self.vocab_size = len(rev_tg_vocab)
+        self.token_types = [classify_token(rev_tg_vocab[token_id])
+                            for token_id in xrange(self.vocab_size)]
+        self.tracker = BashGrammarTracker()
+
+        self.states = [self.tracker.initial_state]
+        self.state_ids = {self.tracker.initial_state: 0}
+        # (state_id, token_id) -> next state_id (-1 if illegal)
+        self.transitions = {}
+        # state_id -> mask
+        self.masks = {}
+        self.lock = threading.Lock()
+
+    def get_state_id(self, state):
+        if not state in self.state_ids:
+            self.state_ids[state] = len(self.states)
+            self.states.append(state)
+        return self.state_ids[state]
+
+    def next_state_id(self, state_id, token_id):
+        key = (state_id, token_id)
+        if not key in self.transitions:
+            state = self.states[state_id]
+            if token_id >= self.vocab_size:
+                # tokens copied from the source are arguments
+                next_state = self.tracker.advance(state, '', ARG_T)
+            elif token_id in [data_utils.ROOT_ID, data_utils.GO_ID]:
+                next_state = state
+            else:
+                next_state = self.tracker.advance(
+                    state, self.rev_tg_vocab[token_id],
+                    self.token_types[token_id])
+            self.transitions[key] = -1 if next_state is None \
+                else self.get_state_id(next_state)
+        return self.transitions[key]
+
+    def mask(self, state_id):
+        """
+        :return: float32 vector over the target vocabulary which is 1 for legal
+            next tokens and 0 otherwise.
+        """
+        if not state_id in self.masks:
+            mask = np.ones([self.vocab_size], dtype=np.float32)
+            if state_id >= 0:
+                state = self.states[state_id]
+                for token_id in xrange(self.vocab_size):
+                    if not self.tracker.is_legal(
+                            state, self.rev_tg_vocab[token_id],
+                            self.token_types[token_id]):
+                        mask[token_id] = 0
+                if not np.any(mask):
+                    # never leave a beam entry without a continuation
+                    mask[:] = 1
+            self.masks[state_id] = mask
+        return self.masks[state_id]
+
+    def step(self, state_ids, input_symbols):
+        """
+        Advance the grammar state of each beam entry with the symbol it
+        generated at the previous step.
+
+        :param state_ids: [batch_size*beam_size] grammar state ids.
+        :param input_symbols: [batch_size*beam_size] previous output symbols.
+        :return: (next_state_ids, masks), where masks is a
+            [batch_size*beam_size, vocab_size] matrix of legal next tokens.
+        """
+        with self.lock:
+            next_state_ids = np.array(
+                [self.next_state_id(int(s), int(t)) if s >= 0 else -1
+                 for s, t in zip(state_ids, input_symbols)], dtype=np.int64)
+            masks = np.stack([self.mask(s) for s in next_state_ids])
+        return next_state_ids, masks
+
+
+def test_grammar_constraint(data_path, vocab_path):
+    """
+    Replay the command templates of a dataset through the grammar constraint
+    and report the fraction of target tokens ruled out at each step. Every
+    token of a template which lint.normalize_ast accepts must be legal.
+    """
+    tg_vocab, rev_tg_vocab = data_utils.initialize_vocabulary(vocab_path)
+    constraint = BashGrammarConstraint(rev_tg_vocab)
+
+    num_commands, num_steps, num_masked = 0, 0, 0
+    with open(data_path, encoding='utf-8') as f:
+        for cmd in f:
+            cmd = cmd.strip()
+            if lint.normalize_ast(cmd) is None:
+                continue
+            tokens = data_tools.bash_tokenizer(cmd, loose_constraints=True,
+                arg_type_only=True, with_flag_argtype=True)
+            if any(not token in tg_vocab for token in tokens):
+                continue
+            token_ids = [tg_vocab[token] for token in tokens] + \
+                        [data_utils.EOS_ID]
+            state_id = 0
+            for i, token_id in enumerate(token_ids):
+                mask = constraint.mask(state_id)
+                num_steps += 1
+                num_masked += (constraint.vocab_size - np.sum(mask))
+                if not mask[token_id]:
+                    print('Illegal token "{}" at position {}: {}'.format(
+                        rev_tg_vocab[token_id], i, ' '.join(tokens)))
+                    break
+                state_id = constraint.next_state_id(state_id, token_id)
+            num_commands += 1
+
+    print('{} command templates, {:.2f} out of {} target tokens masked '
+          'per step on average'.format(num_commands,
+            float(num_masked) / num_steps, constraint.vocab_size))
+
+
+if __name__ == '__main__':
+    test_grammar_constraint(sys.argv[1], sys.argv[2])
@@ -10,6 +10,8 @@ import os
 import tensorflow as tf
 from tensorflow.python.util import nest
 
+from encoder_decoder import data_utils, grammar_constraints
+
 
 def define_model(FLAGS, session, model_constructor, buckets, forward_only):
     params = collections.defaultdict()
@@ -103,6 +105,8 @@ def define_model(FLAGS, session, model_constructor, buckets, forward_only):
     params["beam_size"] = FLAGS.beam_size
     params["alpha"] = FLAGS.alpha
     params["top_k"] = FLAGS.top_k
+    params["beam_search_backpointers"] = FLAGS.beam_search_backpointers
+    params["grammar_constraint"] = None
 
     params["forward_only"] = forward_only
     params["force_reading_input"] = FLAGS.force_reading_input
@@ -116,8 +120,8 @@ def define_model(FLAGS, session, model_constructor, buckets, forward_only):
     print("decode_sig={}".format(decode_sig))
 
     if forward_only:
-        # Set batch_size to 1 for decoding.
-        params["batch_size"] = 1
+        # Decode FLAGS.decode_batch_size examples per step (1 by default).
+        params["batch_size"] = FLAGS.decode_batch_size
         # Reset dropout probabilities for decoding.
         params["attention_input_keep"] = 1.0
         params["attention_output_keep"] = 1.0
@@ -125,6 +129,7 @@ def define_model(FLAGS, session, model_constructor, buckets, forward_only):
         params["sc_output_keep"] = 1.0
         params["tg_input_keep"] = 1.0
         params["tg_output_keep"] = 1.0
+        params["grammar_constraint"] = get_grammar_constraint(FLAGS)
 
     if FLAGS.gen_slot_filling_training_data:
         FLAGS.batch_size = 1
@@ -169,6 +174,19 @@ def define_model(FLAGS, session, model_constructor, buckets, forward_only):
     return model
 
 
+def get_grammar_constraint(FLAGS):
+    """
+    Grammar constraint used to mask illegal next tokens during beam search,
+    or None if FLAGS.grammar_constrained_decoding is not set.
+    """
+    if not FLAGS.grammar_constrained_decoding:
+        return None
+    assert(FLAGS.dataset.startswith('bash') and not FLAGS.explain
+           and FLAGS.channel == 'token')
+    return grammar_constraints.BashGrammarConstraint(
+        data_utils.load_vocabulary(FLAGS).rev_tg_vocab)
+
+
 def get_decode_signature(FLAGS):
     """
     Model signature is used to locate the trained parameters and
@@ -227,6 +245,8 @@ def get_decode_signature(FLAGS):
     decode_sig = FLAGS.token_decoding_algorithm
     if FLAGS.token_decoding_algorithm == 'beam_search': 
         decode_sig += ".{}".format(FLAGS.beam_size)
+        if FLAGS.grammar_constrained_decoding:
+            decode_sig += '.grammar'
     if FLAGS.fill_argument_slots:
         decode_sig += '.slot.filler'
     decode_sig += (".test" if FLAGS.test else ".dev")
@@ -956,6 +976,14 @@ class NNModel(object):
     def alpha(self):
         return self.hyperparams["alpha"]
 
+    @property
+    def beam_search_backpointers(self):
+        return self.hyperparams["beam_search_backpointers"]
+
+    @property
+    def grammar_constraint(self):
+        return self.hyperparams["grammar_constraint"]
+
     @property
     def beta(self):
         return self.hyperparams["beta"]
@@ -0,0 +1,556 @@
+"""
+NumPy inference engine for trained GRU seq2seq / CopyNet models.
+
+The engine re-implements the decoding computation of
+framework.EncoderDecoderModel (birnn/rnn encoder, attention decoder, greedy
+and beam search decoding, CopyNet output) with NumPy on the parameters
+exported from a TensorFlow checkpoint, so that a model can be served without
+constructing the static graph of every bucket and restoring the checkpoint.
+
+It exposes the subset of the model interface used by decode_tools
+(buckets, batch_size, format_batch, step, model_dir, decode_sig), hence it can
+be passed to decode_tools.translate_fun and friends in place of the
+TensorFlow model with sess=None.
+
+Usage:
+    ./bash-copy.sh --export_numpy_model
+    ./bash-copy.sh --demo --numpy_inference
+    ./bash-copy.sh --test_numpy_inference     # parity with the TF graph
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import sys
+if sys.version_info > (3, 0):
+    from six.moves import xrange
+
+import json
+import os
+import numpy as np
+
+from encoder_decoder import data_utils
+
+
+MODEL_FILE = 'numpy_model.npz'
+
+
+# --- Export --- #
+
+def get_variable_names(hyperparams):
+    """
+    Names of the checkpoint variables used for decoding.
+    """
+    names = ['encoder_token_embeddings/embedding',
+             'token_decoder_embeddings/embedding',
+             'token_decoder_output_project/proj_w',
+             'token_decoder_output_project/proj_b']
+    if hyperparams['encoder_topology'] == 'birnn':
+        encoder_scopes = ['encoder_rnn/BiRNN_FW', 'encoder_rnn/BiRNN_BW']
+    else:
+        encoder_scopes = ['encoder_rnn/RNN']
+    for scope in encoder_scopes + ['token_decoder_decoder_rnn']:
+        for layer in ['gates', 'candidate']:
+            for param in ['kernel', 'bias']:
+                names.append('{}/gru_cell/{}/{}'.format(scope, layer, param))
+    if hyperparams['tg_token_use_attention']:
+        for a in xrange(get_num_heads(hyperparams)):
+            names.append('token_decoder_decoder_rnn/Attention_{0}/AttnW_{0}'
+                         .format(a))
+            names.append('token_decoder_decoder_rnn/Attention_{0}/Attnl_{0}'
+                         .format(a))
+        # graph_utils.linear names the weight matrix "bias" and the bias
+        # vector "kernel"
+        names.append('token_decoder_decoder_rnn/AttnOutputProjection/bias')
+        names.append('token_decoder_decoder_rnn/AttnOutputProjection/kernel')
+    return names
+
+
+def get_num_heads(hyperparams):
+    return 2 if (hyperparams['tg_token_use_attention'] and
+                 is_copynet(hyperparams)) else 1
+
+
+def is_copynet(hyperparams):
+    return hyperparams['use_copy'] and hyperparams['copy_fun'] == 'copynet'
+
+
+def export_model(reader, FLAGS, path):
+    """
+    Save the decoding parameters of a trained model to a .npz file.
+
+    :param reader: Checkpoint reader of the trained model (any object with a
+        get_tensor(name) method, e.g. tf.train.load_checkpoint(ckpt_path)).
+    :param FLAGS: Hyperparameter settings of the trained model.
+    :param path: Output file path.
+    """
+    hyperparams = {
+        'encoder_topology': FLAGS.encoder_topology,
+        'decoder_topology': FLAGS.decoder_topology,
+        'rnn_cell': FLAGS.rnn_cell,
+        'num_layers': FLAGS.num_layers,
+        'sc_char': FLAGS.sc_char,
+        'tg_char': FLAGS.tg_char,
+        'tg_token_use_attention': FLAGS.tg_token_use_attention,
+        'tg_token_attn_fun': FLAGS.tg_token_attn_fun,
+        'use_copy': FLAGS.use_copy,
+        'copy_fun': FLAGS.copy_fun
+    }
+    check_hyperparameters(hyperparams)
+    params = dict([(name, reader.get_tensor(name))
+                   for name in get_variable_names(hyperparams)])
+    params['hyperparameters'] = np.array(json.dumps(hyperparams))
+    np.savez(path, **params)
+    print('NumPy model saved to {}'.format(path))
+
+
+def check_hyperparameters(hyperparams):
+    if hyperparams['decoder_topology'] != 'rnn':
+        raise ValueError('The NumPy engine only supports the rnn decoder.')
+    if hyperparams['encoder_topology'] not in ['rnn', 'birnn']:
+        raise ValueError('Unrecognized encoder topology: {}.'.format(
+            hyperparams['encoder_topology']))
+    if hyperparams['rnn_cell'] != 'gru' or hyperparams['num_layers'] != 1:
+        raise ValueError('The NumPy engine only supports single-layer GRU '
+                         'cells.')
+    if hyperparams['sc_char'] or hyperparams['tg_char']:
+        raise ValueError('The NumPy engine does not support character '
+                         'channels.')
+    if hyperparams['tg_token_use_attention'] and \
+            hyperparams['tg_token_attn_fun'] != 'non-linear':
+        raise ValueError('The NumPy engine only supports non-linear '
+                         'attention.')
+    if hyperparams['use_copy'] and (hyperparams['copy_fun'] != 'copynet' or
+            not hyperparams['tg_token_use_attention']):
+        raise ValueError('The NumPy engine only supports the copynet copying '
+                         'function with attention.')
+
+
+# --- Inference --- #
+
+def sigmoid(x):
+    return 1 / (1 + np.exp(-x))
+
+
+def softmax(x):
+    e = np.exp(x - np.max(x, axis=-1, keepdims=True))
+    return e / np.sum(e, axis=-1, keepdims=True)
+
+
+def top_k(values, k):
+    """
+    Row-wise top k values and indices in descending order. Ties are broken
+    by the lower index first, as in tf.nn.top_k.
+    """
+    indices = np.zeros([values.shape[0], k], dtype=np.int64)
+    for i, row in enumerate(values):
+        kth_value = np.partition(row, -k)[-k]
+        candidates = np.flatnonzero(row >= kth_value)
+        order = np.argsort(-row[candidates], kind='stable')[:k]
+        indices[i] = candidates[order]
+    return np.take_along_axis(values, indices, axis=1), indices
+
+
+class GRUCell(object):
+    """
+    Same computation as tf.compat.v1.nn.rnn_cell.GRUCell.
+
+    The kernels are split into their input and state parts so that the input
+    projections of a whole sequence can be computed with one matrix product.
+    """
+    def __init__(self, params, scope):
+        gates_kernel = params[scope + '/gru_cell/gates/kernel']
+        candidate_kernel = params[scope + '/gru_cell/candidate/kernel']
+        self.dim = candidate_kernel.shape[1]
+        input_dim = candidate_kernel.shape[0] - self.dim
+        self.gates_input_kernel = gates_kernel[:input_dim]
+        self.gates_state_kernel = gates_kernel[input_dim:]
+        self.gates_bias = params[scope + '/gru_cell/gates/bias']
+        self.candidate_input_kernel = candidate_kernel[:input_dim]
+        self.candidate_state_kernel = candidate_kernel[input_dim:]
+        self.candidate_bias = params[scope + '/gru_cell/candidate/bias']
+
+    def project_inputs(self, inputs):
+        return (np.dot(inputs, self.gates_input_kernel) + self.gates_bias,
+                np.dot(inputs, self.candidate_input_kernel) +
+                self.candidate_bias)
+
+    def __call__(self, projected_inputs, state):
+        gates_input, candidate_input = projected_inputs
+        value = sigmoid(gates_input + np.dot(state, self.gates_state_kernel))
+        r, u = np.split(value, 2, axis=-1)
+        c = np.tanh(candidate_input +
+                    np.dot(r * state, self.candidate_state_kernel))
+        return u * state + (1 - u) * c
+
+    def run(self, inputs, state):
+        """
+        :param inputs: [batch_size, length, input_dim]
+        :return: hidden states [batch_size, length, dim]
+        """
+        gates_inputs, candidate_inputs = self.project_inputs(inputs)
+        states = []
+        for t in xrange(inputs.shape[1]):
+            state = self(
+                (gates_inputs[:, t], candidate_inputs[:, t]), state)
+            states.append(state)
+        return np.stack(states, axis=1)
+
+
+class Example(object):
+    """
+    Batch-major counterpart of framework.Example.
+    """
+    def __init__(self):
+        self.encoder_inputs = None          # [batch_size, encoder_size]
+        self.encoder_attn_masks = None      # [batch_size, encoder_size]
+        self.decoder_inputs = None          # [batch_size, decoder_size]
+        self.encoder_copy_inputs = None     # Copynet
+
+
+class Output(object):
+    """
+    Same fields as framework.Output.
+    """
+    def __init__(self):
+        self.losses = None
+        self.output_symbols = None
+        self.sequence_logits = None
+        self.attn_alignments = None
+        self.encoder_hidden_states = None
+        self.decoder_hidden_states = None
+        self.pointers = None
+
+
+class NumpyModel(object):
+    def __init__(self, path, FLAGS, buckets=None, decode_sig=None,
+                 grammar_constraint=None):
+        """
+        :param path: Path of the parameters saved by export_model.
+        :param FLAGS: Decoding hyperparameter settings.
+        :param buckets: Buckets of the dataset (same as for the TF model).
+        :param decode_sig: Decoding signature used to name prediction files.
+        :param grammar_constraint: See beam_search.BeamDecoder.
+        """
+        params = np.load(path)
+        self.hyperparams = json.loads(str(params['hyperparameters']))
+        check_hyperparameters(self.hyperparams)
+        self.model_dir = os.path.dirname(path)
+        self.decode_sig = decode_sig
+        self.buckets = buckets
+        if buckets:
+            self.max_source_length, self.max_target_length = buckets[-1]
+        else:
+            self.max_source_length = FLAGS.max_sc_length
+            self.max_target_length = FLAGS.max_tg_length
+        self.batch_size = FLAGS.decode_batch_size
+        self.decoding_algorithm = FLAGS.token_decoding_algorithm
+        self.beam_size = FLAGS.beam_size
+        self.alpha = FLAGS.alpha
+        self.grammar_constraint = grammar_constraint
+
+        self.use_attention = self.hyperparams['tg_token_use_attention']
+        self.copynet = is_copynet(self.hyperparams)
+        self.use_copy = self.copynet
+        self.num_heads = get_num_heads(self.hyperparams)
+
+        self.sc_embeddings = params['encoder_token_embeddings/embedding']
+        if self.hyperparams['encoder_topology'] == 'birnn':
+            self.encoder_cells = [GRUCell(params, 'encoder_rnn/BiRNN_FW'),
+                                  GRUCell(params, 'encoder_rnn/BiRNN_BW')]
+        else:
+            self.encoder_cells = [GRUCell(params, 'encoder_rnn/RNN')]
+        self.decoder_cell = GRUCell(params, 'token_decoder_decoder_rnn')
+        self.dim = self.decoder_cell.dim
+        self.tg_embeddings = params['token_decoder_embeddings/embedding']
+        self.W = params['token_decoder_output_project/proj_w']
+        self.b = params['token_decoder_output_project/proj_b']
+        self.target_vocab_size = self.W.shape[1]
+        if self.use_attention:
+            # The attention scores are computed by a 1x1 convolution over
+            # [encoder state; decoder state], split into the two parts.
+            self.attn_encoder_kernels = []
+            self.attn_decoder_kernels = []
+            self.attn_vectors = []
+            for a in xrange(self.num_heads):
+                k = params['token_decoder_decoder_rnn/Attention_{0}/AttnW_{0}'
+                           .format(a)][0, 0]
+                self.attn_encoder_kernels.append(k[:self.dim])
+                self.attn_decoder_kernels.append(k[self.dim:])
+                self.attn_vectors.append(np.reshape(params[
+                    'token_decoder_decoder_rnn/Attention_{0}/Attnl_{0}'
+                    .format(a)], [-1]))
+            self.attn_output_W = \
+                params['token_decoder_decoder_rnn/AttnOutputProjection/bias']
+            self.attn_output_b = \
+                params['token_decoder_decoder_rnn/AttnOutputProjection/kernel']
+
+    def format_batch(self, encoder_input_channels, decoder_input_channels,
+                     bucket_id=-1):
+        """
+        Same arguments as framework.EncoderDecoderModel.format_batch.
+        """
+        if bucket_id != -1:
+            encoder_size, decoder_size = self.buckets[bucket_id]
+        else:
+            encoder_size, decoder_size = \
+                self.max_source_length, self.max_target_length
+
+        E = Example()
+        E.encoder_inputs = data_utils.pad_batch(
+            encoder_input_channels[0], encoder_size, reversed_output=True)
+        E.encoder_attn_masks = \
+            (E.encoder_inputs != data_utils.PAD_ID).astype(np.float32)
+        E.decoder_inputs = data_utils.pad_batch(
+            decoder_input_channels[0], decoder_size, reversed_output=False)
+        if self.copynet:
+            E.encoder_copy_inputs = data_utils.pad_batch(
+                encoder_input_channels[1], encoder_size, reversed_output=True)
+        return E
+
+    def step(self, session, formatted_example, bucket_id=-1,
+             forward_only=True):
+        """
+        Decode a formatted batch. Same output as
+        framework.EncoderDecoderModel.step with forward_only set, except that
+        attention alignments and pointers are not returned.
+
+        :param session: Unused (kept for interface compatibility).
+        """
+        assert(forward_only)
+        E = formatted_example
+        attention_states, encoder_state = self.encode(E.encoder_inputs)
+        if self.decoding_algorithm == 'beam_search':
+            output_symbols, sequence_logits, decoder_states = \
+                self.beam_search(E, attention_states, encoder_state)
+        else:
+            output_symbols, sequence_logits, decoder_states = \
+                self.greedy(E, attention_states, encoder_state)
+
+        O = Output()
+        O.losses = np.zeros([len(E.encoder_inputs)], dtype=np.int32)
+        O.output_symbols = output_symbols
+        O.sequence_logits = sequence_logits
+        O.encoder_hidden_states = attention_states
+        O.decoder_hidden_states = decoder_states
+        return O
+
+    # --- Encoder --- #
+
+    def encode(self, encoder_inputs):
+        """
+        :return: (encoder hidden states [batch_size, encoder_size, dim],
+            final encoder state [batch_size, dim])
+        """
+        inputs = self.sc_embeddings[encoder_inputs]
+        state = np.zeros([len(inputs), self.encoder_cells[0].dim],
+                         dtype=np.float32)
+        outputs_fw = self.encoder_cells[0].run(inputs, state)
+        if len(self.encoder_cells) == 1:
+            return outputs_fw, outputs_fw[:, -1]
+        outputs_bw = self.encoder_cells[1].run(inputs[:, ::-1], state)
+        return (np.concatenate([outputs_fw, outputs_bw[:, ::-1]], axis=2),
+                np.concatenate([outputs_fw[:, -1], outputs_bw[:, -1]], axis=1))
+
+    # --- Decoder --- #
+
+    def decoder_step(self, input, state, attention, selective_reads):
+        """
+        One step of the (attention/copy) decoder cell.
+
+        :param input: [full_size] input symbols.
+        :param attention: (attention_states, attention_keys, attn_masks,
+            encoder_copy_inputs) tiled to the full size.
+        :return: (output, state, copy_scores) where output is the output
+            distribution of CopyNet or the output state otherwise.
+        """
+        attention_states, attention_keys, attn_masks, encoder_copy_inputs = \
+            attention
+        if self.copynet:
+            input = np.where(input >= self.target_vocab_size,
+                             data_utils.UNK_ID, input)
+        input_embedding = self.tg_embeddings[input]
+        if self.copynet:
+            input_embedding = np.concatenate(
+                [input_embedding, selective_reads], axis=1)
+        state = self.decoder_cell(
+            self.decoder_cell.project_inputs(input_embedding), state)
+        if not self.use_attention:
+            return state, state, None
+
+        scores = []
+        for a in xrange(self.num_heads):
+            s = np.dot(np.tanh(attention_keys[a] + np.expand_dims(
+                np.dot(state, self.attn_decoder_kernels[a]), 1)),
+                self.attn_vectors[a])
+            scores.append(s - (1 - attn_masks) * 1e12)
+        alignment = softmax(scores[0])
+        context = np.sum(np.expand_dims(alignment, 2) * attention_states,
+                         axis=1)
+        output = np.dot(np.concatenate([state, context], axis=1),
+                        self.attn_output_W) + self.attn_output_b
+        if not self.copynet:
+            return output, state, None
+
+        # generation/copying mixture
+        gen_logit = np.dot(output, self.W) + self.b
+        copy_logit = scores[1]
+        prob = softmax(np.concatenate([gen_logit, copy_logit], axis=1))
+        gen_prob = prob[:, :self.target_vocab_size]
+        copy_prob = prob[:, self.target_vocab_size:]
+        mix_prob = np.concatenate(
+            [gen_prob, np.zeros_like(copy_prob)], axis=1)
+        rows = np.repeat(np.arange(len(mix_prob)), copy_prob.shape[1])
+        np.add.at(mix_prob, (rows, encoder_copy_inputs.ravel()),
+                  copy_prob.ravel())
+        return mix_prob, state, copy_logit
+
+    def selective_reads(self, input, attention, copy_scores):
+        """
+        CopyNet selective read of the source positions holding the input
+        symbol.
+        """
+        if not self.copynet:
+            return None
+        attention_states, _, _, encoder_copy_inputs = attention
+        if copy_scores is None:
+            return np.zeros([len(input), self.dim], dtype=np.float32)
+        # The TF graph looks up copied symbols after they are replaced with
+        # _UNK, which maps them to index 0 (see rnn_decoder.RNNDecoder).
+        copy_input = np.where(input >= self.target_vocab_size, 0, input)
+        selective_mask = (np.expand_dims(copy_input, 1) ==
+                          encoder_copy_inputs).astype(np.float32)
+        weighted_selective_mask = softmax(selective_mask * copy_scores)
+        return np.sum(np.expand_dims(weighted_selective_mask, 2) *
+                      attention_states, axis=1)
+
+    def prepare_attention(self, E, attention_states, tile=1):
+        attention_keys = None
+        if self.use_attention:
+            attention_keys = [np.repeat(np.dot(attention_states, k), tile,
+                                        axis=0)
+                              for k in self.attn_encoder_kernels]
+        encoder_copy_inputs = None
+        if self.copynet:
+            encoder_copy_inputs = np.repeat(E.encoder_copy_inputs, tile,
+                                            axis=0)
+        return (np.repeat(attention_states, tile, axis=0), attention_keys,
+                np.repeat(E.encoder_attn_masks, tile, axis=0),
+                encoder_copy_inputs)
+
+    def output_logprobs(self, output, epsilon=0):
+        if self.copynet:
+            return np.log(output + epsilon)
+        logits = np.dot(output, self.W) + self.b
+        if epsilon:
+            return np.log(softmax(logits) + epsilon)
+        logits = logits - np.max(logits, axis=1, keepdims=True)
+        return logits - np.log(np.sum(np.exp(logits), axis=1, keepdims=True))
+
+    def greedy(self, E, attention_states, encoder_state):
+        attention = self.prepare_attention(E, attention_states)
+        state = encoder_state
+        input = E.decoder_inputs[:, 0]
+        copy_scores = None
+        output_symbols, output_logits, states = [], [], []
+        for i in xrange(E.decoder_inputs.shape[1]):
+            if i > 0:
+                input = output_symbols[-1]
+            selective_reads = self.selective_reads(input, attention,
+                                                   copy_scores)
+            output, state, copy_scores = self.decoder_step(
+                input, state, attention, selective_reads)
+            logits = self.output_logprobs(output, epsilon=1e-12)
+            output_symbols.append(np.argmax(logits, axis=1).astype(np.int32))
+            output_logits.append(np.max(logits, axis=1))
+            states.append(state)
+        return np.stack(output_symbols, axis=1), \
+               np.sum(output_logits, axis=0), np.stack(states, axis=1)
+
+    def beam_search(self, E, attention_states, encoder_state):
+        """
+        Same search as beam_search.BeamDecoderCellWrapper (with length
+        normalization), with the histories recovered from back-pointers.
+        """
+        batch_size, beam_size = len(E.decoder_inputs), self.beam_size
+        full_size = batch_size * beam_size
+        attention = self.prepare_attention(E, attention_states, beam_size)
+        state = np.repeat(encoder_state, beam_size, axis=0)
+        input = np.repeat(E.decoder_inputs[:, 0], beam_size)
+
+        beam_symbols = np.full([full_size], data_utils.ROOT_ID,
+                               dtype=np.int32)
+        beam_logprobs = np.where(np.arange(full_size) % beam_size == 0,
+            0.0, -1e18).astype(np.float32)
+        seq_len = np.full([full_size], 1e-12, dtype=np.float32)
+        grammar_states = np.zeros([full_size], dtype=np.int64)
+        parent_refs_offsets = \
+            (np.arange(full_size) // beam_size) * beam_size
+        copy_scores = None
+        parent_refs_history, symbols_history, states_history = [], [], []
+
+        for i in xrange(E.decoder_inputs.shape[1]):
+            if i > 0:
+                input = beam_symbols
+            selective_reads = self.selective_reads(input, attention,
+                                                   copy_scores)
+            output, state, copy_scores = self.decoder_step(
+                input, state, attention, selective_reads)
+            with np.errstate(divide='ignore'):
+                logprobs = self.output_logprobs(output)
+            num_classes = logprobs.shape[1]
+
+            stop_mask = np.expand_dims(
+                (beam_symbols == data_utils.EOS_ID).astype(np.float32), 1)
+            if self.grammar_constraint is not None:
+                grammar_states, grammar_mask = self.grammar_constraint.step(
+                    grammar_states, beam_symbols)
+                logprobs[:, :grammar_mask.shape[1]] += \
+                    -1e18 * (1 - grammar_mask)
+            done_mask = np.expand_dims(
+                (np.arange(num_classes) == data_utils.EOS_ID)
+                .astype(np.float32), 0)
+            logprobs = logprobs + stop_mask * -1e18 * (1 - done_mask)
+            logprobs = logprobs * (1 - stop_mask * done_mask)
+
+            # length normalization
+            past_logprobs_unormalized = \
+                beam_logprobs * np.power(seq_len, self.alpha)
+            logprobs_unormalized = \
+                np.expand_dims(past_logprobs_unormalized, 1) + logprobs
+            next_seq_len = np.expand_dims(seq_len, 1) + (1 - stop_mask)
+            logprobs_batched = \
+                logprobs_unormalized / np.power(next_seq_len, self.alpha)
+
+            beam_logprobs, indices = top_k(
+                np.reshape(logprobs_batched, [-1, beam_size * num_classes]),
+                beam_size)
+            beam_logprobs = np.reshape(beam_logprobs, [-1])
+            beam_symbols = np.reshape(indices % num_classes,
+                                      [-1]).astype(np.int32)
+            parent_refs = np.reshape(indices // num_classes, [-1]) + \
+                parent_refs_offsets
+
+            seq_len = next_seq_len[parent_refs, 0]
+            grammar_states = grammar_states[parent_refs]
+            state = state[parent_refs]
+            if copy_scores is not None:
+                copy_scores = copy_scores[parent_refs]
+            parent_refs_history.append(parent_refs)
+            symbols_history.append(beam_symbols)
+            states_history.append(state)
+
+        # follow the back-pointers to recover the histories of the final beams
+        rows = np.arange(full_size)
+        symbols, states = [], []
+        for parent_refs, step_symbols, step_states in zip(
+                reversed(parent_refs_history), reversed(symbols_history),
+                reversed(states_history)):
+            symbols.append(step_symbols[rows])
+            states.append(step_states[rows])
+            rows = parent_refs[rows]
+        output_symbols = np.reshape(np.stack(symbols[::-1], axis=1),
+                                    [batch_size, beam_size, -1])
+        sequence_logits = np.reshape(beam_logprobs, [batch_size, beam_size])
+        return output_symbols, sequence_logits, np.stack(states[::-1], axis=1)
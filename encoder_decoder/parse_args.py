@@ -17,6 +17,11 @@ def define_input_flags():
                                 'Number of training epochs')
     tf.compat.v1.flags.DEFINE_integer('epochs_per_checkpoint', 1,
                                 'How many training steps to do per checkpoint.')
+    tf.compat.v1.flags.DEFINE_integer('num_prefetch_workers', 1,
+                                'Number of background threads preparing training batches '
+                                '(0 to prepare each batch right before its training step).')
+    tf.compat.v1.flags.DEFINE_integer('prefetch_queue_depth', 4,
+                                'Maximum number of training batches prepared ahead.')
 
     tf.compat.v1.flags.DEFINE_boolean('explain', False,
                                 'Set to True to translate code to natural language.')
@@ -48,6 +53,38 @@ def define_input_flags():
                                 'Set to True to perform manual evaluation in the commandline interface.')
     tf.compat.v1.flags.DEFINE_boolean('demo', False,
                                 'Set to True for interactive demo.')
+    tf.compat.v1.flags.DEFINE_boolean('serve', False,
+                                'Set to True to start a local translation service.')
+    tf.compat.v1.flags.DEFINE_string('serve_host', '127.0.0.1', 'Address the translation service listens on.')
+    tf.compat.v1.flags.DEFINE_integer('serve_port', 8080, 'Port the translation service listens on.')
+    tf.compat.v1.flags.DEFINE_float('serve_max_wait', 10,
+                              'Maximum time (in milliseconds) a translation request waits for '
+                              'other requests to join its batch.')
+    tf.compat.v1.flags.DEFINE_integer('translation_cache_size', 0,
+                              'Maximum number of command templates cached by the demo and the '
+                              'translation service (0 disables the cache).')
+    tf.compat.v1.flags.DEFINE_string('translation_cache_path', '',
+                              'If set, the translation cache is loaded from and saved to this file.')
+    tf.compat.v1.flags.DEFINE_integer('parse_cache_size', 20000,
+                              'Maximum number of bash ASTs cached by the command parser '
+                              '(0 disables the cache).')
+    tf.compat.v1.flags.DEFINE_string('parse_cache_path', '',
+                              'If set, the bash parse cache is loaded from and saved to this file.')
+    tf.compat.v1.flags.DEFINE_integer('num_eval_workers', 1,
+                              'Number of worker processes computing the automatic evaluation '
+                              'metrics (1 to evaluate in the main process).')
+    tf.compat.v1.flags.DEFINE_boolean('export_numpy_model', False,
+                                'Set to True to export the trained model parameters for the NumPy '
+                                'inference engine.')
+    tf.compat.v1.flags.DEFINE_boolean('numpy_inference', False,
+                                'If set, decode with the NumPy inference engine instead of the '
+                                'TensorFlow graph (requires --export_numpy_model).')
+    tf.compat.v1.flags.DEFINE_boolean('test_numpy_inference', False,
+                                'Set to True to check that the NumPy inference engine reproduces the '
+                                'predictions of the TensorFlow graph on the dev/test set.')
+    tf.compat.v1.flags.DEFINE_boolean('test_translation_cache', False,
+                                'Set to True to check that a saved translation cache is ignored when '
+                                'loaded with different decoding settings.')
 
     tf.compat.v1.flags.DEFINE_boolean('gen_error_analysis_sheet', False,
                                 'Set to True to generate error analysis spreadsheet.')
@@ -108,7 +145,8 @@ def define_input_flags():
                                 'Number of layers in the encoder-decoder.')
     tf.compat.v1.flags.DEFINE_integer('num_samples', -1,
                                 'Number of samples for sampled softmax.')
-    tf.compat.v1.flags.DEFINE_integer('seed', -1, 'Random seed for graph initialization.')
+    tf.compat.v1.flags.DEFINE_integer('seed', -1, 'Random seed for graph initialization and '
+                                'training batch sampling.')
 
     tf.compat.v1.flags.DEFINE_boolean('variational_recurrent_dropout', False, 'Set to use variational ' +
                                 'recurrent dropout on the RNN cells.')
@@ -156,8 +194,16 @@ def define_input_flags():
     tf.compat.v1.flags.DEFINE_integer('beam_size', -1, 'Size of beam for beam search.')
     tf.compat.v1.flags.DEFINE_integer('beam_order', -1, 'Order for beam search.')
     tf.compat.v1.flags.DEFINE_float('alpha', 0.5, 'Beam search length normalization parameter.')
+    tf.compat.v1.flags.DEFINE_boolean('beam_search_backpointers', True, 'If set, beam search keeps only the '
+                                'current cell states and per-step back-pointers and reconstructs the decoded '
+                                'sequences and hidden state histories after the last step.')
     tf.compat.v1.flags.DEFINE_integer('top_k', 5, 'Top-k highest-scoring structures to output.')
+    tf.compat.v1.flags.DEFINE_integer('decode_batch_size', 1, 'Number of examples decoded in parallel by '
+                                'each session run at decoding time.')
     tf.compat.v1.flags.DEFINE_boolean('grammatical_only', True, 'If set, output only grammatical predictions.')
+    tf.compat.v1.flags.DEFINE_boolean('grammar_constrained_decoding', False, 'If set, beam search masks '
+                                'the target tokens which cannot follow a partial command according to the '
+                                'bash grammar.')
 
     tf.compat.v1.flags.DEFINE_boolean('fill_argument_slots', False, 'If set, fill the argument slots in '
                                 'the output command with filler constants extracted from the natural language input.')
@@ -218,6 +218,8 @@ class RNNDecoder(decoder.Decoder):
 
             if bs_decoding:
                 # Beam-search output
+                if beam_decoder.use_backpointers:
+                    state = decoder_cell.backtrack(state)
                 (
                     past_beam_symbols,  # [batch_size*self.beam_size, max_len], right-aligned!!!
                     past_beam_logprobs, # [batch_size*self.beam_size]
@@ -0,0 +1,259 @@
+"""
+Local translation service which keeps a trained model in memory and answers
+concurrent translation requests over HTTP.
+
+Requests are gathered into micro-batches of at most model.batch_size
+sentences (--decode_batch_size). A batch is sent to the model as soon as it is
+full or the oldest request in it has waited --serve_max_wait milliseconds.
+
+Usage:
+    ./bash-run.sh --serve --decode_batch_size 16 --serve_port 8080 ...
+
+    curl 'http://127.0.0.1:8080/translate?q=find+all+pdf+files&k=5'
+    curl -d '{"sentence": "find all pdf files", "top_k": 5}' \
+        http://127.0.0.1:8080/translate
+
+With --translation_cache_size > 0, sentences which share the same command
+template after argument normalization are only run through the model once;
+the cached templates are re-filled with the arguments of each new sentence.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import json
+import threading
+import time
+
+from six.moves import queue
+from six.moves.BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+from six.moves.socketserver import ThreadingMixIn
+from six.moves.urllib.parse import parse_qs, urlparse
+
+from encoder_decoder import data_utils, decode_tools
+
+
+class TranslationRequest(object):
+    """
+    A pending translation request.
+    """
+    def __init__(self, sentence, top_k):
+        self.sentence = sentence
+        self.top_k = top_k
+        self.features = None
+        self.predictions = None
+        self.error = None
+        self.done = threading.Event()
+
+
+class MicroBatcher(object):
+    def __init__(self, sess, model, FLAGS, max_wait=0.01, max_queue_size=1024):
+        """
+        :param sess: TensorFlow session holding the restored model parameters.
+        :param model: Prediction model object.
+        :param FLAGS: Decoding hyperparameter settings.
+        :param max_wait: Maximum time (in seconds) a request waits for other
+            requests to join its batch.
+        :param max_queue_size: Maximum number of pending requests; requests
+            above this limit are rejected.
+        """
+        self.sess = sess
+        self.model = model
+        self.FLAGS = FLAGS
+        self.max_wait = max_wait
+        self.batch_size = model.batch_size
+
+        # Load all resources once for the lifetime of the service
+        self.vocabs = data_utils.load_vocabulary(FLAGS)
+        if FLAGS.fill_argument_slots:
+            self.slot_filling_classifier = \
+                decode_tools.get_slot_filling_classifer(FLAGS)
+        else:
+            self.slot_filling_classifier = None
+        self.translation_cache = \
+            decode_tools.get_translation_cache(FLAGS, self.vocabs)
+
+        self.requests = queue.Queue(max_queue_size)
+        self.worker = threading.Thread(target=self.run)
+        self.worker.daemon = True
+
+    def start(self):
+        self.worker.start()
+
+    def submit(self, sentence, top_k):
+        """
+        Block until the sentence is translated.
+
+        :return: list of (command, score) pairs.
+        """
+        request = TranslationRequest(sentence, top_k)
+        self.requests.put_nowait(request)
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return request.predictions
+
+    def next_batch(self):
+        batch = [self.requests.get()]
+        deadline = time.time() + self.max_wait
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self.requests.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+
+    def stats(self):
+        """
+        Translation cache statistics, or None if caching is disabled.
+        """
+        if self.translation_cache is None:
+            return None
+        return self.translation_cache.stats()
+
+    def run(self):
+        # The model is only ever run from this thread.
+        while True:
+            batch = self.next_batch()
+            # a request which cannot be translated fails on its own
+            translated = []
+            for request in batch:
+                try:
+                    request.features = decode_tools.get_example_features(
+                        request.sentence, self.vocabs, self.FLAGS)
+                    translated.append(request)
+                except Exception as e:
+                    request.error = e
+            try:
+                translations = decode_tools.translate_example_features(
+                    [request.features for request in translated], self.sess,
+                    self.model, self.vocabs, self.FLAGS,
+                    slot_filling_classifier=self.slot_filling_classifier,
+                    translation_cache=self.translation_cache)
+            except Exception as e:
+                for request in translated:
+                    request.error = e
+                translations = []
+            for request, (batch_outputs, sequence_logits) in \
+                    zip(translated, translations):
+                try:
+                    request.predictions = decode_tools.get_top_k_predictions(
+                        batch_outputs, sequence_logits, request.top_k,
+                        self.FLAGS)
+                except Exception as e:
+                    request.error = e
+            for request in batch:
+                request.done.set()
+
+
+class TranslationRequestHandler(BaseHTTPRequestHandler):
+    """
+    GET /translate?q=<sentence>[&k=<top_k>]
+    POST /translate {"sentence": <sentence>[, "top_k": <top_k>]}
+
+    Responds with {"sentence": ..., "predictions": [[command, score], ...]}.
+
+    GET /stats
+
+    Responds with the translation cache statistics.
+    """
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == '/stats':
+            self.send_json({'translation_cache': self.server.batcher.stats()})
+            return
+        if url.path != '/translate':
+            self.send_error(404)
+            return
+        query = parse_qs(url.query)
+        if not 'q' in query:
+            self.send_error(400, 'Missing query parameter "q".')
+            return
+        self.translate(query['q'][0], query.get('k', [None])[0])
+
+    def do_POST(self):
+        if urlparse(self.path).path != '/translate':
+            self.send_error(404)
+            return
+        length = int(self.headers.get('Content-Length', 0))
+        try:
+            body = json.loads(self.rfile.read(length).decode('utf-8'))
+            sentence = body['sentence']
+        except (ValueError, KeyError, TypeError):
+            self.send_error(400, 'Expecting a JSON object with a "sentence" field.')
+            return
+        if not isinstance(sentence, str) or not sentence.strip():
+            self.send_error(400, 'The "sentence" field must be a non-empty string.')
+            return
+        self.translate(sentence, body.get('top_k'))
+
+    def translate(self, sentence, top_k):
+        try:
+            top_k = int(top_k) if top_k is not None \
+                else self.server.default_top_k
+        except ValueError:
+            self.send_error(400, 'Top-k must be an integer.')
+            return
+        try:
+            predictions = self.server.batcher.submit(sentence, top_k)
+        except queue.Full:
+            self.send_error(503, 'Too many pending requests.')
+            return
+        except Exception as e:
+            self.send_error(500, str(e))
+            return
+        self.send_json({
+            'sentence': sentence,
+            'predictions': [[cmd, float(score)] for cmd, score in predictions]
+        })
+
+    def send_json(self, obj):
+        response = json.dumps(obj).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            BaseHTTPRequestHandler.log_message(self, format, *args)
+
+
+class TranslationServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, batcher, default_top_k=10, verbose=False):
+        HTTPServer.__init__(self, address, TranslationRequestHandler)
+        self.batcher = batcher
+        self.default_top_k = default_top_k
+        self.verbose = verbose
+
+
+def serve(sess, model, FLAGS, verbose=False):
+    """
+    Serve translation requests until interrupted.
+    """
+    batcher = MicroBatcher(sess, model, FLAGS,
+                           max_wait=FLAGS.serve_max_wait / 1000.0)
+    batcher.start()
+    server = TranslationServer((FLAGS.serve_host, FLAGS.serve_port), batcher,
+                               default_top_k=FLAGS.top_k, verbose=verbose)
+    print('Serving translations on http://{}:{}/translate (batch size = {}, '
+          'max wait = {}ms)'.format(FLAGS.serve_host, FLAGS.serve_port,
+                                    batcher.batch_size, FLAGS.serve_max_wait))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        translation_cache = batcher.translation_cache
+        if translation_cache is not None:
+            print('Translation cache: {}'.format(translation_cache.stats()))
+            if translation_cache.path:
+                translation_cache.save()
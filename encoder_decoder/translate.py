@@ -18,18 +18,21 @@ if sys.version_info > (3, 0):
 os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3' 
 
 import math
-import numpy as np
 import pickle
 import time
 from tqdm import tqdm
 
 import tensorflow as tf
 
+from bashlint import data_tools
+from encoder_decoder import batch_prefetcher
 from encoder_decoder import data_utils
 from encoder_decoder import decode_tools
 from encoder_decoder import graph_utils
 from encoder_decoder import meta_experiments
+from encoder_decoder import numpy_engine
 from encoder_decoder import parse_args
+from encoder_decoder import server
 from encoder_decoder import slot_filling
 from .seq2seq.seq2seq_model import Seq2SeqModel
 from .seq2tree.seq2tree_model import Seq2TreeModel
@@ -55,6 +58,19 @@ def define_model(session, forward_only, buckets=None):
         raise ValueError("Unrecognized decoder topology: {}.".format(
             FLAGS.decoder_topology))
 
+
+def define_numpy_model(buckets=None):
+    """
+    Load the parameters saved by export_numpy_model into the NumPy inference
+    engine.
+    """
+    model_subdir, decode_sig = graph_utils.get_decode_signature(FLAGS)
+    FLAGS.model_dir = os.path.join(FLAGS.model_root_dir, model_subdir)
+    path = os.path.join(FLAGS.model_dir, numpy_engine.MODEL_FILE)
+    print("Reading NumPy model parameters from %s" % path)
+    return numpy_engine.NumpyModel(path, FLAGS, buckets, decode_sig,
+        grammar_constraint=graph_utils.get_grammar_constraint(FLAGS))
+
 # --- Run experiments --- #
 
 def train(train_set, test_set, verbose=False):
@@ -80,17 +96,21 @@ def train(train_set, test_set, verbose=False):
         previous_losses = []
         previous_dev_losses = []
 
+        # Training batches are prepared in the background while the previous
+        # step runs; their order only depends on the seed.
+        prefetcher = batch_prefetcher.BatchPrefetcher(
+            model, train_set.data_points, train_buckets_scale,
+            num_workers=FLAGS.num_prefetch_workers,
+            queue_depth=FLAGS.prefetch_queue_depth,
+            seed=(FLAGS.seed if FLAGS.seed != -1 else None))
+
         for t in xrange(FLAGS.num_epochs):
             print("Epoch %d" % (t+1))
 
             # progress bar
             start_time = time.time()
             for _ in tqdm(xrange(FLAGS.steps_per_epoch)):
-                time.sleep(0.01)
-                random_number_01 = np.random.random_sample()
-                bucket_id = min([i for i in xrange(len(train_buckets_scale))
-                                 if train_buckets_scale[i] > random_number_01])
-                formatted_example = model.get_batch(train_set.data_points, bucket_id)
+                bucket_id, formatted_example = prefetcher.next_batch()
                 model_outputs = model.step(
                     sess, formatted_example, bucket_id, forward_only=False)
                 loss += model_outputs.losses
@@ -108,6 +128,7 @@ def train(train_set, test_set, verbose=False):
                     if t > 1:
                         break
                     else:
+                        prefetcher.close()
                         raise graph_utils.InfPerplexityError
                 print("learning rate %.4f epoch-time %.4f perplexity %.2f" % (
                     model.learning_rate.eval(), epoch_time, ppx))
@@ -154,10 +175,15 @@ def train(train_set, test_set, verbose=False):
 
                 sys.stdout.flush()
 
+        prefetcher.close()
         return model
 
 
 def decode(dataset, buckets=None, verbose=True):
+    if FLAGS.numpy_inference:
+        model = define_numpy_model(buckets)
+        decode_tools.decode_set(None, model, dataset, 3, FLAGS, verbose)
+        return model
     with tf.compat.v1.Session(config=tf.compat.v1.ConfigProto(allow_soft_placement=True,
             log_device_placement=FLAGS.log_device_placement)) as sess:
         # Initialize model parameters.
@@ -173,7 +199,11 @@ def eval(dataset, prediction_path=None, verbose=True):
         prediction_path = os.path.join(model_dir, 'predictions.{}.latest'.format(decode_sig))
     print("(Auto) evaluating " + prediction_path)
 
-    return eval_tools.automatic_eval(prediction_path, dataset, top_k=3, FLAGS=FLAGS, verbose=verbose)
+    metrics = eval_tools.automatic_eval(prediction_path, dataset, top_k=3, FLAGS=FLAGS, verbose=verbose)
+    parse_cache = data_tools.get_parse_cache()
+    if parse_cache is not None:
+        print("Parse cache hit rate = %.3f" % parse_cache.hit_rate())
+    return metrics
 
 
 def manual_eval(dataset, prediction_path=None):
@@ -187,6 +217,9 @@ def manual_eval(dataset, prediction_path=None):
 
 
 def demo(buckets=None):
+    if FLAGS.numpy_inference:
+        decode_tools.demo(None, define_numpy_model(buckets), FLAGS)
+        return
     with tf.compat.v1.Session(config=tf.compat.v1.ConfigProto(allow_soft_placement=True,
         log_device_placement=FLAGS.log_device_placement)) as sess:
         # Initialize model parameters.
@@ -194,10 +227,42 @@ def demo(buckets=None):
         decode_tools.demo(sess, model, FLAGS)
 
 
+def serve(buckets=None):
+    if FLAGS.numpy_inference:
+        server.serve(None, define_numpy_model(buckets), FLAGS)
+        return
+    with tf.compat.v1.Session(config=tf.compat.v1.ConfigProto(allow_soft_placement=True,
+        log_device_placement=FLAGS.log_device_placement)) as sess:
+        # Initialize model parameters.
+        model = define_model(sess, forward_only=True, buckets=buckets)
+        server.serve(sess, model, FLAGS)
+
+
+def export_numpy_model():
+    model_subdir, _ = graph_utils.get_decode_signature(FLAGS)
+    model_dir = os.path.join(FLAGS.model_root_dir, model_subdir)
+    ckpt = tf.train.get_checkpoint_state(model_dir)
+    print("Reading model parameters from %s" % ckpt.model_checkpoint_path)
+    numpy_engine.export_model(
+        tf.train.load_checkpoint(ckpt.model_checkpoint_path), FLAGS,
+        os.path.join(model_dir, numpy_engine.MODEL_FILE))
+
+
+def test_numpy_inference(dataset, buckets=None):
+    numpy_model = define_numpy_model(buckets)
+    with tf.compat.v1.Session(config=tf.compat.v1.ConfigProto(allow_soft_placement=True,
+        log_device_placement=FLAGS.log_device_placement)) as sess:
+        model = define_model(sess, forward_only=True, buckets=buckets)
+        decode_tools.test_numpy_inference(
+            sess, model, numpy_model, dataset, FLAGS)
+
+
 def gen_slot_filling_training_data(FLAGS, datasets):
     # Set hyperparameters
     token_decoding_algorithm = FLAGS.token_decoding_algorithm
+    decode_batch_size = FLAGS.decode_batch_size
     FLAGS.token_decoding_algorithm = 'greedy'
+    FLAGS.decode_batch_size = 1
     FLAGS.force_reading_input = True
 
     with tf.compat.v1.Session(config=tf.compat.v1.ConfigProto(allow_soft_placement=True,
@@ -215,6 +280,7 @@ def gen_slot_filling_training_data(FLAGS, datasets):
 
     # Restore hyperparameters
     FLAGS.token_decoding_algorithm = token_decoding_algorithm
+    FLAGS.decode_batch_size = decode_batch_size
     FLAGS.force_reading_input = False
 
 
@@ -289,6 +355,9 @@ def main(_):
                          .format(FLAGS.decoder_topology))
     print("Saving models to {}".format(FLAGS.model_root_dir))
 
+    parse_cache = data_tools.set_parse_cache(
+        FLAGS.parse_cache_size, FLAGS.parse_cache_path or None)
+
     if FLAGS.process_data:
         process_data()
 
@@ -342,6 +411,18 @@ def main(_):
             elif FLAGS.demo:
                 demo(buckets=train_set.buckets)
 
+            elif FLAGS.export_numpy_model:
+                export_numpy_model()
+
+            elif FLAGS.test_numpy_inference:
+                test_numpy_inference(dataset, buckets=train_set.buckets)
+
+            elif FLAGS.test_translation_cache:
+                decode_tools.test_translation_cache(FLAGS)
+
+            elif FLAGS.serve:
+                serve(buckets=train_set.buckets)
+
             elif FLAGS.grid_search:
                 meta_experiments.grid_search(
                     train, decode, eval, train_set, dataset, FLAGS)
@@ -373,6 +454,9 @@ def main(_):
                 if not FLAGS.explain:
                     eval(dataset, verbose=True)
 
-    
+    if parse_cache is not None and parse_cache.path:
+        parse_cache.save()
+
+
 if __name__ == "__main__":
     tf.compat.v1.app.run()
@@ -79,9 +79,12 @@ def gen_manual_evaluation_csv_single_model(dataset, FLAGS):
             command_gts = [dp.tg_txt for dp in data_group]
             command_gts = set(command_gts + command_translations[sc_key])
             command_gt_asts = [data_tools.bash_parser(cmd) for cmd in command_gts]
+            command_gt_strs = tree_dist.TemplateSet(command_gt_asts)
             template_gts = [data_tools.cmd2template(cmd, loose_constraints=True) for cmd in command_gts]
             template_gts = set(template_gts + template_translations[sc_key])
             template_gt_asts = [data_tools.bash_parser(temp) for temp in template_gts]
+            template_gt_temps = tree_dist.TemplateSet(
+                template_gt_asts, ignore_arg_value=True)
             predictions = prediction_list[example_id]
             for i in xrange(3):
                 if i >= len(predictions):
@@ -91,9 +94,9 @@ def gen_manual_evaluation_csv_single_model(dataset, FLAGS):
                 pred_tree = cmd_parser(pred_cmd)
                 pred_temp = data_tools.ast2template(pred_tree, loose_constraints=True)
                 temp_match = tree_dist.one_match(
-                    template_gt_asts, pred_tree, ignore_arg_value=True)
+                    template_gt_temps, pred_tree, ignore_arg_value=True)
                 str_match = tree_dist.one_match(
-                    command_gt_asts, pred_tree, ignore_arg_value=False)
+                    command_gt_strs, pred_tree, ignore_arg_value=False)
                 # Match ground truths & exisitng judgements
                 command_example_sig = '{}<NL_PREDICTION>{}'.format(sc_key, pred_cmd)
                 structure_example_sig = '{}<NL_PREDICTION>{}'.format(sc_key, pred_temp)
@@ -157,6 +160,9 @@ def gen_manual_evaluation_csv(dataset, FLAGS, num_examples=100):
             sc_key = get_example_nl_key(sc_txt)
             command_gts = [dp.tg_txt for dp in data_group]
             command_gt_asts = [data_tools.bash_parser(gt) for gt in command_gts]
+            command_gt_temps = tree_dist.TemplateSet(
+                command_gt_asts, ignore_arg_value=True)
+            command_gt_strs = tree_dist.TemplateSet(command_gt_asts)
             for model_id, model_name in enumerate(model_names):
                 predictions = model_predictions[model_id][example_id]
                 for i in xrange(min(3, len(predictions))):
@@ -168,9 +174,9 @@ def gen_manual_evaluation_csv(dataset, FLAGS, num_examples=100):
                     pred_tree = cmd_parser(pred_cmd)
                     pred_temp = data_tools.ast2template(pred_tree, loose_constraints=True)
                     temp_match = tree_dist.one_match(
-                        command_gt_asts, pred_tree, ignore_arg_value=True)
+                        command_gt_temps, pred_tree, ignore_arg_value=True)
                     str_match = tree_dist.one_match(
-                        command_gt_asts, pred_tree, ignore_arg_value=False)
+                        command_gt_strs, pred_tree, ignore_arg_value=False)
                     if (model_id * min(3, len(predictions)) + i) < len(command_gts):
                         output_str += '"{}",'.format(
                             command_gts[model_id * min(
@@ -240,6 +246,9 @@ def tabulate_example_predictions(dataset, FLAGS, num_examples=100):
         sc_key = get_example_nl_key(sc_txt)
         command_gts = [dp.tg_txt for dp in data_group]
         command_gt_asts = [data_tools.bash_parser(gt) for gt in command_gts]
+        command_gt_temps = tree_dist.TemplateSet(
+            command_gt_asts, ignore_arg_value=True)
+        command_gt_strs = tree_dist.TemplateSet(command_gt_asts)
         output_strs = {}
         for model_id, model_name in enumerate(model_names):
             predictions = model_predictions[model_id][example_id]
@@ -248,9 +257,9 @@ def tabulate_example_predictions(dataset, FLAGS, num_examples=100):
                 pred_tree = cmd_parser(pred_cmd)
                 pred_temp = data_tools.ast2template(pred_tree, loose_constraints=True)
                 temp_match = tree_dist.one_match(
-                    command_gt_asts, pred_tree, ignore_arg_value=True)
+                    command_gt_temps, pred_tree, ignore_arg_value=True)
                 str_match = tree_dist.one_match(
-                    command_gt_asts, pred_tree, ignore_arg_value=False)
+                    command_gt_strs, pred_tree, ignore_arg_value=False)
                 
                 output_str = '& \\<{}> & {}'.format(pred_cmd.replace('__SP__', '')
                                                            .replace('_', '\\_')
@@ -333,6 +342,8 @@ def print_error_analysis_csv(grouped_dataset, prediction_list, FLAGS,
         sc_temp = get_example_nl_key(sc_txt)
         tg_strs = [dp.tg_txt for dp in data_group]
         gt_trees = [cmd_parser(cm_str) for cm_str in tg_strs]
+        gt_temps = tree_dist.TemplateSet(gt_trees, ignore_arg_value=True)
+        gt_strs = tree_dist.TemplateSet(gt_trees)
         if group_by_utility:
             gt_utilities = functools.reduce(lambda x,y:x|y,
                 [data_tools.get_utilities(gt) for gt in gt_trees])
@@ -355,9 +366,9 @@ def print_error_analysis_csv(grouped_dataset, prediction_list, FLAGS,
 
             # evaluation ignoring flag orders
             temp_match = tree_dist.one_match(
-                gt_trees, tree, ignore_arg_value=True)
+                gt_temps, tree, ignore_arg_value=True)
             str_match = tree_dist.one_match(
-                gt_trees, tree, ignore_arg_value=False)
+                gt_strs, tree, ignore_arg_value=False)
             if i < len(tg_strs):
                 output_str += '"{}",'.format(
                     tg_strs[i].strip().replace('"', '""'))
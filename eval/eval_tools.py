@@ -7,7 +7,11 @@ from __future__ import division
 from __future__ import print_function
 
 import collections
+import contextlib
 import csv
+import functools
+import io
+import multiprocessing
 import nltk
 import numpy as np
 import os, sys
@@ -116,6 +120,9 @@ def get_manual_evaluation_metrics(grouped_dataset, prediction_list, FLAGS, num_e
         sc_key = get_example_nl_key(sc_txt)
         command_gts = [dp.tg_txt for dp in data_group]
         command_gt_asts = [data_tools.bash_parser(gt) for gt in command_gts]
+        command_gt_temps = tree_dist.TemplateSet(
+            command_gt_asts, ignore_arg_value=True)
+        command_gt_strs = tree_dist.TemplateSet(command_gt_asts)
         predictions = prediction_list[example_id]
         top_3_s_correct_marked = False
         top_3_f_correct_marked = False
@@ -124,9 +131,9 @@ def get_manual_evaluation_metrics(grouped_dataset, prediction_list, FLAGS, num_e
             pred_ast = cmd_parser(pred_cmd)
             pred_temp = data_tools.ast2template(pred_ast, loose_constraints=True)
             temp_match = tree_dist.one_match(
-                command_gt_asts, pred_ast, ignore_arg_value=True)
+                command_gt_temps, pred_ast, ignore_arg_value=True)
             str_match = tree_dist.one_match(
-                command_gt_asts, pred_ast, ignore_arg_value=False)
+                command_gt_strs, pred_ast, ignore_arg_value=False)
             # Match ground truths & exisitng judgements
             command_example_key = '{}<NL_PREDICTION>{}'.format(sc_key, pred_cmd)
             structure_example_key = '{}<NL_PREDICTION>{}'.format(sc_key, pred_temp)
@@ -270,8 +277,12 @@ def gen_automatic_evaluation_table(dataset, FLAGS):
 
 
 def get_automatic_evaluation_metrics(grouped_dataset, prediction_list, vocabs, FLAGS, top_k,
-                                     num_samples=-1, verbose=False):
-    cmd_parser = data_tools.bash_parser
+                                     num_samples=-1, verbose=False, num_workers=None):
+    """
+    :param num_workers: Number of worker processes the examples are
+        evaluated in (defaults to FLAGS.num_eval_workers). If set to 1, the
+        examples are evaluated in the calling process.
+    """
     rev_sc_vocab = vocabs.rev_sc_vocab if vocabs is not None else None
 
 
@@ -290,18 +301,11 @@ def get_automatic_evaluation_metrics(grouped_dataset, prediction_list, vocabs, F
         grouped_dataset = [grouped_dataset[i] for i in sample_ids]
         prediction_list = [prediction_list[i] for i in sample_ids]
 
-    num_eval = 0
-    top_k_temp_correct = np.zeros([len(grouped_dataset), top_k])
-    top_k_str_correct = np.zeros([len(grouped_dataset), top_k])
-    top_k_cms = np.zeros([len(grouped_dataset), top_k])
-    top_k_bleu = np.zeros([len(grouped_dataset), top_k])
-
-    command_gt_asts_list, pred_ast_list = [], []
-    
+    examples = []
     for data_id in xrange(len(grouped_dataset)):
         _, data_group = grouped_dataset[data_id]
         sc_str = data_group[0].sc_txt.strip()
-        sc_key = get_example_nl_key(sc_str)
+        sc_features = None
         if vocabs is not None:
             sc_tokens = [rev_sc_vocab[i] for i in data_group[0].sc_ids]
             if FLAGS.channel == 'char':
@@ -310,55 +314,44 @@ def get_automatic_evaluation_metrics(grouped_dataset, prediction_list, vocabs, F
             else:
                 sc_features = ' '.join(sc_tokens)
         command_gts = [dp.tg_txt.strip() for dp in data_group]
-        command_gt_asts = [cmd_parser(cmd) for cmd in command_gts]
-        command_gt_asts_list.append(command_gt_asts)
-        template_gts = [data_tools.cmd2template(cmd, loose_constraints=True) for cmd in command_gts]
-        template_gt_asts = [cmd_parser(temp) for temp in template_gts]
-        if verbose:
-            print("Example {}".format(data_id))
-            print("Original Source: {}".format(sc_str.encode('utf-8')))
-            if vocabs is not None:
-                print("Source: {}".format([x.encode('utf-8') for x in sc_features]))
-            for j, command_gt in enumerate(command_gts):
-                print("GT Target {}: {}".format(j + 1, command_gt.strip().encode('utf-8')))
+        examples.append((data_id, sc_str, sc_features, command_gts,
+                         prediction_list[data_id]))
+
+    if num_workers is None:
+        num_workers = FLAGS.num_eval_workers
+    if num_workers <= 1:
+        example_evals = (evaluate_example(
+            example, top_k, structure_eval_cache, command_eval_cache,
+            verbose) for example in examples)
+    else:
+        example_evals = evaluate_examples_in_parallel(
+            examples, top_k, structure_eval_cache, command_eval_cache,
+            verbose, num_workers)
+
+    num_eval = 0
+    top_k_temp_correct = np.zeros([len(grouped_dataset), top_k])
+    top_k_str_correct = np.zeros([len(grouped_dataset), top_k])
+    top_k_cms = np.zeros([len(grouped_dataset), top_k])
+    top_k_bleu = np.zeros([len(grouped_dataset), top_k])
+
+    gt_tokens_list, pred_tokens_list = [], []
+    for data_id, example_eval in enumerate(example_evals):
+        temp_correct, str_correct, cms, bleu, gt_tokens, pred_tokens = \
+            example_eval
+        top_k_temp_correct[data_id] = temp_correct
+        top_k_str_correct[data_id] = str_correct
+        top_k_cms[data_id] = cms
+        top_k_bleu[data_id] = bleu
+        gt_tokens_list.append(gt_tokens)
+        if pred_tokens is not None:
+            pred_tokens_list.append(pred_tokens)
         num_eval += 1
-        predictions = prediction_list[data_id]
-        for i in xrange(len(predictions)):
-            pred_cmd = predictions[i]
-            pred_ast = cmd_parser(pred_cmd)
-            if i == 0:
-                pred_ast_list.append(pred_ast)
-            pred_temp = data_tools.cmd2template(pred_cmd, loose_constraints=True)
-            # A) Exact match with ground truths & exisitng judgements
-            command_example_key = '{}<NL_PREDICTION>{}'.format(sc_key, pred_cmd)
-            structure_example_key = '{}<NL_PREDICTION>{}'.format(sc_key, pred_temp)
-            # B) Match ignoring flag orders
-            temp_match = tree_dist.one_match(
-                template_gt_asts, pred_ast, ignore_arg_value=True)
-            str_match = tree_dist.one_match(
-                command_gt_asts, pred_ast, ignore_arg_value=False)
-            if command_eval_cache and command_example_key in command_eval_cache:
-                str_match = normalize_judgement(command_eval_cache[command_example_key]) == 'y'
-            if structure_eval_cache and structure_example_key in structure_eval_cache:
-                temp_match = normalize_judgement(structure_eval_cache[structure_example_key]) == 'y'
-            if temp_match:
-                top_k_temp_correct[data_id, i] = 1
-            if str_match:
-                top_k_str_correct[data_id, i] = 1
-            cms = token_based.command_match_score(command_gt_asts, pred_ast)
-            # if pred_cmd.strip():
-            #     bleu = token_based.sentence_bleu_score(command_gt_asts, pred_ast)   
-            # else:
-            #     bleu = 0
-            bleu = nltk.translate.bleu_score.sentence_bleu(command_gts, pred_cmd)
-            top_k_cms[data_id, i] = cms
-            top_k_bleu[data_id, i] = bleu
-            if verbose:
-                print("Prediction {}: {} ({}, {})".format(i + 1, pred_cmd, cms, bleu))
-        if verbose:
-            print()
-    
-    bleu = token_based.corpus_bleu_score(command_gt_asts_list, pred_ast_list)
+    # the top-k metrics are reported if the last example has more than 1, 3
+    # or 5 predictions
+    num_predictions = len(prediction_list[-1]) if prediction_list else 0
+
+    bleu = token_based.corpus_bleu_score_from_tokens(
+        gt_tokens_list, pred_tokens_list)
 
     top_temp_acc = [-1 for _ in [1, 3, 5, 10]]
     top_cmd_acc = [-1 for _ in [1, 3, 5, 10]]
@@ -373,7 +366,7 @@ def get_automatic_evaluation_metrics(grouped_dataset, prediction_list, vocabs, F
     print("Top 1 Command Acc = %.3f" % top_cmd_acc[0])
     print("Average top 1 Template Match Score = %.3f" % top_cms[0])
     print("Average top 1 BLEU Score = %.3f" % top_bleu[0])
-    if len(predictions) > 1:
+    if num_predictions > 1:
         top_temp_acc[1] = np.max(top_k_temp_correct[:, :3], 1).mean()
         top_cmd_acc[1] = np.max(top_k_str_correct[:, :3], 1).mean()
         top_cms[1] = np.max(top_k_cms[:, :3], 1).mean()
@@ -382,7 +375,7 @@ def get_automatic_evaluation_metrics(grouped_dataset, prediction_list, vocabs, F
         print("Top 3 Command Acc = %.3f" % top_cmd_acc[1])
         print("Average top 3 Template Match Score = %.3f" % top_cms[1])
         print("Average top 3 BLEU Score = %.3f" % top_bleu[1])
-    if len(predictions) > 3:
+    if num_predictions > 3:
         top_temp_acc[2] = np.max(top_k_temp_correct[:, :5], 1).mean()
         top_cmd_acc[2] = np.max(top_k_str_correct[:, :5], 1).mean()
         top_cms[2] = np.max(top_k_cms[:, :5], 1).mean()
@@ -391,7 +384,7 @@ def get_automatic_evaluation_metrics(grouped_dataset, prediction_list, vocabs, F
         print("Top 5 Command Acc = %.3f" % top_cmd_acc[2])
         print("Average top 5 Template Match Score = %.3f" % top_cms[2])
         print("Average top 5 BLEU Score = %.3f" % top_bleu[2])
-    if len(predictions) > 5:
+    if num_predictions > 5:
         top_temp_acc[3] = np.max(top_k_temp_correct[:, :10], 1).mean()
         top_cmd_acc[3] = np.max(top_k_str_correct[:, :10], 1).mean()
         top_cms[3] = np.max(top_k_cms[:, :10], 1).mean()
@@ -412,6 +405,129 @@ def get_automatic_evaluation_metrics(grouped_dataset, prediction_list, vocabs, F
     return metrics
 
 
+def evaluate_example(example, top_k, structure_eval_cache, command_eval_cache,
+                     verbose=False):
+    """
+    Compute the automatic evaluation scores of the top-k predictions of an
+    example.
+
+    :param example: (data_id, sc_str, sc_features, command_gts, predictions),
+        where sc_features is None if no vocabulary is loaded.
+    :return: (temp_correct, str_correct, cms, bleu, gt_tokens, pred_tokens),
+        where the first four are the arrays of length top_k of the scores of
+        the predictions, and gt_tokens and pred_tokens are the tokens of the
+        ground truths and the top 1 prediction (None if there is no
+        prediction) used in the corpus BLEU.
+    """
+    cmd_parser = data_tools.bash_parser
+    data_id, sc_str, sc_features, command_gts, predictions = example
+    sc_key = get_example_nl_key(sc_str)
+
+    temp_correct = np.zeros(top_k)
+    str_correct = np.zeros(top_k)
+    top_k_cms = np.zeros(top_k)
+    top_k_bleu = np.zeros(top_k)
+
+    command_gt_asts = [cmd_parser(cmd) for cmd in command_gts]
+    command_gt_strs = tree_dist.TemplateSet(command_gt_asts)
+    template_gts = [data_tools.cmd2template(cmd, loose_constraints=True) for cmd in command_gts]
+    template_gt_asts = [cmd_parser(temp) for temp in template_gts]
+    template_gt_temps = tree_dist.TemplateSet(
+        template_gt_asts, ignore_arg_value=True)
+    if verbose:
+        print("Example {}".format(data_id))
+        print("Original Source: {}".format(sc_str.encode('utf-8')))
+        if sc_features is not None:
+            print("Source: {}".format([x.encode('utf-8') for x in sc_features]))
+        for j, command_gt in enumerate(command_gts):
+            print("GT Target {}: {}".format(j + 1, command_gt.strip().encode('utf-8')))
+    pred_tokens = None
+    for i in xrange(len(predictions)):
+        pred_cmd = predictions[i]
+        pred_ast = cmd_parser(pred_cmd)
+        if i == 0:
+            pred_tokens = token_based.pred_bleu_tokens(pred_ast)
+        pred_temp = data_tools.cmd2template(pred_cmd, loose_constraints=True)
+        # A) Exact match with ground truths & exisitng judgements
+        command_example_key = '{}<NL_PREDICTION>{}'.format(sc_key, pred_cmd)
+        structure_example_key = '{}<NL_PREDICTION>{}'.format(sc_key, pred_temp)
+        # B) Match ignoring flag orders
+        temp_match = tree_dist.one_match(
+            template_gt_temps, pred_ast, ignore_arg_value=True)
+        str_match = tree_dist.one_match(
+            command_gt_strs, pred_ast, ignore_arg_value=False)
+        if command_eval_cache and command_example_key in command_eval_cache:
+            str_match = normalize_judgement(command_eval_cache[command_example_key]) == 'y'
+        if structure_eval_cache and structure_example_key in structure_eval_cache:
+            temp_match = normalize_judgement(structure_eval_cache[structure_example_key]) == 'y'
+        if temp_match:
+            temp_correct[i] = 1
+        if str_match:
+            str_correct[i] = 1
+        cms = token_based.command_match_score(command_gt_asts, pred_ast)
+        # if pred_cmd.strip():
+        #     bleu = token_based.sentence_bleu_score(command_gt_asts, pred_ast)
+        # else:
+        #     bleu = 0
+        bleu = nltk.translate.bleu_score.sentence_bleu(command_gts, pred_cmd)
+        top_k_cms[i] = cms
+        top_k_bleu[i] = bleu
+        if verbose:
+            print("Prediction {}: {} ({}, {})".format(i + 1, pred_cmd, cms, bleu))
+    if verbose:
+        print()
+    return temp_correct, str_correct, top_k_cms, top_k_bleu, \
+        token_based.gt_bleu_tokens(command_gt_asts), pred_tokens
+
+
+# manual judgements of the worker processes of evaluate_examples_in_parallel
+_worker_eval_caches = None
+
+
+def _init_eval_worker(structure_eval_cache, command_eval_cache):
+    global _worker_eval_caches
+    _worker_eval_caches = (structure_eval_cache, command_eval_cache)
+
+
+def _evaluate_example_in_worker(example, top_k, verbose):
+    # the verbose output is printed by the calling process in example order
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        example_eval = evaluate_example(
+            example, top_k, _worker_eval_caches[0], _worker_eval_caches[1],
+            verbose)
+    return example_eval, log.getvalue()
+
+
+def evaluate_examples_in_parallel(examples, top_k, structure_eval_cache,
+                                  command_eval_cache, verbose=False,
+                                  num_workers=None, chunk_size=16):
+    """
+    Evaluate examples with evaluate_example across a pool of worker processes.
+    Each worker parses the commands with its own parse cache.
+
+    :param num_workers: Number of worker processes (defaults to the number of
+        CPUs).
+    :param chunk_size: Number of examples sent to a worker at a time.
+    :return: Iterator of the results of evaluate_example in example order.
+    """
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    eval_fun = functools.partial(
+        _evaluate_example_in_worker, top_k=top_k, verbose=verbose)
+    pool = multiprocessing.Pool(
+        num_workers, initializer=_init_eval_worker,
+        initargs=(structure_eval_cache, command_eval_cache))
+    try:
+        for example_eval, log in pool.imap(eval_fun, examples,
+                                           chunksize=chunk_size):
+            sys.stdout.write(log)
+            yield example_eval
+    finally:
+        pool.close()
+        pool.join()
+
+
 def print_eval_table(model_names, metrics_names, model_metrics):
 
     def pad_spaces(s, max_len):
@@ -10,30 +10,20 @@ import collections
 import nltk
 import numpy as np
 
-from bashlint import data_tools, nast
+from bashlint import data_tools
 
 
 smoothing = nltk.translate.bleu_score.SmoothingFunction()
 
 
 def get_content_tokens(ast):
-    content_tokens = collections.defaultdict(int)
-    for compound_token in data_tools.ast2tokens(ast, loose_constraints=True,
-            arg_type_only=True, with_prefix=True, with_flag_argtype=True):
-        kind_token = compound_token.split(nast.KIND_PREFIX)
-        if len(kind_token) == 2:
-            kind, token = kind_token
-        else:
-            kind = ''
-            token = kind_token[0]
-        if kind.lower() != 'argument':
-            content_tokens[token] += 1
-    return content_tokens
+    return collections.defaultdict(
+        int, data_tools.linearize(ast).content_tokens)
 
 
 def CMS(ast1, ast2):
-    token_dict1 = get_content_tokens(ast1)
-    token_dict2 = get_content_tokens(ast2)
+    token_dict1 = data_tools.linearize(ast1).content_tokens
+    token_dict2 = data_tools.linearize(ast2).content_tokens
     num_overlap = 0.0
     for t in token_dict2:
         if t in token_dict1:
@@ -53,8 +43,9 @@ def CMS(ast1, ast2):
 def command_match_score(gts, ast):
     max_cms = 0.0
     for gt in gts:
-        if CMS(ast, gt) > max_cms:
-            max_cms = CMS(ast, gt)
+        cms = CMS(ast, gt)
+        if cms > max_cms:
+            max_cms = cms
     return max_cms
 
 
@@ -66,9 +57,21 @@ def sentence_bleu_score(gt_asts, pred_ast):
     return bleu 
 
 
+def gt_bleu_tokens(gt_asts):
+    return [data_tools.bash_tokenizer(ast, ignore_flag_order=True) for ast in gt_asts]
+
+
+def pred_bleu_tokens(pred_ast):
+    return data_tools.bash_tokenizer(pred_ast, loose_constraints=True, ignore_flag_order=True)
+
+
 def corpus_bleu_score(gt_asts_list, pred_ast_list):
-    gt_tokens_list = [[data_tools.bash_tokenizer(ast, ignore_flag_order=True) for ast in gt_asts] for gt_asts in gt_asts_list]
-    pred_tokens_list = [data_tools.bash_tokenizer(pred_ast, loose_constraints=True, ignore_flag_order=True) for pred_ast in pred_ast_list]
+    gt_tokens_list = [gt_bleu_tokens(gt_asts) for gt_asts in gt_asts_list]
+    pred_tokens_list = [pred_bleu_tokens(pred_ast) for pred_ast in pred_ast_list]
+    return corpus_bleu_score_from_tokens(gt_tokens_list, pred_tokens_list)
+
+
+def corpus_bleu_score_from_tokens(gt_tokens_list, pred_tokens_list):
     # print(gt_tokens, pred_tokens)
     bleu = nltk.translate.bleu_score.corpus_bleu(gt_tokens_list, pred_tokens_list, 
                                                  smoothing_function=smoothing.method1, auto_reweigh=True)
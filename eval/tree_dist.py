@@ -2,34 +2,41 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import collections
+
 from bashlint import data_tools, nast
 from eval import zss
 
 
-def local_dist(s1, s2, skip_argument=False):
-    score_list = {
-        "FLAG_-ls:::":0,
-        ":::FLAG_-ls":0,
-        "FLAG_-print:::":0,
-        ":::FLAG_-print":0,
-        "FLAG_-print0:::":0,
-        ":::FLAG_-print0":0,
-        "FLAG_-name:::FLAG_-regex":0,
-        "FLAG_-regex:::FLAG_-name":0
-    }
+# label pairs which are not counted as edits; an empty label stands for the
+# insertion or removal of a node
+zero_cost_label_pairs = {
+    ("FLAG_-ls", ""),
+    ("", "FLAG_-ls"),
+    ("FLAG_-print", ""),
+    ("", "FLAG_-print"),
+    ("FLAG_-print0", ""),
+    ("", "FLAG_-print0"),
+    ("FLAG_-name", "FLAG_-regex"),
+    ("FLAG_-regex", "FLAG_-name")
+}
+
+# labels which are changed into each other at no cost share a class (which
+# requires the zero cost relation between non-empty labels to be transitive)
+label_classes = {}
+for label1, label2 in zero_cost_label_pairs:
+    if label1 and label2:
+        label_classes[label1] = label_classes[label2] = min(label1, label2)
+
 
+def local_dist(s1, s2, skip_argument=False):
     if s1 == s2:
         return 0
     if s1.startswith("ARGUMENT_") and s2.startswith("ARGUMENT_") \
             and skip_argument:
         return 0
-    try:
-        pair_key = ":::".join((s1, s2))
-    except UnicodeDecodeError:
-        pair_key = ":::".join((s1.decode('utf-8'), s2.decode('utf-8')))
-
-    if pair_key in score_list:
-        return score_list[pair_key]
+    if (s1, s2) in zero_cost_label_pairs:
+        return 0
     else:
         return 1
 
@@ -39,13 +46,117 @@ def str_local_dist(s1, s2):
 def temp_local_dist(s1, s2):
     return local_dist(s1, s2, skip_argument=True)
 
-def str_dist(ast1, ast2):
-    return zss.simple_distance(ast1, ast2, nast.Node.get_children,
-                               nast.Node.get_label, str_local_dist)
 
-def temp_dist(ast1, ast2):
-    return zss.simple_distance(ast1, ast2, nast.Node.get_children,
-                               nast.Node.get_label, temp_local_dist)
+class AnnotatedAST(zss.AnnotatedTree):
+    """
+    Post-order enumeration, leftmost descendants and keyroots of an AST
+    together with the node labels, their insertion and removal costs and the
+    label class counts of the nodes which cannot be inserted or removed for
+    free.
+    """
+    def __init__(self, ast):
+        super(AnnotatedAST, self).__init__(ast, nast.Node.get_children)
+        self.labels = [node.get_label() for node in self.nodes]
+        self.remove_costs = [local_dist(label, '') for label in self.labels]
+        self.insert_costs = [local_dist('', label) for label in self.labels]
+        self.is_argument = [label.startswith("ARGUMENT_")
+                            for label in self.labels]
+        self.num_costly_nodes = 0
+        self.label_class_counts = {
+            False: collections.defaultdict(int),
+            True: collections.defaultdict(int)
+        }
+        for label, cost, is_argument in zip(
+                self.labels, self.remove_costs, self.is_argument):
+            if cost > 0:
+                self.num_costly_nodes += 1
+                label_class = label_classes.get(label, label)
+                self.label_class_counts[False][label_class] += 1
+                self.label_class_counts[True][
+                    "ARGUMENT_" if is_argument else label_class] += 1
+
+
+def annotate(ast):
+    """
+    Annotate an AST for tree edit distance computation.
+
+    The result is memoized on the AST node, hence the AST must not be modified
+    after it is annotated.
+    """
+    try:
+        return ast.annotation
+    except AttributeError:
+        ast.annotation = AnnotatedAST(ast)
+        return ast.annotation
+
+
+def update_costs(tree1, tree2, skip_argument=False):
+    """
+    Matrix of the costs of changing the nodes of tree1 into the nodes of
+    tree2, computed with local_dist.
+    """
+    costs = []
+    for label1, is_argument1 in zip(tree1.labels, tree1.is_argument):
+        if skip_argument and is_argument1:
+            costs.append([
+                0 if (label1 == label2 or is_argument2 or
+                      (label1, label2) in zero_cost_label_pairs) else 1
+                for label2, is_argument2 in zip(tree2.labels,
+                                                tree2.is_argument)])
+        else:
+            costs.append([
+                0 if (label1 == label2 or
+                      (label1, label2) in zero_cost_label_pairs) else 1
+                for label2 in tree2.labels])
+    return costs
+
+def size_lower_bound(tree1, tree2):
+    """
+    Lower bound of the distance between two annotated ASTs: a node which
+    cannot be inserted or removed for free costs at least 1 unless it is
+    matched to such a node of the other tree.
+    """
+    return abs(tree1.num_costly_nodes - tree2.num_costly_nodes)
+
+def label_lower_bound(tree1, tree2, skip_argument=False):
+    """
+    Lower bound of the distance between two annotated ASTs, which is at least
+    size_lower_bound: a node which cannot be inserted or removed for free
+    costs at least 1 unless it is matched to a node of the same label class.
+    """
+    counts1 = tree1.label_class_counts[skip_argument]
+    counts2 = tree2.label_class_counts[skip_argument]
+    if len(counts1) > len(counts2):
+        counts1, counts2 = counts2, counts1
+    num_common = 0
+    for label_class, count in counts1.items():
+        if label_class in counts2:
+            num_common += min(count, counts2[label_class])
+    return max(tree1.num_costly_nodes, tree2.num_costly_nodes) - num_common
+
+def annotated_dist(tree1, tree2, skip_argument=False, upper_bound=None):
+    """
+    Tree edit distance between two annotated ASTs.
+
+    If upper_bound is set, the computation stops as soon as the distance is
+    known to be at least upper_bound, in which case a lower bound of the
+    distance which is at least upper_bound may be returned.
+    """
+    if upper_bound is not None:
+        bound = label_lower_bound(tree1, tree2, skip_argument)
+        if bound >= upper_bound:
+            return bound
+    return zss.annotated_distance(
+        tree1, tree2, tree1.remove_costs, tree2.insert_costs,
+        update_costs(tree1, tree2, skip_argument), upper_bound=upper_bound)
+
+def str_dist(ast1, ast2, upper_bound=None):
+    return annotated_dist(annotate(ast1), annotate(ast2),
+                          upper_bound=upper_bound)
+
+def temp_dist(ast1, ast2, upper_bound=None):
+    return annotated_dist(annotate(ast1), annotate(ast2), skip_argument=True,
+                          upper_bound=upper_bound)
 
 
 def min_dist(asts, ast2, rewrite=False, ignore_arg_value=False):
@@ -66,44 +177,134 @@ def min_dist(asts, ast2, rewrite=False, ignore_arg_value=False):
     else:
         ast_rewrites = asts
 
+    tree2 = annotate(ast2)
+    # visit the ground truths of the closest sizes first, so that the others
+    # can be skipped by their lower bounds
+    trees = sorted((annotate(ast1) for ast1 in ast_rewrites),
+                   key=lambda tree1: size_lower_bound(tree1, tree2))
     min_dist = 1e8
-    for ast1 in ast_rewrites:
-        if ignore_arg_value:
-            dist = temp_dist(ast1, ast2)
-        else:
-            dist = str_dist(ast1, ast2)
+    for tree1 in trees:
+        if size_lower_bound(tree1, tree2) >= min_dist:
+            break
+        dist = annotated_dist(tree1, tree2, skip_argument=ignore_arg_value,
+                              upper_bound=min_dist)
         if dist < min_dist:
             min_dist = dist
 
     return min_dist
 
+class TemplateSet(object):
+    """
+    Canonical templates of a set of ground truth ASTs, so that matching a
+    prediction is a set lookup.
+    """
+    def __init__(self, asts, ignore_arg_value=False, ignore_flag_order=False):
+        """
+        :param asts: set of gold ASTs.
+        :param ignore_arg_value: set to true if ignore literal values in the
+            ASTs.
+        :param ignore_flag_order: set to true if ignore the order of flags.
+        """
+        self.ignore_arg_value = ignore_arg_value
+        self.ignore_flag_order = ignore_flag_order
+        self.templates = set(
+            data_tools.canonical_template(
+                ast, ignore_arg_value, ignore_flag_order) for ast in asts)
+
+    def __contains__(self, ast):
+        return data_tools.canonical_template(
+            ast, self.ignore_arg_value, self.ignore_flag_order) \
+            in self.templates
+
+
 def one_match(asts, ast2, rewrite=False, ignore_arg_value=False):
+    """
+    Check if the prediction matches any of the ground truth ASTs.
+    :param asts: set of gold ASTs, or a TemplateSet of the gold ASTs built
+        with the same ignore_arg_value.
+    :param ast2: predicted AST.
+    :param rewrite: set to true if rewrite ground truths with templates.
+    :param ignore_arg_value: set to true if ignore literal values in the ASTs.
+    """
     if rewrite:
         raise NotImplementedError
-    else:
-        ast_rewrites = asts
-    cmd2 = data_tools.ast2template(ast2, loose_constraints=True,
-                                   arg_type_only=ignore_arg_value)
-    for ast1 in ast_rewrites:
-        cmd1 = data_tools.ast2template(ast1, loose_constraints=True,
-                                       arg_type_only=ignore_arg_value)
-        if cmd1 == cmd2:
-            return True
-    return False
+    if isinstance(asts, TemplateSet):
+        assert(asts.ignore_arg_value == ignore_arg_value)
+        return ast2 in asts
+    return ast2 in TemplateSet(asts, ignore_arg_value=ignore_arg_value)
 
 def template_match(ast1, ast2):
-    temp1 = data_tools.ast2template(ast1, loose_constraints=True)
-    temp2 = data_tools.ast2template(ast2, loose_constraints=True)
+    temp1 = data_tools.canonical_template(ast1, ignore_arg_value=True)
+    temp2 = data_tools.canonical_template(ast2, ignore_arg_value=True)
     return temp1 == temp2
 
 def string_match(ast1, ast2):
-    str1 = data_tools.ast2template(ast1, loose_constraints=True, arg_type_only=False)
-    str2 = data_tools.ast2template(ast2, loose_constraints=True, arg_type_only=False)
+    str1 = data_tools.canonical_template(ast1, ignore_arg_value=False)
+    str2 = data_tools.canonical_template(ast2, ignore_arg_value=False)
     return str1 == str2
 
 
+def test_min_dist(judgement_file, num_repeats=3):
+    """
+    Check that the tree edit distances of the predictions of a manual
+    judgement file to the predictions judged correct for the same description
+    are identical to those computed from scratch by zss.simple_distance, and
+    measure the time of both.
+    """
+    import csv
+    import time
+
+    groups = collections.defaultdict(list)
+    with open(judgement_file, encoding='utf-8') as f:
+        description = ''
+        for row in csv.DictReader(f):
+            if row['description']:
+                description = row['description']
+            ast = data_tools.bash_parser(row['prediction'])
+            if ast:
+                groups[description].append((ast, row['correct command'] == 'y'))
+    examples = [([ast for ast, correct in group if correct],
+                 [ast for ast, _ in group]) for group in groups.values()]
+    examples = [(gt_asts, pred_asts) for gt_asts, pred_asts in examples
+                if gt_asts]
+
+    def reference_min_dist(gt_asts, pred_ast, ignore_arg_value=False):
+        label_dist = temp_local_dist if ignore_arg_value else str_local_dist
+        return min(zss.simple_distance(gt_ast, pred_ast,
+                                       nast.Node.get_children,
+                                       nast.Node.get_label, label_dist)
+                   for gt_ast in gt_asts)
+
+    num_pairs = sum(len(gt_asts) * len(pred_asts)
+                    for gt_asts, pred_asts in examples)
+    for ignore_arg_value in [False, True]:
+        num_mismatches = 0
+        for gt_asts, pred_asts in examples:
+            for pred_ast in pred_asts:
+                if min_dist(gt_asts, pred_ast,
+                            ignore_arg_value=ignore_arg_value) != \
+                        reference_min_dist(gt_asts, pred_ast,
+                                           ignore_arg_value=ignore_arg_value):
+                    num_mismatches += 1
+        print('ignore_arg_value={}: {} tree pairs, {} mismatches'.format(
+            ignore_arg_value, num_pairs, num_mismatches))
+        assert(num_mismatches == 0)
+
+        for dist_fun in [reference_min_dist, min_dist]:
+            start_time = time.time()
+            for _ in range(num_repeats):
+                for gt_asts, pred_asts in examples:
+                    for pred_ast in pred_asts:
+                        dist_fun(gt_asts, pred_ast,
+                                 ignore_arg_value=ignore_arg_value)
+            dist_time = (time.time() - start_time) / num_repeats
+            print('{}: {:.0f} tree pairs/s'.format(
+                dist_fun.__name__, num_pairs / dist_time))
+
+
 if __name__ == '__main__':
     asts = [data_tools.bash_parser('find . -type f -print0 | xargs -0 -I {} grep -i -l __SP__UNK {}')]
     ast = data_tools.bash_parser('find . -type f -print0 | xargs -0 -I {} grep -i -l \'.*\' {}')
     print(one_match(asts, ast, ignore_arg_value=True))
     print(one_match(asts, ast, ignore_arg_value=False))
+    # test_min_dist('data/bash/manual_judgements/manual.evaluations.dev.samples.csv')
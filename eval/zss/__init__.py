@@ -1,11 +1,14 @@
 from __future__ import absolute_import
 
 from .compare import (
+    AnnotatedTree,
+    annotated_distance,
     distance,
     simple_distance,
 )
 from .simple_tree import Node
 
-__all__ = ['distance', 'simple_distance', 'Node']
+__all__ = ['AnnotatedTree', 'annotated_distance', 'distance',
+           'simple_distance', 'Node']
 __version__ = '1.1.4'
 
@@ -9,16 +9,6 @@ from six.moves import range
 
 import collections
 
-try:
-    import numpy as np
-    zeros = np.zeros
-except ImportError:
-    def py_zeros(dim, pytype):
-        assert len(dim) == 2
-        return [[pytype() for y in range(dim[1])]
-                for x in range(dim[0])]
-    zeros = py_zeros
-
 try:
     from editdist import distance as strdist
 except ImportError:
@@ -138,8 +128,8 @@ def distance(A, B, get_children, insert_cost, remove_cost, update_cost):
 
     Otherwise, use :py:func:`zss.simple_distance`.
 
-    :param A: The root of a tree.
-    :param B: The root of a tree.
+    :param A: The root of a tree, or its :py:class:`AnnotatedTree`.
+    :param B: The root of a tree, or its :py:class:`AnnotatedTree`.
 
     :param get_children:
         A function ``get_children(node) == [node children]``.  Defaults to
@@ -156,61 +146,152 @@ def distance(A, B, get_children, insert_cost, remove_cost, update_cost):
 
     :return: An integer distance [0, inf+)
     '''
-    A, B = AnnotatedTree(A, get_children), AnnotatedTree(B, get_children)
-    treedists = zeros((len(A.nodes), len(B.nodes)), int)
+    if not isinstance(A, AnnotatedTree):
+        A = AnnotatedTree(A, get_children)
+    if not isinstance(B, AnnotatedTree):
+        B = AnnotatedTree(B, get_children)
+    remove_costs = [remove_cost(a) for a in A.nodes]
+    insert_costs = [insert_cost(b) for b in B.nodes]
+    update_costs = [[update_cost(a, b) for b in B.nodes] for a in A.nodes]
+    return annotated_distance(A, B, remove_costs, insert_costs, update_costs)
 
-    def treedist(i, j):
-        Al = A.lmds
-        Bl = B.lmds
-        An = A.nodes
-        Bn = B.nodes
 
-        m = i - Al[i] + 2
-        n = j - Bl[j] + 2
-        fd = zeros((m,n), int)
+def annotated_distance(A, B, remove_costs, insert_costs, update_costs,
+                       upper_bound=None):
+    '''Computes the exact tree edit distance between two annotated trees
+    with precomputed edit costs.
 
-        ioff = Al[i] - 1
-        joff = Bl[j] - 1
-
-        for x in range(1, m): # δ(l(i1)..i, θ) = δ(l(1i)..1-1, θ) + γ(v → λ)
-            fd[x][0] = fd[x-1][0] + remove_cost(An[x+ioff])
-        for y in range(1, n): # δ(θ, l(j1)..j) = δ(θ, l(j1)..j-1) + γ(λ → w)
-            fd[0][y] = fd[0][y-1] + insert_cost(Bn[y+joff])
-
-        for x in range(1, m): ## the plus one is for the xrange impl
-            for y in range(1, n):
-                # only need to check if x is an ancestor of i
-                # and y is an ancestor of j
-                if Al[i] == Al[x+ioff] and Bl[j] == Bl[y+joff]:
-                    #                   +-
-                    #                   | δ(l(i1)..i-1, l(j1)..j) + γ(v → λ)
-                    # δ(F1 , F2 ) = min-+ δ(l(i1)..i , l(j1)..j-1) + γ(λ → w)
-                    #                   | δ(l(i1)..i-1, l(j1)..j-1) + γ(v → w)
-                    #                   +-
-                    fd[x][y] = min(
-                        fd[x-1][y] + remove_cost(An[x+ioff]),
-                        fd[x][y-1] + insert_cost(Bn[y+joff]),
-                        fd[x-1][y-1] + update_cost(An[x+ioff], Bn[y+joff]),
-                    )
-                    treedists[x+ioff][y+joff] = fd[x][y]
-                else:
-                    #                   +-
-                    #                   | δ(l(i1)..i-1, l(j1)..j) + γ(v → λ)
-                    # δ(F1 , F2 ) = min-+ δ(l(i1)..i , l(j1)..j-1) + γ(λ → w)
-                    #                   | δ(l(i1)..l(i)-1, l(j1)..l(j)-1)
-                    #                   |                     + treedist(i1,j1)
-                    #                   +-
-                    p = Al[x+ioff]-1-ioff
-                    q = Bl[y+joff]-1-joff
-                    #print (p, q), (len(fd), len(fd[0]))
-                    fd[x][y] = min(
-                        fd[x-1][y] + remove_cost(An[x+ioff]),
-                        fd[x][y-1] + insert_cost(Bn[y+joff]),
-                        fd[p][q] + treedists[x+ioff][y+joff]
-                    )
+    Use this function to reuse the annotations of trees compared many times.
+
+    :param A: An :py:class:`AnnotatedTree`.
+    :param B: An :py:class:`AnnotatedTree`.
+
+    :param remove_costs:
+        A list such that ``remove_costs[i]`` is the cost to remove
+        ``A.nodes[i]``.
+
+    :param insert_costs:
+        A list such that ``insert_costs[j]`` is the cost to insert
+        ``B.nodes[j]``.
+
+    :param update_costs:
+        A list of lists such that ``update_costs[i][j]`` is the cost to change
+        ``A.nodes[i]`` into ``B.nodes[j]``.
+
+    :param upper_bound:
+        If set, stop as soon as the distance is known to be at least
+        ``upper_bound``. The costs must be non-negative.
+
+    :return: An integer distance [0, inf+). If ``upper_bound`` is set and the
+        distance is at least ``upper_bound``, a lower bound of the distance
+        which is at least ``upper_bound`` may be returned instead.
+    '''
+    Al = A.lmds
+    Bl = B.lmds
+    nb = len(Bl)
+    # treedists[i*nb+j] is the distance between the subtrees rooted at i and
+    # j, and fd[x*width+y] the distance between the forests of the current
+    # keyroot pair; both matrices are allocated once for all keyroot pairs
+    treedists = [0] * (len(Al) * nb)
+    width = nb + 1
+    fd = [0] * ((len(Al) + 1) * width)
 
     for i in A.keyroots:
+        ioff = Al[i] - 1
+        m = i - Al[i] + 2
         for j in B.keyroots:
-            treedist(i,j)
-
-    return treedists[-1][-1]
+            joff = Bl[j] - 1
+            n = j - Bl[j] + 2
+            # the distance of the two roots is computed last
+            bounded = upper_bound is not None and \
+                i == len(Al) - 1 and j == nb - 1
+            if bounded:
+                # The costs being non-negative, the DP values only increase
+                # along a path to the final cell. A path either crosses row x
+                # or jumps over it from an earlier row, hence the distance is
+                # at least the minimum of row x and of the open jumps over it.
+                jumps = _subtree_jumps(A, B, treedists)
+                open_jumps = [(k, min(fd[:n]) + cost) for k, cost in jumps[0]]
+
+            for x in range(1, m): # δ(l(i1)..i, θ) = δ(l(1i)..1-1, θ) + γ(v → λ)
+                fd[x*width] = fd[(x-1)*width] + remove_costs[x+ioff]
+            for y in range(1, n): # δ(θ, l(j1)..j) = δ(θ, l(j1)..j-1) + γ(λ → w)
+                fd[y] = fd[y-1] + insert_costs[y+joff]
+
+            for x in range(1, m):
+                a = x + ioff
+                remove = remove_costs[a]
+                updates = update_costs[a]
+                row = x * width
+                prev_row = row - width
+                tree_row = a * nb
+                # x is an ancestor of i iff they have the same lmd
+                a_on_path = Al[a] == Al[i]
+                p_row = (Al[a] - 1 - ioff) * width
+                for y in range(1, n):
+                    b = y + joff
+                    d = fd[prev_row+y] + remove
+                    d2 = fd[row+y-1] + insert_costs[b]
+                    if d2 < d:
+                        d = d2
+                    if a_on_path and Bl[b] == Bl[j]:
+                        #                   +-
+                        #                   | δ(l(i1)..i-1, l(j1)..j) + γ(v → λ)
+                        # δ(F1 , F2 ) = min-+ δ(l(i1)..i , l(j1)..j-1) + γ(λ → w)
+                        #                   | δ(l(i1)..i-1, l(j1)..j-1) + γ(v → w)
+                        #                   +-
+                        d2 = fd[prev_row+y-1] + updates[b]
+                        if d2 < d:
+                            d = d2
+                        fd[row+y] = d
+                        treedists[tree_row+b] = d
+                    else:
+                        #                   +-
+                        #                   | δ(l(i1)..i-1, l(j1)..j) + γ(v → λ)
+                        # δ(F1 , F2 ) = min-+ δ(l(i1)..i , l(j1)..j-1) + γ(λ → w)
+                        #                   | δ(l(i1)..l(i)-1, l(j1)..l(j)-1)
+                        #                   |                     + treedist(i1,j1)
+                        #                   +-
+                        d2 = fd[p_row+Bl[b]-1-joff] + treedists[tree_row+b]
+                        if d2 < d:
+                            d = d2
+                        fd[row+y] = d
+                if bounded:
+                    row_min = min(fd[row:row+n])
+                    # the jump over the subtree of a lands on row a+1
+                    open_jumps = [(k, bound) for k, bound in open_jumps
+                                  if k >= x]
+                    d = min([row_min] + [bound for _, bound in open_jumps])
+                    if d >= upper_bound:
+                        return d
+                    open_jumps.extend(
+                        (k, row_min + cost) for k, cost in jumps[x])
+
+    return treedists[-1]
+
+
+def _subtree_jumps(A, B, treedists):
+    '''In the forest distance matrix of the two roots, the DP jumps over the
+    subtree of each node a of A, from row lmd(a) to row a+1, adding the
+    distance between the subtree of a and a subtree of B. These distances are
+    known from the previous keyroot pairs (the jumps are not taken when both
+    subtrees are on the leftmost paths).
+
+    :return: A list whose p-th element holds the (a, minimum cost of the
+        jumps over the subtree of a) of the jumps from row p.
+    '''
+    Al = A.lmds
+    Bl = B.lmds
+    nb = len(Bl)
+    jumps = [[] for _ in range(len(Al) + 1)]
+    off_path = [b for b in range(nb) if Bl[b] > 0]
+    for a in range(len(Al)):
+        tree_row = a * nb
+        if Al[a] > 0:
+            cost = min(treedists[tree_row:tree_row+nb])
+        elif off_path:
+            cost = min(treedists[tree_row+b] for b in off_path)
+        else:
+            continue
+        jumps[Al[a]].append((a, cost))
+    return jumps
@@ -6,7 +6,11 @@
 
 from __future__ import absolute_import
 
+import random
+
 from zss import (
+    AnnotatedTree,
+    annotated_distance,
     distance,
     simple_distance,
     Node,
@@ -102,3 +106,114 @@ def test_rich_api():
             A, C, Node.get_children, no_insert_cost, remove_cost,
             small_update_cost)
     )
+
+
+def test_annotated_api():
+    A = (
+      Node("f")
+        .addkid(Node("d")
+          .addkid(Node("a"))
+          .addkid(Node("c")
+            .addkid(Node("b"))
+          )
+        )
+        .addkid(Node("e"))
+    )
+    B = (
+      Node("f")
+        .addkid(Node("c")
+          .addkid(Node("d")
+            .addkid(Node("a"))
+            .addkid(Node("b"))
+          )
+        )
+        .addkid(Node("e"))
+    )
+    AA = AnnotatedTree(A, Node.get_children)
+    AB = AnnotatedTree(B, Node.get_children)
+    # annotated trees can be reused across calls
+    for _ in range(2):
+        assert simple_distance(AA, AB) == simple_distance(A, B) == 2
+
+    remove_costs = [strdist(a.label, '') for a in AA.nodes]
+    insert_costs = [strdist('', b.label) for b in AB.nodes]
+    update_costs = [[strdist(a.label, b.label) for b in AB.nodes]
+                    for a in AA.nodes]
+    assert annotated_distance(
+        AA, AB, remove_costs, insert_costs, update_costs) == 2
+
+
+def random_tree(rand, labels, num_nodes, make_node=Node,
+                add_child=Node.addkid):
+    nodes = [make_node(rand.choice(labels))]
+    for _ in range(num_nodes - 1):
+        node = make_node(rand.choice(labels))
+        add_child(rand.choice(nodes), node)
+        nodes.append(node)
+    return nodes[0]
+
+
+def check_upper_bound(dist, exact, upper_bound):
+    if exact < upper_bound:
+        assert dist == exact
+    else:
+        assert upper_bound <= dist <= exact
+
+
+def test_annotated_distance_upper_bound():
+    rand = random.Random(0)
+    labels = 'abcde'
+    for _ in range(500):
+        A = AnnotatedTree(random_tree(rand, labels, rand.randint(1, 12)),
+                          Node.get_children)
+        B = AnnotatedTree(random_tree(rand, labels, rand.randint(1, 12)),
+                          Node.get_children)
+        label_costs = dict((label, rand.choice([0, 1, 1, 2]))
+                           for label in labels)
+        remove_costs = [label_costs[a.label] for a in A.nodes]
+        insert_costs = [label_costs[b.label] for b in B.nodes]
+        update_costs = [[0 if a.label == b.label else rand.randint(0, 3)
+                         for b in B.nodes] for a in A.nodes]
+        exact = annotated_distance(
+            A, B, remove_costs, insert_costs, update_costs)
+        for upper_bound in range(exact + 3):
+            check_upper_bound(annotated_distance(
+                A, B, remove_costs, insert_costs, update_costs,
+                upper_bound=upper_bound), exact, upper_bound)
+
+
+def test_tree_dist_lower_bounds():
+    from bashlint import nast
+    from eval import tree_dist
+
+    def make_node(label):
+        kind, value = label
+        return nast.Node(kind=kind, value=value)
+
+    # include the labels which are inserted, removed or changed into each
+    # other for free
+    labels = [('utility', 'find'), ('utility', 'grep'), ('flag', '-ls'),
+              ('flag', '-print'), ('flag', '-name'), ('flag', '-regex'),
+              ('flag', '-type'), ('argument', 'a'), ('argument', 'b')]
+    rand = random.Random(0)
+    for _ in range(300):
+        ast1 = random_tree(rand, labels, rand.randint(1, 12), make_node,
+                           nast.Node.add_child)
+        ast2 = random_tree(rand, labels, rand.randint(1, 12), make_node,
+                           nast.Node.add_child)
+        tree1 = tree_dist.AnnotatedAST(ast1)
+        tree2 = tree_dist.AnnotatedAST(ast2)
+        for skip_argument in [False, True]:
+            label_dist = tree_dist.temp_local_dist if skip_argument \
+                else tree_dist.str_local_dist
+            exact = simple_distance(ast1, ast2, nast.Node.get_children,
+                                    nast.Node.get_label, label_dist)
+            assert tree_dist.annotated_dist(
+                tree1, tree2, skip_argument=skip_argument) == exact
+            assert tree_dist.size_lower_bound(tree1, tree2) <= \
+                tree_dist.label_lower_bound(tree1, tree2, skip_argument) <= \
+                exact
+            for upper_bound in range(exact + 3):
+                check_upper_bound(tree_dist.annotated_dist(
+                    tree1, tree2, skip_argument=skip_argument,
+                    upper_bound=upper_bound), exact, upper_bound)
@@ -306,14 +306,16 @@ def remove_quotation(s):
 def with_angle_brackets(s):
     return s.startswith('<') and s.endswith('>')
 
+_ENGLISH_WORD_RE = re.compile('^[a-zA-Z]{1}[a-z]*(-[a-z]+)*$', re.IGNORECASE)
+_ENGLISH_WORD_EXCEPTIONS = frozenset(['i.e', 'i.e.', 'e.g', 'e.g.',
+                                      's.a', 's.a.', 's.t', 's.t.',
+                                      '\'s', '\'t'])
+
 def is_english_word(word):
     """Check if a token is a normal English word."""
-    if word in ['i.e', 'i.e.', 'e.g', 'e.g.',
-                's.a', 's.a.', 's.t', 's.t.']:
-        return True
-    if word in ['\'s', '\'t']:
+    if word in _ENGLISH_WORD_EXCEPTIONS:
         return True
-    return bool(re.match('^[a-zA-Z]{1}[a-z]*(-[a-z]+)*$', word, re.IGNORECASE))
+    return bool(_ENGLISH_WORD_RE.match(word))
 
 def is_stopword(w):
     return w in ENGLISH_STOPWORDS
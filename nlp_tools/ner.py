@@ -7,7 +7,9 @@ from __future__ import division
 from __future__ import print_function
 
 import collections
+import os
 import re
+import sys
 
 from . import constants
 
@@ -17,52 +19,43 @@ def decorate_boundaries(r):
     """
     return constants.include_space(constants.quotation_safe(r))
 
-def annotate(tokens):
-    """
-    Identify named entities in a (tokenized) sentence and replace them with the
-    corresponding categories.
+# Words that look like files or patterns but are ordinary abbreviations
+ABBREVIATIONS = frozenset(['i.e', 'i.e.', 'e.g', 'e.g.',
+                           's.a', 's.a.', 's.t', 's.t.'])
 
-    The NER so far recognizes the following named entity categories:
-    - Pattern-based:
-        - File
-        - Directory
-        - Path
-        - Permission
-        - Username
-        - Groupname
-        - DateTime
-        - Other Patterns
-    - Quantity-based:
-        - Number
-        - Size
-        - Timespan
+_NER_PATTERNS = None
+_WORD_SPLIT_RE = re.compile(constants._WORD_SPLIT_RESPECT_QUOTES)
 
-    :return: 1. a list of tokens where the named entities are replaced with
-        category names
-             2. a dictionary that stores a list of named entities matched for
-        each category
+
+def get_ner_patterns():
+    """
+    List of (compiled pattern, category, trigger characters) triples in the
+    order in which they are applied by annotate, compiled on first use.
+    A pattern with trigger characters can only match sentences containing
+    at least one of them.
     """
+    global _NER_PATTERNS
+    if _NER_PATTERNS is None:
+        _NER_PATTERNS = [(re.compile(pattern), category, triggers)
+                         for pattern, category, triggers in ner_pattern_strings()]
+    return _NER_PATTERNS
 
-    sentence = ' '.join(tokens)
-    ner_by_token_id = collections.defaultdict()
-    ner_by_char_pos = collections.defaultdict()
-    ner_by_category = collections.defaultdict(list)
-    entities = (ner_by_char_pos, ner_by_category)
+
+def ner_pattern_strings():
+    patterns = []
 
     # -- Size
-    _SIZE_RE = re.compile(decorate_boundaries(
+    patterns.append((decorate_boundaries(
         constants.polarity_safe(r'({}|a\s)\s*'.format(constants._DIGIT_RE)) +
-        constants._SIZE_UNIT))
-    sentence = annotate_ner(_SIZE_RE, constants._SIZE, sentence, entities)
+        constants._SIZE_UNIT), constants._SIZE, None))
 
     # -- Timespan
     time_num_re = r'((24\*|60\*)?{}|{}(\*24|\*60))'.format(
         constants._DIGIT_RE, constants._DIGIT_RE)
-    _DURATION_RE = re.compile(decorate_boundaries(constants.polarity_safe(
+    patterns.append((decorate_boundaries(constants.polarity_safe(
         r'({}|a\s|this\s|next(\s{})?\s|last(\s{})?\s|previous(\s{})?\s)\s*'.format(
-        time_num_re, time_num_re, time_num_re, time_num_re) + constants._DURATION_UNIT)))
-    sentence = annotate_ner(
-        _DURATION_RE, constants._TIMESPAN, sentence, entities)
+        time_num_re, time_num_re, time_num_re, time_num_re) +
+        constants._DURATION_UNIT)), constants._TIMESPAN, None))
 
     # -- DateTime
     # Credit: time expressions adapted from
@@ -72,60 +65,99 @@ def annotate(tokens):
     textual_datetime = constants._MONTH_RE \
                        + r'(\s\d{0,2}(st|nd|th)?)?([,|\s]\d{2,4})?([,|\s]' \
                        + standard_time + r')?'
-    _DATETIME_RE = re.compile(decorate_boundaries(constants.polarity_safe(
+    patterns.append((decorate_boundaries(constants.polarity_safe(
                     '(' + constants._REL_DAY_RE + '|' + standard_time + '|' +
-                    standard_datetime + '|' + textual_datetime + ')')))
-    sentence = annotate_ner(_DATETIME_RE, constants._DATETIME, sentence, entities)
-    
+                    standard_datetime + '|' + textual_datetime + ')')),
+                    constants._DATETIME, None))
+
     # -- Permission
     permission_bit = r'(suid|sgid|sticky|sticki)(\sbit)?'
     permission_bit_set = r'(set)?(uid|gid|sticky|sticki)(=\d+)*'
-    _PERMISSION_RE = re.compile(decorate_boundaries(constants.polarity_safe(
+    patterns.append((decorate_boundaries(constants.polarity_safe(
                     '(' + constants._PATTERN_PERMISSION_RE + '|' +
-                    permission_bit + '|' + permission_bit_set + ')')))
-    sentence = annotate_ner(
-        _PERMISSION_RE, constants._PERMISSION, sentence, entities)
+                    permission_bit + '|' + permission_bit_set + ')')),
+                    constants._PERMISSION, None))
 
     # -- Number
-    _NUMBER_RE = re.compile(decorate_boundaries(
-        constants.polarity_safe(constants._DIGIT_RE)))
-    sentence = annotate_ner(_NUMBER_RE, constants._NUMBER, sentence, entities)
+    patterns.append((decorate_boundaries(
+        constants.polarity_safe(constants._DIGIT_RE)), constants._NUMBER, None))
 
     # -- Match all quoted patterns first to prevent partial matching within quotations
     # -- Directory
-    _DIRECTORY_RE = re.compile(constants.include_quotations(r'[^"\']*\/'))
-    sentence = annotate_ner(
-        _DIRECTORY_RE, constants._DIRECTORY, sentence, entities)
+    patterns.append((constants.include_quotations(r'[^"\']*\/'),
+                     constants._DIRECTORY, '"\''))
 
     # -- File
-    _FILE_RE = re.compile(constants.include_quotations(r'([^"\']*\.[^ "\']+)|' +
-        r'(([^"\']*\/)+[^"\']*)|' + constants._FILE_EXTENSION_RE))
-    sentence = annotate_ner(_FILE_RE, constants._FILE, sentence, entities)
-    
+    patterns.append((constants.include_quotations(r'([^"\']*\.[^ "\']+)|' +
+        r'(([^"\']*\/)+[^"\']*)|' + constants._FILE_EXTENSION_RE),
+        constants._FILE, '"\''))
+
     # -- Other patterns
-    _REGEX_QUOTED_RE = re.compile(constants.include_space(constants._QUOTED_RE))
-    sentence = annotate_ner(_REGEX_QUOTED_RE, constants._REGEX, sentence, entities)
-    
+    patterns.append((constants.include_space(constants._QUOTED_RE),
+                     constants._REGEX, '"\''))
+
     # -- Match all unquoted patterns
     # -- Directory
-    _DIRECTORY_RE = re.compile(decorate_boundaries(r'[^ "\']*\/'))
-    sentence = annotate_ner(
-        _DIRECTORY_RE, constants._DIRECTORY, sentence, entities)
-    
+    patterns.append((decorate_boundaries(r'[^ "\']*\/'), constants._DIRECTORY,
+                     '/'))
+
     # -- File
-    _FILE_RE = re.compile(r'([^ ]*\.[^ ]+|' + r'([^ ]*\/)+[^ ]*)|(' +
-        decorate_boundaries(constants._FILE_EXTENSION_RE) + ')')
-    sentence = annotate_ner(_FILE_RE, constants._FILE, sentence, entities)
-    
+    patterns.append((r'([^ ]*\.[^ ]+|' + r'([^ ]*\/)+[^ ]*)|(' +
+        decorate_boundaries(constants._FILE_EXTENSION_RE) + ')',
+        constants._FILE, None))
+
     # -- Other patterns
-    _REGEX_SPECIAL_RE = re.compile(decorate_boundaries(constants._SPECIAL_SYMBOL_RE))
-    sentence = annotate_ner(_REGEX_SPECIAL_RE, constants._REGEX, sentence, entities)
+    patterns.append((decorate_boundaries(constants._SPECIAL_SYMBOL_RE),
+                     constants._REGEX, None))
+
+    return patterns
+
+
+def annotate(tokens):
+    """
+    Identify named entities in a (tokenized) sentence and replace them with the
+    corresponding categories.
+
+    The NER so far recognizes the following named entity categories:
+    - Pattern-based:
+        - File
+        - Directory
+        - Path
+        - Permission
+        - Username
+        - Groupname
+        - DateTime
+        - Other Patterns
+    - Quantity-based:
+        - Number
+        - Size
+        - Timespan
+
+    The categories are matched one after another in the order of
+    get_ner_patterns; the entities recognized by a pattern are masked out
+    before the next pattern is matched.
+
+    :return: 1. a list of tokens where the named entities are replaced with
+        category names
+             2. a dictionary that stores a list of named entities matched for
+        each category
+    """
+
+    sentence = ' '.join(tokens)
+    ner_by_token_id = collections.defaultdict()
+    ner_by_char_pos = collections.defaultdict()
+    ner_by_category = collections.defaultdict(list)
+    entities = (ner_by_char_pos, ner_by_category)
+
+    for pattern, category, triggers in get_ner_patterns():
+        if triggers is not None and not any(c in sentence for c in triggers):
+            continue
+        sentence = annotate_ner(pattern, category, sentence, entities)
 
     # prepare list of tokens
     normalized_words = []
     i = 0
-    for m in re.finditer(
-        re.compile(constants._WORD_SPLIT_RESPECT_QUOTES), sentence):
+    for m in _WORD_SPLIT_RE.finditer(sentence):
         w = m.group(0)
         # exclude isolated quotations
         if w in ['"', '\'']:
@@ -150,9 +182,18 @@ def annotate(tokens):
     return normalized_words, (ner_by_token_id, ner_by_char_pos, ner_by_category)
 
 def annotate_ner(pattern, category, sentence, entities):
+    """
+    Record the entities matched by the pattern and mask them out with '-'.
+
+    The matches of a pattern do not overlap, so the masked sentence is
+    assembled once after all matches are found.
+    """
     ner_by_char_pos, ner_by_category = entities
-    for m in re.finditer(pattern, sentence):
-        surface = sentence[m.start(0):m.end(0)].strip()
+    pieces = []
+    last_end = 0
+    for m in pattern.finditer(sentence):
+        start, end = m.span(0)
+        surface = sentence[start:end].strip()
         if category == constants._DATETIME:
             # TODO: rule-based system is not good at differentiating between
             # "May" the month and "may" the modal verb
@@ -160,20 +201,67 @@ def annotate_ner(pattern, category, sentence, entities):
                 continue
         if category in [constants._FILE, constants._REGEX,
                         constants._DIRECTORY, constants._PATH]:
-            if surface in ['i.e', 'i.e.', 'e.g', 'e.g.',
-                           's.a', 's.a.', 's.t', 's.t.']:
+            if surface in ABBREVIATIONS:
                 continue
         # replace recognized entities with placeholders to ensure that entity
         # position calculation is always correct
-        rep_start = m.start(0) + 1 if re.match(r'\s', sentence[m.start(0)]) \
-            else m.start(0)
-        rep_end = m.end(0) - 1 if re.match(r'\s', sentence[m.end(0)-1]) \
-            else m.end(0)
-        sentence = sentence[:rep_start] + '-' * (rep_end - rep_start) + \
-                   sentence[rep_end:]
+        rep_start = start + 1 if sentence[start].isspace() else start
+        rep_end = end - 1 if sentence[end-1].isspace() else end
+        pieces.append(sentence[last_end:rep_start])
+        pieces.append('-' * (rep_end - rep_start))
+        last_end = rep_end
         ner_by_char_pos[(rep_start, rep_end)] = (surface, category)
         ner_by_category[category].append((surface, rep_start, rep_end))
-    return sentence
+    if not pieces:
+        return sentence
+    pieces.append(sentence[last_end:])
+    return ''.join(pieces)
 
 def normalize_number_in_token(token):
     return re.sub(re.compile(constants._DIGIT_RE), constants._NUMBER, token)
+
+# --- Utility functions --- #
+
+def test_annotate(golden_path):
+    """
+    Check annotate against golden outputs recorded with the original
+    implementation on data/bash/all.nl (data/bash/golden/all.nl.ner.jsonl.xz).
+    Each line of the golden file holds the input tokens, the normalized words
+    and the entities indexed by token id, character position and category.
+    """
+    import json
+    import lzma
+    import time
+
+    with lzma.open(golden_path, 'rt', encoding='utf-8') as f:
+        golden_outputs = [json.loads(line) for line in f]
+
+    start_time = time.time()
+    outputs = [annotate(tokens) for tokens, _, _, _, _ in golden_outputs]
+    annotate_time = time.time() - start_time
+
+    num_errors = 0
+    for golden_output, output in zip(golden_outputs, outputs):
+        tokens = golden_output[0]
+        normalized_words, (ner_by_token_id, ner_by_char_pos,
+                           ner_by_category) = output
+        output = [tokens, normalized_words,
+                  sorted([i, s, c] for i, (s, c) in ner_by_token_id.items()),
+                  sorted([a, b, s, c]
+                         for (a, b), (s, c) in ner_by_char_pos.items()),
+                  {c: [list(e) for e in v]
+                   for c, v in sorted(ner_by_category.items())}]
+        if output != golden_output:
+            num_errors += 1
+            print('Mismatch: {}'.format(' '.join(tokens)))
+            print('    annotate: {}'.format(output[1:]))
+            print('    golden:   {}'.format(golden_output[1:]))
+    print('{} sentences, {} mismatches'.format(len(golden_outputs), num_errors))
+    print('annotate: {:.2f}s'.format(annotate_time))
+    assert(num_errors == 0)
+
+
+if __name__ == '__main__':
+    test_annotate(sys.argv[1] if len(sys.argv) > 1 else
+                  os.path.join(os.path.dirname(__file__), '..', 'data', 'bash',
+                               'golden', 'all.nl.ner.jsonl.xz'))
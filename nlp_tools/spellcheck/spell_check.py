@@ -6,9 +6,11 @@ MIT license: www.opensource.org/licenses/mit-license.php
 
 ################ Spelling Corrector
 
-import os, re, collections
+import os, re, collections, functools, itertools, threading, zlib
 from collections import Counter
 
+import numpy as np
+
 
 current_folder = os.path.dirname(__file__)
 
@@ -38,11 +40,16 @@ def extract_top_frequent_words(input, top_k):
 
 def P(word, N=sum(WORDS.values())):
     "Probability of `word`."
-    return WORDS[word] / (N+0.0)
+    return WORDS.get(word, 0) / (N+0.0)
 
+@functools.lru_cache(maxsize=65536)
 def correction(word):
     "Most probable spelling correction for word."
-    return max(candidates(word), key=P)
+    return max(sorted(indexed_candidates(word)), key=P)
+
+def edits_correction(word):
+    "Most probable spelling correction for word, enumerating all edits."
+    return max(sorted(candidates(word)), key=P)
 
 def candidates(word):
     "Generate possible spelling corrections for word."
@@ -66,6 +73,109 @@ def edits2(word):
     "All edits that are two edits away from `word`."
     return (e2 for e1 in edits1(word) for e2 in edits1(e1))
 
+################ Symmetric delete index
+# Two words are at most two edits apart only if deleting at most two
+# characters from each of them gives a common string. The index maps the
+# (crc32 hashes of the) strings obtained by deleting up to two characters from
+# each dictionary word to the word; the dictionary words found through the
+# deletes of a misspelled word are then checked against edits1/edits2.
+
+MAX_EDIT_DISTANCE = 2
+
+DICTIONARY = list(WORDS)
+_DELETE_INDEX = None
+_DELETE_INDEX_LOCK = threading.Lock()
+
+def deletes(word, max_distance=MAX_EDIT_DISTANCE):
+    "All strings obtained by deleting at most `max_distance` characters from `word`."
+    results = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = set(w[:i] + w[i+1:] for w in frontier for i in range(len(w)))
+        results |= frontier
+    return results
+
+def delete_hashes(strings):
+    return np.array([zlib.crc32(s.encode('utf-8')) for s in strings],
+                    dtype=np.uint32)
+
+def build_delete_index():
+    "Sorted delete hashes (row 0) and the ids of the corresponding dictionary words (row 1)."
+    word_deletes = [deletes(w) for w in DICTIONARY]
+    hashes = delete_hashes(itertools.chain.from_iterable(word_deletes))
+    word_ids = np.repeat(np.arange(len(DICTIONARY), dtype=np.int64),
+                         [len(d) for d in word_deletes])
+    index = np.stack([hashes.astype(np.int64), word_ids])
+    return index[:, np.argsort(index[0], kind='stable')]
+
+def dictionary_digest():
+    "Checksum of the dictionary file (0 if there is none)."
+    path = os.path.join(current_folder, 'most_common.txt')
+    if not os.path.exists(path):
+        return 0
+    with open(path, 'rb') as f:
+        return zlib.crc32(f.read())
+
+def delete_index_path():
+    "The index file is specific to the dictionary contents."
+    return os.path.join(current_folder, 'most_common.{}.{:08x}.deletes.npy'
+                        .format(MAX_EDIT_DISTANCE, dictionary_digest()))
+
+def get_delete_index():
+    "Load (memory-mapped) or build and save the delete index on first use."
+    global _DELETE_INDEX
+    with _DELETE_INDEX_LOCK:
+        if _DELETE_INDEX is None:
+            path = delete_index_path() if DICTIONARY else None
+            if path is not None and os.path.exists(path):
+                _DELETE_INDEX = np.load(path, mmap_mode='r')
+            else:
+                _DELETE_INDEX = build_delete_index()
+                if path is not None:
+                    try:
+                        tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+                        with open(tmp_path, 'wb') as o_f:
+                            np.save(o_f, _DELETE_INDEX)
+                        os.rename(tmp_path, path)
+                    except (IOError, OSError):
+                        pass
+    return _DELETE_INDEX
+
+def inverse_edits1(word, alphabet):
+    "All strings `e` built from `word` and `alphabet` such that `word` is in edits1(e)."
+    letters    = 'abcdefghijklmnopqrstuvwxyz'
+    splits     = [(word[:i], word[i:])    for i in range(len(word) + 1)]
+    deletes    = [L + R[1:]               for L, R in splits if R and R[0] in letters]
+    transposes = [L + R[1] + R[0] + R[2:] for L, R in splits if len(R)>1]
+    replaces   = [L + c + R[1:]           for L, R in splits if R and R[0] in letters
+                                          for c in alphabet]
+    inserts    = [L + c + R               for L, R in splits for c in alphabet]
+    return set(deletes + transposes + replaces + inserts)
+
+def indexed_candidates(word):
+    "Same as candidates(word), looking up the dictionary words through the delete index."
+    if word in WORDS:
+        return {word}
+    index = get_delete_index()
+    hashes = delete_hashes(deletes(word)).astype(np.int64)
+    starts = np.searchsorted(index[0], hashes, side='left')
+    ends = np.searchsorted(index[0], hashes, side='right')
+    word_ids = set()
+    for start, end in zip(starts, ends):
+        if start < end:
+            word_ids.update(index[1, start:end].tolist())
+    if not word_ids:
+        return {word}
+    # keep the words reachable from `word` with the edits of edits1 and edits2
+    e1 = edits1(word)
+    known1 = set(DICTIONARY[i] for i in word_ids if DICTIONARY[i] in e1)
+    if known1:
+        return known1
+    alphabet = set('abcdefghijklmnopqrstuvwxyz') | set(word)
+    known2 = set(DICTIONARY[i] for i in word_ids
+                 if not e1.isdisjoint(inverse_edits1(DICTIONARY[i], alphabet)))
+    return known2 or {word}
+
 ################ Test Code
 
 def unit_tests():
@@ -99,6 +209,14 @@ def unit_tests():
     assert 0.07 < P('the') < 0.08
     return 'unit_tests pass'
 
+def index_tests(words=('speling', 'korrectud', 'bycycle', 'inconvient',
+                        'arrainged', 'peotry', 'peotryy', 'word',
+                        'quintessential')):
+    "Check that the indexed correction agrees with enumerating all edits on `words`."
+    for word in words:
+        assert correction(word) == edits_correction(word), word
+    return 'index_tests pass'
+
 def spelltest(tests, verbose=False):
     "Run correction(wrong) on all (right, wrong) pairs; report results."
     import time
@@ -9,27 +9,55 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-import re, sys
-if sys.version_info > (3, 0):
-    from six.moves import xrange
+import collections, hashlib, os, pickle, re, threading
 
 from . import constants, ner
 from .spellcheck import spell_check as spc
 
 # from nltk.stem.wordnet import WordNetLemmatizer
 # lmtzr = WordNetLemmatizer()
+import nltk
 from nltk.stem import SnowballStemmer
 stemmer = SnowballStemmer("english")
 
 
+# Substitutions applied by clean_sentence after the punctuation fixes
+_CLEAN_SENTENCE_SUBS = [(re.compile(pattern), repl) for pattern, repl in [
+    ('(,\s+)|(,$)', ' '),
+    ('(;\s+)|(;$)', ' '),
+    ('(:\s+)|(:$)', ' '),
+    ('(\.\s+)|(\.$)', ' '),
+
+    # convert abbreviation writings and negations
+    ('\'s', ' \'s'),
+    ('\'re', ' \'re'),
+    ('\'ve', ' \'ve'),
+    ('\'d', ' \'d'),
+    ('\'t', ' \'t'),
+
+    ("^[T|t]o ", ''),
+    ('\$\{HOME\}', '\$HOME'),
+    ('"?normal\/regular"?', 'regular'),
+    ('"?regular\/normal"?', 'regular'),
+    ('"?normal/regualar"?', 'regular'),
+    ('"?file\/directory"?', 'file or directory'),
+    ('"?files\/directories"?', 'files and directories'),
+    ('"?name\/path"?', 'name or path'),
+    ('"?names\/paths"?', 'name or path'),
+    (' pattern\' ', ' pattern ')
+]]
+_PAREN_REMOVE_RE = re.compile('\([^)]*\)')
+_WORD_SPLIT_RE = re.compile(constants._WORD_SPLIT_RESPECT_QUOTES)
+_SPECIAL_SYMBOL_RE = re.compile(constants._SPECIAL_SYMBOL_RE)
+
+
 def clean_sentence(sentence):
     """
     Fix punctuation errors and extract main content of a sentence.
     """
 
     # remove content in parentheses
-    _PAREN_REMOVE = re.compile('\([^)]*\)')
-    sentence = re.sub(_PAREN_REMOVE, '', sentence)
+    sentence = _PAREN_REMOVE_RE.sub('', sentence)
 
     try:
         sentence = sentence.replace("“", '"')\
@@ -50,30 +78,8 @@ def clean_sentence(sentence):
         .replace('` ', '\' ') \
         .replace('server`s', 'server\'s')
 
-    sentence = re.sub('(,\s+)|(,$)', ' ', sentence)
-    sentence = re.sub('(;\s+)|(;$)', ' ', sentence)
-    sentence = re.sub('(:\s+)|(:$)', ' ', sentence)
-    sentence = re.sub('(\.\s+)|(\.$)', ' ', sentence)
-
-    # convert abbreviation writings and negations
-    sentence = re.sub('\'s', ' \'s', sentence)
-    sentence = re.sub('\'re', ' \'re', sentence)
-    sentence = re.sub('\'ve', ' \'ve', sentence)
-    sentence = re.sub('\'d', ' \'d', sentence)
-    sentence = re.sub('\'t', ' \'t', sentence)
-
-    sentence = re.sub("^[T|t]o ", '', sentence)
-    sentence = re.sub('\$\{HOME\}', '\$HOME', sentence)
-    sentence = re.sub('"?normal\/regular"?', 'regular', sentence)
-    sentence = re.sub('"?regular\/normal"?', 'regular', sentence)
-    sentence = re.sub('"?normal/regualar"?', 'regular', sentence)
-    sentence = re.sub(
-        '"?file\/directory"?', 'file or directory', sentence)
-    sentence = re.sub(
-        '"?files\/directories"?', 'files and directories', sentence)
-    sentence = re.sub('"?name\/path"?', 'name or path', sentence)
-    sentence = re.sub('"?names\/paths"?', 'name or path', sentence)
-    sentence = re.sub(' pattern\' ', ' pattern ', sentence)
+    for pattern, repl in _CLEAN_SENTENCE_SUBS:
+        sentence = pattern.sub(repl, sentence)
 
     return sentence
 
@@ -101,59 +107,185 @@ def basic_tokenizer(sentence, to_lower_case=True, lemmatization=True,
 
     :return: list of tokens obtained subjected to the tokenization criteria.
     """
-    sentence = clean_sentence(sentence)
-    words = [x[0] for x in re.findall(
-        constants._WORD_SPLIT_RESPECT_QUOTES, sentence)]
-    
-    normalized_words = []
-    for i in xrange(len(words)):
-        word = words[i].strip()
-
-        if word in ['"', '\'']:
-            continue
-        
-        # normalize to lower cases
-        if to_lower_case:
-            if len(word) > 1 and constants.is_english_word(word) \
-                    and not constants.with_quotation(word):
-                word = word.lower()
-        
-        # spelling correction
-        if correct_spell:
-            if word.isalpha() and word.islower() and len(word) > 2:
-                old_w = word
-                word = spc.correction(word)
-                if word != old_w:
-                    if verbose:
-                        print("spell correction: {} -> {}".format(old_w, word))
-       
-        # remove English stopwords
-        if remove_stop_words:
-            if word.lower() in constants.ENGLISH_STOPWORDS:
-                continue
-      
-        # covert number words into numbers
-        if word in constants.word2num:
-            word = str(constants.word2num[word])
-     
-        # lemmatization
-        if lemmatization and not constants.starts_with_quotation(word) \
-                and not constants.ends_with_quotation(word) \
-                and not re.match(constants._SPECIAL_SYMBOL_RE, word):
-            word = stemmer.stem(word)
-    
-        # remove empty words
-        if not word.strip():
-            continue
-
-        if separate_quotations and constants.with_quotation(word):
-            normalized_words.append(word[0])
-            normalized_words.append(word[1:-1])
-            normalized_words.append(word[-1])
-        else:
-            normalized_words.append(word)
-
-    return normalized_words, None
+    return get_tokenizer().tokenize(
+        sentence, to_lower_case=to_lower_case, lemmatization=lemmatization,
+        remove_stop_words=remove_stop_words, correct_spell=correct_spell,
+        separate_quotations=separate_quotations, verbose=verbose)
+
+
+def normalize_word(word, to_lower_case=True, lemmatization=True,
+                   remove_stop_words=True, correct_spell=True,
+                   separate_quotations=False, verbose=False):
+    """
+    Normalize a word of a sentence split by basic_tokenizer (same options).
+
+    :return: list of 0 to 3 tokens the word is normalized into.
+    """
+    word = word.strip()
+
+    if word in ['"', '\'']:
+        return []
+
+    # normalize to lower cases
+    if to_lower_case:
+        if len(word) > 1 and constants.is_english_word(word) \
+                and not constants.with_quotation(word):
+            word = word.lower()
+
+    # spelling correction
+    if correct_spell:
+        if word.isalpha() and word.islower() and len(word) > 2:
+            old_w = word
+            word = spc.correction(word)
+            if word != old_w:
+                if verbose:
+                    print("spell correction: {} -> {}".format(old_w, word))
+
+    # remove English stopwords
+    if remove_stop_words:
+        if word.lower() in constants.ENGLISH_STOPWORDS:
+            return []
+
+    # covert number words into numbers
+    if word in constants.word2num:
+        word = str(constants.word2num[word])
+
+    # lemmatization
+    if lemmatization and not constants.starts_with_quotation(word) \
+            and not constants.ends_with_quotation(word) \
+            and not _SPECIAL_SYMBOL_RE.match(word):
+        word = stemmer.stem(word)
+
+    # remove empty words
+    if not word.strip():
+        return []
+
+    if separate_quotations and constants.with_quotation(word):
+        return [word[0], word[1:-1], word[-1]]
+    else:
+        return [word]
+
+
+# normalize_word and the data it uses (stop words, word2num, etc.)
+TABLE_SOURCES = [
+    os.path.join(os.path.dirname(__file__), 'tokenizer.py'),
+    os.path.join(os.path.dirname(__file__), 'constants.py'),
+    os.path.join(os.path.dirname(__file__), 'spellcheck', 'spell_check.py')]
+
+
+def table_sources_digest():
+    digest = hashlib.sha1()
+    for path in TABLE_SOURCES:
+        with open(path, 'rb') as f:
+            digest.update(hashlib.sha1(f.read()).digest())
+    return digest.hexdigest()
+
+
+class Tokenizer(object):
+    """
+    basic_tokenizer with two levels of caching:
+        - a word normalization table which maps (word, options) to the tokens
+          returned by normalize_word; it can be saved to and loaded from disk;
+        - an LRU cache of the tokens of recently tokenized sentences.
+    Caching is bypassed in verbose mode.
+    """
+    TABLE_VERSION = 1
+
+    def __init__(self, max_sentence_cache_size=100000):
+        self.word_table = {}
+        self.sentence_cache = collections.OrderedDict()
+        self.max_sentence_cache_size = max_sentence_cache_size
+        self.lock = threading.Lock()
+
+    def tokenize(self, sentence, to_lower_case=True, lemmatization=True,
+                 remove_stop_words=True, correct_spell=True,
+                 separate_quotations=False, verbose=False):
+        """
+        Same as basic_tokenizer.
+        """
+        options = (to_lower_case, lemmatization, remove_stop_words,
+                   correct_spell, separate_quotations)
+        if verbose:
+            words = self.split(sentence)
+            return [token for word in words for token in
+                    normalize_word(word, *options, verbose=True)], None
+
+        key = (sentence, options)
+        with self.lock:
+            if key in self.sentence_cache:
+                self.sentence_cache.move_to_end(key)
+                return list(self.sentence_cache[key]), None
+
+        normalized_words = []
+        for word in self.split(sentence):
+            word_key = (word, options)
+            if not word_key in self.word_table:
+                self.word_table[word_key] = tuple(normalize_word(word, *options))
+            normalized_words.extend(self.word_table[word_key])
+
+        with self.lock:
+            self.sentence_cache[key] = tuple(normalized_words)
+            if len(self.sentence_cache) > self.max_sentence_cache_size:
+                self.sentence_cache.popitem(last=False)
+        return normalized_words, None
+
+    def tokenize_batch(self, sentences, **kwargs):
+        """
+        Tokenize a list of sentences (each distinct sentence is tokenized
+        once).
+
+        :param kwargs: options of basic_tokenizer.
+        :return: list of token lists.
+        """
+        tokens = {}
+        for sentence in sentences:
+            if not sentence in tokens:
+                tokens[sentence] = self.tokenize(sentence, **kwargs)[0]
+        return [list(tokens[sentence]) for sentence in sentences]
+
+    @staticmethod
+    def split(sentence):
+        return [x[0] for x in _WORD_SPLIT_RE.findall(clean_sentence(sentence))]
+
+    def table_signature(self):
+        # the normalizations depend on the code which computes them, the
+        # spelling dictionary and the stemmer
+        return (self.TABLE_VERSION, table_sources_digest(),
+                spc.dictionary_digest(), nltk.__version__)
+
+    def load_table(self, path):
+        """
+        Add the word normalizations saved in a table file. The table is
+        ignored if it was built by different normalization code, with a
+        different spelling dictionary or stemmer, or if it is corrupted.
+        """
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path, 'rb') as f:
+                table = pickle.load(f)
+        except Exception:
+            # corrupted file, rebuilt by the next save_table
+            return
+        if isinstance(table, tuple) and len(table) == 2 \
+                and table[0] == self.table_signature():
+            self.word_table.update(table[1])
+
+    def save_table(self, path):
+        tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+        with open(tmp_path, 'wb') as o_f:
+            pickle.dump((self.table_signature(), dict(self.word_table)), o_f)
+        os.rename(tmp_path, path)
+
+
+_TOKENIZER = Tokenizer()
+
+
+def get_tokenizer():
+    """
+    The Tokenizer used by basic_tokenizer.
+    """
+    return _TOKENIZER
 
 
 def ner_tokenizer(sentence, to_lower_case=True, lemmatization=True,